@@ -0,0 +1,30 @@
+from aiogram.types import Message
+
+from configurations.keyboards import get_admin_keyboard
+from data.content import content_registry
+
+
+async def reload_content_button(message: Message):
+    """Перезагрузка вопросов и данных о героях без перезапуска бота."""
+    try:
+        content = await content_registry.reload()
+    except (ValueError, OSError) as e:
+        text = (
+            f"❌ Новая версия отклонена: {e}\n\n"
+            f"Продолжает работать версия {content_registry.version}."
+        )
+    else:
+        if content is None:
+            text = (
+                "Файл контента не изменился, "
+                f"версия {content_registry.version}."
+            )
+        else:
+            text = (
+                f"✅ Загружена версия {content.version}\n"
+                f"• Вопросов: {len(content.bank)}\n"
+                f"• Героев: {len(content.hero_names)}\n\n"
+                "Начатые викторины доигрываются на прежней версии."
+            )
+
+    await message.answer(text, reply_markup=get_admin_keyboard())
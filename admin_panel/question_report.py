@@ -0,0 +1,74 @@
+from aiogram.types import Message
+
+import storage
+from configurations.keyboards import get_admin_keyboard
+from data.answer_stats import answer_stats
+
+# Вопросы с меньшим числом ответов не попадают в рейтинг сложности
+MIN_ANSWERS = 5
+# Сколько вопросов показывать в отчёте
+REPORT_SIZE = 10
+# Предел длины сообщения Telegram
+MESSAGE_LIMIT = 4096
+
+
+def build_question_report():
+    """Текст отчёта о сложности вопросов и популярности неверных ответов."""
+    rows = []
+    for qid in range(len(answer_stats.bank)):
+        total, correct, distractor, distractor_rate, latency = (
+            answer_stats.question_stats(qid)
+        )
+        if total >= MIN_ANSWERS:
+            rows.append(
+                (correct / total, qid, total, distractor, distractor_rate,
+                 latency)
+            )
+
+    if not rows:
+        return (
+            "📈 Статистика вопросов\n\n"
+            f"Пока нет вопросов хотя бы с {MIN_ANSWERS} ответами."
+        )
+
+    rows.sort()
+    text = (
+        "📈 Статистика вопросов "
+        f"(всего ответов: {sum(answer_stats.choices)})\n\n"
+        f"Самые сложные вопросы (от {MIN_ANSWERS} ответов):\n"
+    )
+    for rate, qid, total, distractor, distractor_rate, latency in (
+        rows[:REPORT_SIZE]
+    ):
+        question = answer_stats.bank[qid]
+        text += (
+            f"\n#{qid} {question.text[:60]}\n"
+            f"• Верно: {rate:.0%} из {total}"
+        )
+        if latency is not None:
+            text += f", ~{latency:.1f} с"
+        if distractor is not None:
+            text += (
+                f"\n• Частый неверный ответ: «{question.options[distractor]}»"
+                f" ({distractor_rate:.0%})"
+            )
+        text += "\n"
+
+    text += "\nТочность по героям:\n"
+    hero_rows = []
+    for hero_id, hero_name in storage.HERO_NAMES.items():
+        total, correct = answer_stats.hero_stats(hero_id)
+        if total:
+            hero_rows.append((correct / total, hero_name, total))
+    hero_rows.sort()
+    for rate, hero_name, total in hero_rows:
+        text += f"• {hero_name}: {rate:.0%} ({total})\n"
+
+    return text[:MESSAGE_LIMIT]
+
+
+async def question_report_button(message: Message):
+    """Отчёт для администратора по ответам на вопросы."""
+    await message.answer(
+        build_question_report(), reply_markup=get_admin_keyboard()
+    )
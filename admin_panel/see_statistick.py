@@ -1,13 +1,72 @@
 from aiogram.types import Message
 from storage import user_chat_ids
+from configurations.delayed_sends import delayed_sends
+from configurations.keyboard_cache import keyboard_cache
 from configurations.keyboards import get_admin_keyboard
+from configurations.live_rooms import live_rooms
+from configurations.send_limiter import send_limiter
+from configurations.user_locks import user_locks
+from configurations.session_store import session_stores
+from data.async_sheets import async_sheets
+from data.content import content_registry
+from data.fsm_storage import fsm_storage
+from data.session_db import session_db
 
 
 async def stat_button(message: Message):
     """Возращение в главное меню."""
 
+    sheets_stats = async_sheets.stats()
+    fsm_stats = fsm_storage.stats()
+    db_stats = session_db.stats()
+    keyboard_stats = keyboard_cache.stats()
+    delayed_stats = delayed_sends.stats()
+    room_stats = live_rooms.stats()
+    limiter_stats = send_limiter.stats()
+    lock_stats = user_locks.stats()
+
+    sessions_text = ""
+    for store in session_stores:
+        stats = store.stats()
+        sessions_text += (
+            f"• {store.name}: {stats['sessions']} "
+            f"({stats['memory_bytes'] / 1024:.1f} КБ)\n"
+        )
+
     await message.answer(
-        f"Число активных пользователей: {len(user_chat_ids)}",
+        f"Число активных пользователей: {len(user_chat_ids)}\n\n"
+        "Активные сессии викторин:\n"
+        f"{sessions_text}"
+        f"• Ответов, ждавших предыдущий: {lock_stats['contended']}\n\n"
+        "Состояния FSM:\n"
+        f"• В кэше: {fsm_stats['cached']}\n"
+        f"• Записей: {fsm_stats['writes']}, "
+        f"пропущено без изменений: {fsm_stats['skipped_writes']}\n"
+        f"• Ожидают записи на диск: {db_stats['pending']}\n\n"
+        "Кэш клавиатур:\n"
+        f"• Клавиатур: {keyboard_stats['keyboards']}\n"
+        f"• Попаданий: {keyboard_stats['hits']}, "
+        f"построено: {keyboard_stats['misses']}\n\n"
+        "Отложенные отправки:\n"
+        f"• Ожидают: {delayed_stats['pending']}\n"
+        f"• Выполнено: {delayed_stats['fired']}, "
+        f"отменено: {delayed_stats['cancelled']}\n\n"
+        "Контент:\n"
+        f"• Версия: {content_registry.version}, "
+        f"в памяти версий: {len(content_registry.versions)}, "
+        f"перезагрузок: {content_registry.reloads}\n\n"
+        "Комнаты классов:\n"
+        f"• Открыто: {room_stats['rooms']}, "
+        f"участников: {room_stats['participants']}\n"
+        f"• Разослано: {limiter_stats['sent']}, "
+        f"повторов: {limiter_stats['retries']}, "
+        f"не доставлено: {limiter_stats['failed']}\n\n"
+        "Запросы к Google Таблицам:\n"
+        f"• В очереди: {sheets_stats['queue_depth']}\n"
+        f"• Выполняется: {sheets_stats['in_flight']}\n"
+        f"• Превышений квоты: {sheets_stats['throttled']}\n"
+        f"• Повторов: {sheets_stats['retries']}\n"
+        f"• Ошибок: {sheets_stats['failed']}",
         reply_markup=get_admin_keyboard(),
         parse_mode="HTML",
     )
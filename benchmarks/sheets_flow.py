@@ -0,0 +1,127 @@
+"""Бенчмарк обращений к Google Таблицам в пользовательских сценариях.
+
+Прогоняет сценарий "открыть викторину -> начать соревнование ->
+завершить -> посмотреть таблицу лидеров" на локальном FakeWorksheet и
+выводит число вызовов API и время на каждый шаг.
+
+Запуск из корня проекта:
+
+    python -m benchmarks.sheets_flow --users 200 --participants 5000
+
+С параметром ``--max-calls`` завершается с кодом 1, если число вызовов
+API на одного пользователя превысило порог - так ловятся регрессии.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+
+from data.async_sheets import AsyncSheetsManager
+from data.fake_sheets import FakeWorksheet
+from data.google_sheets import EXPECTED_HEADERS as HEADERS
+from data.google_sheets import GoogleSheetsManager
+
+
+def make_sheet(participants, latency, quota_errors):
+    """Лист с заголовками и ``participants`` уже сохранёнными результатами."""
+    rows = [HEADERS]
+    for i in range(participants):
+        correct = random.randint(0, 10)
+        rows.append(
+            [i + 1, "2025-10-15 12:00:00", 1_000_000 + i, f"Имя{i}",
+             f"Фамилия{i}", "СШ №16", correct, 10, f"{correct * 10}%",
+             "Хорошо", round(random.uniform(20, 200), 1)]
+        )
+    return FakeWorksheet(rows, latency=latency, quota_errors=quota_errors)
+
+
+async def user_flow(sheets, chat_id, timings):
+    """Сценарий одного пользователя в соревновательном режиме."""
+    steps = (
+        ("quiz_button", sheets.is_competitive_completed, (chat_id,)),
+        ("start_competitive", sheets.is_competitive_completed, (chat_id,)),
+        ("finish_quiz", sheets.save_competitive_result, (
+            {"chat_id": chat_id, "first_name": "Иван",
+             "last_name": "Иванов", "educational_institution": "СШ №16",
+             "correct_answers": random.randint(0, 10),
+             "total_questions": 10, "response_time": 95.0},
+        )),
+        ("leaderboard", sheets.get_leaderboard_records, ()),
+    )
+    for name, func, args in steps:
+        started = time.perf_counter()
+        await func(*args)
+        timings[name] = timings.get(name, 0.0) + time.perf_counter() - started
+
+
+async def run(args):
+    sheet = make_sheet(args.participants, args.latency, args.quota_errors)
+    manager = GoogleSheetsManager()
+    manager.attach(sheet)
+
+    sheets = AsyncSheetsManager(manager)
+    # Квоты Google к локальному листу не относятся
+    sheets.scheduler.bucket.rate = args.rpm / 60
+    sheets.scheduler.bucket.capacity = sheets.scheduler.bucket.tokens = (
+        max(1, args.rpm // 60)
+    )
+    sheets.start()
+
+    # Первичная синхронизация индекса не входит в замер сценария
+    await sheets.get_leaderboard_records()
+    await sheets.is_competitive_completed(0)
+    sheet.reset_counters()
+
+    timings = {}
+    started = time.perf_counter()
+    await asyncio.gather(
+        *(user_flow(sheets, 2_000_000 + i, timings)
+          for i in range(args.users))
+    )
+    wall = time.perf_counter() - started
+    sheets.shutdown()
+
+    calls_per_user = sheet.total_calls / args.users
+    print(f"Пользователей: {args.users}, участников в таблице: "
+          f"{args.participants}, задержка API: {args.latency * 1000:.0f} мс")
+    print(f"Общее время: {wall:.3f} с")
+    print(f"Вызовов API: {sheet.total_calls} "
+          f"({calls_per_user:.2f} на пользователя)")
+    for name, count in sorted(sheet.calls.items()):
+        print(f"  {name}: {count}")
+    print(f"Прочитано ячеек: {sheet.cells_read} "
+          f"({sheet.cells_read / args.users:.1f} на пользователя)")
+    print("Время по шагам (в среднем на пользователя):")
+    for name, total in timings.items():
+        print(f"  {name}: {total / args.users * 1000:.2f} мс")
+    print(f"Планировщик: {sheets.stats()}")
+
+    if args.max_calls is not None and calls_per_user > args.max_calls:
+        print(f"❌ Превышен порог вызовов API на пользователя: "
+              f"{calls_per_user:.2f} > {args.max_calls}")
+        return 1
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=100)
+    parser.add_argument("--participants", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.02,
+                        help="Задержка одного вызова API, с")
+    parser.add_argument("--quota-errors", type=int, default=0,
+                        help="Сколько первых вызовов вернут ошибку 429")
+    parser.add_argument("--rpm", type=int, default=600_000,
+                        help="Лимит запросов в минуту для планировщика")
+    parser.add_argument("--max-calls", type=float, default=None,
+                        help="Допустимое число вызовов API на пользователя")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+import re
+
+# Кратчайший префикс, по которому узнаётся вариант ("орд" -> "Орден ...")
+MIN_PREFIX = 3
+# Предел опечаток: не больше одной на каждые TYPO_STEP символов ответа
+# и не больше MAX_TYPOS всего
+TYPO_STEP = 5
+MAX_TYPOS = 2
+
+_SEPARATORS = re.compile(r"[\W_]+")
+# Метка неоднозначного ключа: подходит сразу нескольким вариантам
+_AMBIGUOUS = -1
+
+
+def _fold(text):
+    return text.casefold().replace("ё", "е")
+
+
+def normalize_answer(text):
+    """Нормализация ответа: регистр, "ё" -> "е", знаки препинания и
+    лишние пробелы убираются ("  Орден  «Ленина»!" -> "орден ленина")."""
+    return _SEPARATORS.sub(" ", _fold(text)).strip()
+
+
+def _add_key(index, key, option):
+    if index.get(key, option) != option:
+        index[key] = _AMBIGUOUS
+    else:
+        index[key] = option
+
+
+def _bounded_distance(first, second, limit):
+    """Расстояние Левенштейна или ``limit + 1``, если оно больше ``limit``.
+
+    Считается построчно, и строка, в которой все значения уже больше
+    предела, сразу прерывает расчёт.
+    """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for row, char in enumerate(first, 1):
+        current = [row]
+        for column, other in enumerate(second, 1):
+            current.append(min(
+                previous[column] + 1,
+                current[column - 1] + 1,
+                previous[column - 1] + (char != other),
+            ))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+class AnswerMatcher:
+    """Сопоставление введённого текста с вариантом ответа.
+
+    Строится один раз на вопрос. Ответ ищется по порядку: точный текст
+    варианта, нормализованный текст, однозначный префикс ("орден лен"),
+    и, если разрешено, вариант с небольшим числом опечаток. Первые три
+    шага - поиск в словаре; опечатки ищутся только среди вариантов
+    близкой длины и только в ответах с буквами, чтобы "1942" не
+    засчитывался как "1941".
+    """
+
+    __slots__ = ("exact", "normalized", "prefixes", "keys")
+
+    def __init__(self, options):
+        self.exact = {option: index for index, option in enumerate(options)}
+        self.keys = tuple(normalize_answer(option) for option in options)
+        self.normalized = {}
+        self.prefixes = {}
+        for index, key in enumerate(self.keys):
+            _add_key(self.normalized, key, index)
+            for end in range(MIN_PREFIX, len(key)):
+                if key[end - 1] != " ":
+                    _add_key(self.prefixes, key[:end], index)
+
+    def match(self, text, typos=True):
+        """Номер варианта по введённому тексту или None."""
+        index = self.exact.get(text)
+        if index is not None:
+            return index
+        # Обычно ответ отличается от варианта только регистром - тогда
+        # хватает поиска без регулярного выражения
+        key = _fold(text)
+        index = self.normalized.get(key)
+        if index is None:
+            key = _SEPARATORS.sub(" ", key).strip()
+            index = self.normalized.get(key)
+        if index is None:
+            index = self.prefixes.get(key)
+        if index is None and typos:
+            index = self._closest(key)
+        if index is None or index == _AMBIGUOUS:
+            return None
+        return index
+
+    def _closest(self, key):
+        limit = min(MAX_TYPOS, len(key) // TYPO_STEP)
+        if not limit or not any(char.isalpha() for char in key):
+            return None
+        found = None
+        best = limit + 1
+        for index, option in enumerate(self.keys):
+            distance = _bounded_distance(key, option, limit)
+            if distance < best:
+                found, best = index, distance
+            elif distance == best and distance <= limit:
+                found = _AMBIGUOUS
+        return found
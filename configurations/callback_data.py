@@ -0,0 +1,34 @@
+from aiogram.filters.callback_data import CallbackData
+
+
+class QuizAnswerCallback(CallbackData, prefix="a"):
+    """Ответ на вопрос викторины кнопкой в сообщении.
+
+    Упаковывается в несколько байт, например ``a:117:2``:
+    q - номер вопроса в банке, o - позиция кнопки (вариант получается
+    через перестановку вариантов в сессии). Сессия определяется
+    по пользователю и сообщению с вопросом, поэтому клавиатура вопроса
+    одинакова для всех и строится один раз.
+    """
+
+    q: int
+    o: int
+
+
+class QuizCancelCallback(CallbackData, prefix="x"):
+    """Досрочное завершение викторины кнопкой в сообщении."""
+
+
+class RoomAnswerCallback(CallbackData, prefix="ra"):
+    """Ответ участника комнаты: r - код комнаты, n - номер вопроса
+    в игре, o - позиция кнопки."""
+
+    r: int
+    n: int
+    o: int
+
+
+class RoomControlCallback(CallbackData, prefix="rc"):
+    """Кнопки ведущего комнаты: next, count, close."""
+
+    action: str
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 
 from aiogram import types
@@ -6,10 +5,19 @@ from aiogram.fsm.context import FSMContext
 from aiogram.types import ReplyKeyboardRemove
 
 import storage
-from configurations.keyboards import create_heroes_keyboard, get_main_keyboard
-from configurations.quiz_manager import HeroQuizManager, HeroQuizStates
-from user_panel.hero_quiz_handler import (create_heroes_quiz_keyboard,
-                                          send_hero_question)
+from configurations.keyboards import (
+    create_heroes_keyboard,
+    create_heroes_quiz_keyboard,
+    get_main_keyboard,
+)
+from configurations.quiz_manager import HeroQuizStates
+from configurations.quiz_preferences import quiz_preferences
+from configurations.quiz_session import MODE_HERO, QuizSession
+from user_panel.quiz_engine import (
+    fill_questions,
+    quiz_sessions,
+    schedule_first_question,
+)
 
 
 logger = logging.getLogger("bot_logger")
@@ -149,43 +157,37 @@ async def handle_hero_quiz_selection(callback: types.CallbackQuery,
 
             hero_name = storage.HERO_NAMES.get(hero_id, f"Герой {hero_id}")
 
-            # Начинаем викторину
-            await state.set_state(HeroQuizStates.in_hero_quiz)
             user_id = callback.from_user.id
 
-            # Создаем экземпляр менеджера викторин
-            quiz_manager = HeroQuizManager()
-
             # Получаем вопросы для героя
-            questions = quiz_manager.get_hero_questions(hero_id)
+            session = QuizSession(
+                MODE_HERO,
+                hero_id=hero_id,
+                transport=quiz_preferences.get_transport(user_id),
+            )
+            fill_questions(user_id, session)
 
-            if not questions:
+            if not session.total_questions:
                 await callback.answer(
                     "❌ Вопросы для этого героя не найдены", show_alert=True
                 )
                 return
 
-            # Сохраняем данные викторины
-            quiz_manager.quiz_data[user_id] = {
-                "current_question": 0,
-                "score": 0,
-                "total_questions": len(questions),
-                "questions": questions,
-                "hero_id": hero_id,
-                "hero_name": hero_name,
-            }
+            # Начинаем викторину
+            await state.set_state(HeroQuizStates.in_hero_quiz)
+            quiz_sessions[user_id] = session
 
             await callback.message.edit_text(
                 f"🎖️ *Викторина: {hero_name}*\n\n"
                 f"Начинается тренировочная викторина!\n"
-                f"• {len(questions)} вопросов\n"
+                f"• {session.total_questions} вопросов\n"
                 f"• Только обучение\n"
                 f"• Удачи! 🍀",
                 parse_mode="Markdown",
             )
 
-            await asyncio.sleep(2)
-            await send_hero_question(callback.message, user_id)
+            # Первый вопрос придёт по таймеру, callback отвечаем сразу
+            schedule_first_question(user_id, session)
             await callback.answer()
 
         except Exception as e:
@@ -0,0 +1,144 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+from data.session_db import session_db
+
+logger = logging.getLogger("bot_logger")
+
+DELAYED_NAMESPACE = "delayed_sends"
+
+
+class DelayedSendScheduler:
+    """Планировщик отложенных отправок.
+
+    Вместо ``asyncio.sleep`` внутри обработчика задача кладётся в кучу
+    таймеров, и обработчик сразу завершается. Все задачи обслуживает одна
+    фоновая корутина ``run``, которая спит до ближайшего срока.
+
+    Задача определяется действием и пользователем: повторное
+    планирование заменяет прежнюю задачу, ``cancel`` отменяет её.
+    Действия регистрируются через ``register`` и вызываются как
+    ``action(bot, user_id, token)``; по токену действие проверяет, что
+    сессия пользователя та же, что при планировании. Задачи сохраняются в
+    SessionDatabase и после перезапуска бота выполняются (просроченные -
+    сразу).
+    """
+
+    def __init__(self, database=session_db):
+        self.database = database
+        self._actions = {}
+        # (срок, номер, ключ); отменённые записи пропускаются при извлечении
+        self._heap = []
+        # ключ -> (номер, срок, токен)
+        self._jobs = {}
+        self._seq = itertools.count()
+        self._wakeup = None
+        self._tasks = set()
+        self.fired = 0
+        self.cancelled = 0
+
+    def register(self, name, action):
+        """Регистрация действия по имени."""
+        self._actions[name] = action
+
+    @staticmethod
+    def _db_key(name, user_id):
+        return f"{name}:{user_id}"
+
+    def schedule(self, name, user_id, delay, token=0):
+        """Выполнение действия ``name`` для пользователя через ``delay`` с."""
+        self._push((name, user_id), time.time() + delay, token)
+
+    def _push(self, key, due, token, persist=True):
+        seq = next(self._seq)
+        self._jobs[key] = (seq, due, token)
+        heapq.heappush(self._heap, (due, seq, key))
+        if persist:
+            self.database.put(DELAYED_NAMESPACE, self._db_key(*key),
+                              f"{due}:{token}")
+        # Будим таймер, если новая задача стала ближайшей
+        if self._wakeup is not None and self._heap[0][1] == seq:
+            self._wakeup.set()
+
+    def cancel(self, name, user_id):
+        """Отмена задачи (например, при отмене викторины)."""
+        if self._jobs.pop((name, user_id), None) is not None:
+            self.database.delete(DELAYED_NAMESPACE,
+                                 self._db_key(name, user_id))
+            self.cancelled += 1
+
+    def _restore(self):
+        """Загрузка задач, сохранённых до перезапуска."""
+        for db_key, value in self.database.items(DELAYED_NAMESPACE):
+            try:
+                name, user_id = db_key.rsplit(":", 1)
+                due, token = value.split(":")
+                self._push((name, int(user_id)), float(due), int(token),
+                           persist=False)
+            except ValueError:
+                self.database.delete(DELAYED_NAMESPACE, db_key)
+        if self._jobs:
+            logger.info(
+                f"Восстановлено отложенных отправок: {len(self._jobs)}"
+            )
+
+    async def run(self, bot):
+        """Фоновый таймер, выполняющий задачи в срок."""
+        self._wakeup = asyncio.Event()
+        self._restore()
+
+        while True:
+            if not self._heap:
+                await self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            due, seq, key = self._heap[0]
+            delay = due - time.time()
+            if delay > 0:
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                except asyncio.TimeoutError:
+                    pass
+                self._wakeup.clear()
+                continue
+
+            heapq.heappop(self._heap)
+            job = self._jobs.get(key)
+            if job is None or job[0] != seq:
+                # Задача отменена или заменена более новой
+                continue
+            del self._jobs[key]
+            self.database.delete(DELAYED_NAMESPACE, self._db_key(*key))
+
+            task = asyncio.create_task(self._fire(bot, key, job[2]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fire(self, bot, key, token):
+        name, user_id = key
+        action = self._actions.get(name)
+        if action is None:
+            logger.warning(f"⚠️ Неизвестное отложенное действие: {name}")
+            return
+        self.fired += 1
+        try:
+            await action(bot, user_id, token)
+        except Exception as e:
+            logger.error(
+                f"❌ Ошибка отложенной отправки {name} ({user_id}): {e}"
+            )
+
+    def stats(self):
+        return {
+            "pending": len(self._jobs),
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+        }
+
+
+# Глобальный экземпляр
+delayed_sends = DelayedSendScheduler()
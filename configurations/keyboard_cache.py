@@ -0,0 +1,80 @@
+from collections import OrderedDict
+
+# Сколько клавиатур вопросов (с учётом перестановки вариантов) держим
+LRU_SIZE = 3000
+
+
+class KeyboardCache:
+    """Кэш готовых клавиатур.
+
+    Клавиатуры не зависят от пользователя, поэтому каждая строится один
+    раз по ключу ``(вид, параметры)`` - номеру вопроса, странице, флагам -
+    и затем переиспользуется во всех ответах бота.
+
+    Постоянные клавиатуры (меню, страницы героев) хранятся без
+    ограничений. Клавиатуры вопросов зависят ещё и от перестановки
+    вариантов (вопросов x 24 перестановки), поэтому для них есть
+    ограниченный LRU-раздел (``get_lru``).
+    """
+
+    def __init__(self, lru_size=LRU_SIZE):
+        self._keyboards = {}
+        self._lru = OrderedDict()
+        self.lru_size = lru_size
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._keyboards) + len(self._lru)
+
+    def get(self, key, builder, *args):
+        """Клавиатура по ключу; при промахе строится ``builder(*args)``."""
+        keyboard = self._keyboards.get(key)
+        if keyboard is None:
+            keyboard = builder(*args)
+            self._keyboards[key] = keyboard
+            self.misses += 1
+        else:
+            self.hits += 1
+        return keyboard
+
+    def get_lru(self, key, builder, *args):
+        """То же, что ``get``, но с вытеснением давно не использованных."""
+        keyboard = self._lru.get(key)
+        if keyboard is None:
+            keyboard = builder(*args)
+            self._lru[key] = keyboard
+            if len(self._lru) > self.lru_size:
+                self._lru.popitem(last=False)
+            self.misses += 1
+        else:
+            self._lru.move_to_end(key)
+            self.hits += 1
+        return keyboard
+
+    def update(self, keyboards):
+        """Добавление заранее построенных постоянных клавиатур."""
+        self._keyboards.update(keyboards)
+
+    def evict(self, predicate):
+        """Удаление постоянных клавиатур, ключи которых подходят под
+        ``predicate`` (например, устаревшей версии контента)."""
+        stale = [key for key in self._keyboards if predicate(key)]
+        for key in stale:
+            del self._keyboards[key]
+        return len(stale)
+
+    def clear(self):
+        self._keyboards.clear()
+        self._lru.clear()
+
+    def stats(self):
+        return {
+            "keyboards": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Глобальный экземпляр
+keyboard_cache = KeyboardCache()
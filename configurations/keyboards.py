@@ -6,12 +6,34 @@ from aiogram.types import (
 )
 
 import storage
+from configurations.callback_data import (
+    QuizAnswerCallback,
+    QuizCancelCallback,
+    RoomAnswerCallback,
+    RoomControlCallback,
+)
+from configurations.keyboard_cache import keyboard_cache
+from configurations.quiz_preferences import (
+    TRANSPORT_TITLES,
+    transport_button_text,
+)
+from configurations.quiz_session import TRANSPORT_REPLY
+from data.content import content_registry
+
+HEROES_PER_PAGE = 5
 
 
 def get_admin_keyboard():
+    return keyboard_cache.get(("admin",), _build_admin_keyboard)
+
+
+def _build_admin_keyboard():
     return ReplyKeyboardMarkup(
         keyboard=[
             [KeyboardButton(text="⚙️ Просмотреть статистику")],
+            [KeyboardButton(text="📈 Статистика вопросов")],
+            [KeyboardButton(text="🏫 Открыть комнату")],
+            [KeyboardButton(text="🔄 Обновить вопросы")],
             [KeyboardButton(text="Начать рассылку")],
         ],
         resize_keyboard=True,
@@ -20,6 +42,10 @@ def get_admin_keyboard():
 
 def get_main_keyboard():
     """Основная клавиатура главного меню."""
+    return keyboard_cache.get(("main",), _build_main_keyboard)
+
+
+def _build_main_keyboard():
     return ReplyKeyboardMarkup(
         keyboard=[
             [
@@ -36,8 +62,19 @@ def get_main_keyboard():
     )
 
 
-def get_quiz_mode_keyboard(can_play_competitive=True):
+def get_quiz_mode_keyboard(can_play_competitive=True,
+                           transport=TRANSPORT_REPLY):
     """Клавиатура для выбора режима викторины."""
+    can_play_competitive = bool(can_play_competitive)
+    return keyboard_cache.get(
+        ("mode", can_play_competitive, transport),
+        _build_quiz_mode_keyboard,
+        can_play_competitive,
+        transport,
+    )
+
+
+def _build_quiz_mode_keyboard(can_play_competitive, transport):
     competitive_button = (
         [KeyboardButton(text="🏆 Соревновательный режим")]
         if can_play_competitive
@@ -48,6 +85,7 @@ def get_quiz_mode_keyboard(can_play_competitive=True):
         [KeyboardButton(text="🎖️ Викторины по героям")],
         competitive_button,
         [KeyboardButton(text="🎯 Пробный режим")],
+        [KeyboardButton(text=transport_button_text(transport))],
         [KeyboardButton(text="⏹️ Назад в меню")],
     ]
 
@@ -57,16 +95,31 @@ def get_quiz_mode_keyboard(can_play_competitive=True):
 
 def get_cancel_keyboard():
     """Клавиатура с кнопкой отмены."""
+    return keyboard_cache.get(("cancel",), _build_cancel_keyboard)
+
+
+def _build_cancel_keyboard():
     return ReplyKeyboardMarkup(
         keyboard=[[KeyboardButton(text="⏹️ Назад в меню")]], resize_keyboard=True
     )
 
 
-def get_quiz_question_keyboard(options):
+def get_quiz_question_keyboard(question, shuffle=0):
     """
-    Создает клавиатуру для вопросов викторины.
+    Клавиатура для вопроса викторины с вариантами в порядке перестановки
+    ``shuffle`` (строится один раз на вопрос и перестановку).
     Варианты ответов распределяются по 4 строкам, 5-я строка - отмена.
     """
+    # Ключ - сам объект вопроса: у каждой версии контента свои объекты,
+    # поэтому исправленный вопрос не получит клавиатуру прежней версии
+    return keyboard_cache.get_lru(
+        ("question", question, shuffle),
+        _build_quiz_question_keyboard,
+        question.display_options(shuffle),
+    )
+
+
+def _build_quiz_question_keyboard(options):
     keyboard = []
 
     # Распределяем варианты ответов по 4 строкам
@@ -99,19 +152,148 @@ def get_quiz_question_keyboard(options):
     return ReplyKeyboardMarkup(keyboard=keyboard, resize_keyboard=True)
 
 
+def get_quiz_cancel_keyboard():
+    """Клавиатура с кнопкой завершения викторины (опросы-викторины)."""
+    return keyboard_cache.get(("quiz_cancel",), _build_quiz_cancel_keyboard)
+
+
+def _build_quiz_cancel_keyboard():
+    return ReplyKeyboardMarkup(
+        keyboard=[[KeyboardButton(text="⏹️ Завершить викторину")]],
+        resize_keyboard=True,
+    )
+
+
+def get_inline_question_keyboard(question, shuffle=0):
+    """
+    Клавиатура вопроса с кнопками в сообщении.
+    В callback_data передаются только номер вопроса и позиция кнопки,
+    поэтому клавиатура зависит только от вопроса и перестановки.
+    """
+    return keyboard_cache.get_lru(
+        ("inline", question, shuffle),
+        _build_inline_question_keyboard,
+        question,
+        shuffle,
+    )
+
+
+def _build_inline_question_keyboard(question, shuffle):
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                text=option,
+                callback_data=QuizAnswerCallback(
+                    q=question.qid, o=position
+                ).pack(),
+            )
+        ]
+        for position, option in enumerate(question.display_options(shuffle))
+    ]
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                text="⏹️ Завершить викторину",
+                callback_data=QuizCancelCallback().pack(),
+            )
+        ]
+    )
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+def get_room_question_keyboard(room, question):
+    """
+    Клавиатура текущего вопроса комнаты. Одна на всех участников:
+    строится один раз и отправляется каждому. В ключе - сам вопрос и
+    перестановка: код комнаты может достаться новой комнате.
+    """
+    return keyboard_cache.get_lru(
+        ("room", room.code, room.number, question, room.current_shuffle),
+        _build_room_question_keyboard,
+        room.code,
+        room.number,
+        question,
+        room.current_shuffle,
+    )
+
+
+def _build_room_question_keyboard(code, number, question, shuffle):
+    return InlineKeyboardMarkup(
+        inline_keyboard=[
+            [
+                InlineKeyboardButton(
+                    text=option,
+                    callback_data=RoomAnswerCallback(
+                        r=code, n=number, o=position
+                    ).pack(),
+                )
+            ]
+            for position, option in enumerate(
+                question.display_options(shuffle)
+            )
+        ]
+    )
+
+
+def get_room_host_keyboard(started=False):
+    """Кнопки ведущего комнаты."""
+    return keyboard_cache.get(
+        ("room_host", started), _build_room_host_keyboard, started
+    )
+
+
+def _build_room_host_keyboard(started):
+    keyboard = [
+        [
+            InlineKeyboardButton(
+                text="▶️ Следующий вопрос" if started else "▶️ Начать игру",
+                callback_data=RoomControlCallback(action="next").pack(),
+            )
+        ]
+    ]
+    if started:
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text="📊 Сколько ответили",
+                    callback_data=RoomControlCallback(action="count").pack(),
+                )
+            ]
+        )
+    keyboard.append(
+        [
+            InlineKeyboardButton(
+                text="⏹️ Закрыть комнату",
+                callback_data=RoomControlCallback(action="close").pack(),
+            )
+        ]
+    )
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+def _clamp_page(page, total_items):
+    """Защита от выхода номера страницы за границы."""
+    total_pages = (total_items + HEROES_PER_PAGE - 1) // HEROES_PER_PAGE
+    return max(0, min(page, total_pages - 1))
+
+
 # Клавиатуры для героев
-def create_heroes_keyboard(page: int = 0):
+def create_heroes_keyboard(page: int = 0, content=None):
     """Создание клавиатуры героев с пагинацией"""
-    heroes_per_page = 5
-    total_heroes = len(storage.HERO_URLS)
+    content = content or storage.content
+    page = _clamp_page(page, len(content.hero_urls))
+    return keyboard_cache.get(
+        ("heroes", content.version, page),
+        _build_heroes_keyboard,
+        content,
+        page,
+    )
 
-    # Защита от выхода за границы массива
-    if page < 0:
-        page = 0
 
+def _build_heroes_keyboard(content, page):
+    heroes_per_page = HEROES_PER_PAGE
+    total_heroes = len(content.hero_urls)
     total_pages = (total_heroes + heroes_per_page - 1) // heroes_per_page
-    if page >= total_pages:
-        page = total_pages - 1
 
     start_index = page * heroes_per_page
     end_index = min(start_index + heroes_per_page, total_heroes)
@@ -121,9 +303,9 @@ def create_heroes_keyboard(page: int = 0):
     # Добавляем кнопки героев для текущей страницы с именами из HERO_NAMES
     for i in range(start_index, end_index):
         hero_id = i + 1
-        hero_name = storage.HERO_NAMES.get(hero_id, f"Герой №{hero_id}")
+        hero_name = content.hero_names.get(hero_id, f"Герой №{hero_id}")
         keyboard.append(
-            [InlineKeyboardButton(text=hero_name, url=storage.HERO_URLS[i])]
+            [InlineKeyboardButton(text=hero_name, url=content.hero_urls[i])]
         )
 
     # Добавляем кнопки навигации
@@ -162,6 +344,132 @@ def create_heroes_keyboard(page: int = 0):
     return InlineKeyboardMarkup(inline_keyboard=keyboard)
 
 
-# Оригинальная клавиатура для первой страницы
-# (сохранено для обратной совместимости)
-heroes_keyboard = create_heroes_keyboard(0)
+def create_heroes_quiz_keyboard(page: int = 0, content=None):
+    """Создание клавиатуры для выбора викторины по героям с пагинацией"""
+    content = content or storage.content
+    page = _clamp_page(page, len(content.hero_names))
+    return keyboard_cache.get(
+        ("hero_quiz", content.version, page),
+        _build_heroes_quiz_keyboard,
+        content,
+        page,
+    )
+
+
+def _build_heroes_quiz_keyboard(content, page):
+    total_heroes = len(content.hero_names)
+    heroes_per_page = HEROES_PER_PAGE
+    total_pages = (total_heroes + heroes_per_page - 1) // heroes_per_page
+
+    keyboard = []
+
+    # Добавляем кнопки героев для текущей страницы
+    start_hero = page * heroes_per_page + 1
+    end_hero = min((page + 1) * heroes_per_page, total_heroes)
+
+    for hero_id in range(start_hero, end_hero + 1):
+        hero_name = content.hero_names.get(hero_id, f"Герой {hero_id}")
+        keyboard.append(
+            [
+                InlineKeyboardButton(
+                    text=f"🎯 {hero_name}", callback_data=f"hero_quiz_{hero_id}"
+                )
+            ]
+        )
+
+    # Добавляем кнопки навигации
+    navigation_buttons = []
+
+    if page > 0:
+        navigation_buttons.append(
+            InlineKeyboardButton(
+                text="⬅️ Назад", callback_data=f"hero_quiz_page_{page - 1}"
+            )
+        )
+
+    # Показываем номер текущей страницы
+    if total_pages > 1:
+        navigation_buttons.append(
+            InlineKeyboardButton(
+                text=f"{page + 1}/{total_pages}",
+                callback_data="hero_quiz_current_page"
+            )
+        )
+
+    if page < total_pages - 1:
+        navigation_buttons.append(
+            InlineKeyboardButton(
+                text="Далее ➡️", callback_data=f"hero_quiz_page_{page + 1}"
+            )
+        )
+
+    if navigation_buttons:
+        keyboard.append(navigation_buttons)
+
+    # Кнопка возврата
+    keyboard.append(
+        [InlineKeyboardButton(text="⏹️ Назад в меню",
+                              callback_data="hero_quiz_back")]
+    )
+
+    return InlineKeyboardMarkup(inline_keyboard=keyboard)
+
+
+def prebuild_keyboards():
+    """
+    Построение клавиатур заранее (при запуске бота): меню и все страницы
+    списков героев. Клавиатуры вопросов зависят от перестановки
+    вариантов, поэтому строятся при первом показе и хранятся в LRU.
+    Возвращает число клавиатур в кэше.
+    """
+    get_admin_keyboard()
+    get_main_keyboard()
+    get_cancel_keyboard()
+    get_quiz_cancel_keyboard()
+    get_room_host_keyboard(False)
+    get_room_host_keyboard(True)
+    for can_play_competitive in (True, False):
+        for transport in TRANSPORT_TITLES:
+            get_quiz_mode_keyboard(can_play_competitive, transport)
+
+    keyboard_cache.update(build_hero_keyboards(storage.content))
+    return len(keyboard_cache)
+
+
+def build_hero_keyboards(content):
+    """
+    Все страницы списков героев версии контента: {ключ кэша: клавиатура}.
+    Кэш не затрагивается, поэтому функцию можно вызывать из потока
+    перезагрузки контента.
+    """
+    keyboards = {}
+    pages = (len(content.hero_names) + HEROES_PER_PAGE - 1) // HEROES_PER_PAGE
+    for page in range(pages):
+        keyboards[("heroes", content.version, page)] = (
+            _build_heroes_keyboard(content, page)
+        )
+        keyboards[("hero_quiz", content.version, page)] = (
+            _build_heroes_quiz_keyboard(content, page)
+        )
+    return keyboards
+
+
+def _prepare_hero_keyboards(content):
+    """
+    Построение страниц героев новой версии в потоке перезагрузки; в кэш
+    они кладутся уже в цикле событий, при подмене версии.
+    """
+    keyboards = build_hero_keyboards(content)
+    return lambda: keyboard_cache.update(keyboards)
+
+
+def _drop_stale_hero_keyboards(content):
+    """Удаление страниц героев прежних версий после подмены контента."""
+    keyboard_cache.evict(
+        lambda key: key[0] in ("heroes", "hero_quiz")
+        and key[1] != content.version
+    )
+
+
+content_registry.add_preparer(_prepare_hero_keyboards)
+content_registry.subscribe(_drop_stale_hero_keyboards)
@@ -0,0 +1,202 @@
+import heapq
+import random
+from array import array
+
+from configurations.question_bank import PERMUTATION_COUNT
+from configurations.question_sources import RandomSource
+from data.content import content_registry
+
+# Вопросов в одной игре класса
+ROOM_QUESTIONS = 10
+# Предел участников комнаты
+MAX_PARTICIPANTS = 500
+# Код комнаты - шестизначное число
+CODE_MIN, CODE_MAX = 100_000, 999_999
+
+# Результаты записи ответа
+ANSWER_ACCEPTED = 0
+ANSWER_REPEATED = 1
+ANSWER_CLOSED = 2
+
+
+class LiveRoom:
+    """Комната для одновременной викторины целого класса.
+
+    Ведущий открывает комнату, ученики входят по коду, каждый вопрос
+    рассылается всем участникам сразу, у всех одинаковый порядок
+    вариантов. ``number`` - номер текущего вопроса (-1 до начала),
+    ``version`` - версия контента, из которой берутся вопросы.
+
+    Ответы считаются без блокировок: ``record`` не содержит ``await``,
+    поэтому в цикле событий выполняется целиком, и одновременные ответы
+    сотен участников не мешают друг другу.
+    """
+
+    __slots__ = ("code", "host_id", "question_ids", "shuffles", "number",
+                 "participants", "scores", "answered", "counts", "sending",
+                 "version")
+
+    def __init__(self, code, host_id, question_ids):
+        self.code = code
+        self.host_id = host_id
+        self.question_ids = array("H", question_ids)
+        # Один порядок вариантов для всех участников
+        self.shuffles = array(
+            "B", (random.randrange(PERMUTATION_COUNT) for _ in question_ids)
+        )
+        self.number = -1
+        self.participants = {}  # user_id -> имя
+        self.scores = {}  # user_id -> верных ответов
+        self.answered = set()  # ответившие на текущий вопрос
+        # Выборы вариантов текущего вопроса (по числу его вариантов)
+        self.counts = array("I")
+        self.sending = False
+        self.version = content_registry.version
+
+    @property
+    def total_questions(self):
+        return len(self.question_ids)
+
+    @property
+    def current_question_id(self):
+        if 0 <= self.number < len(self.question_ids):
+            return self.question_ids[self.number]
+        return None
+
+    @property
+    def current_shuffle(self):
+        return self.shuffles[self.number]
+
+    @property
+    def current_question(self):
+        qid = self.current_question_id
+        if qid is None:
+            return None
+        return content_registry.bank(self.version)[qid]
+
+    def join(self, user_id, name):
+        """Вход участника; False, если комната заполнена."""
+        if user_id not in self.participants:
+            if len(self.participants) >= MAX_PARTICIPANTS:
+                return False
+            self.scores[user_id] = 0
+        self.participants[user_id] = name
+        return True
+
+    def leave(self, user_id):
+        self.participants.pop(user_id, None)
+        self.scores.pop(user_id, None)
+        self.answered.discard(user_id)
+
+    def open_next(self):
+        """Переход к следующему вопросу; False, если вопросы закончились."""
+        self.number += 1
+        self.answered.clear()
+        question = self.current_question
+        if question is None:
+            self.counts = array("I")
+            return False
+        self.counts = array("I", [0]) * len(question.options)
+        return True
+
+    def record(self, question, user_id, number, position):
+        """Учёт ответа участника на вопрос ``number``."""
+        if number != self.number or user_id not in self.participants:
+            return ANSWER_CLOSED
+        if user_id in self.answered:
+            return ANSWER_REPEATED
+        option = question.option_at(self.current_shuffle, position)
+        self.answered.add(user_id)
+        self.counts[option] += 1
+        if option == question.correct:
+            self.scores[user_id] += 1
+        return ANSWER_ACCEPTED
+
+    def leaders(self, count=5):
+        """Лучшие участники: [(очки, user_id)]."""
+        return heapq.nlargest(
+            count, ((score, user_id) for user_id, score in self.scores.items())
+        )
+
+    def places(self):
+        """Место каждого участника (одинаковые очки - одно место)."""
+        places = {}
+        place = 0
+        previous = None
+        ordered = sorted(self.scores.items(), key=lambda item: -item[1])
+        for index, (user_id, score) in enumerate(ordered, 1):
+            if score != previous:
+                place, previous = index, score
+            places[user_id] = place
+        return places
+
+
+class LiveRoomManager:
+    """Открытые комнаты: по коду, по ведущему и по участнику."""
+
+    def __init__(self, source=None):
+        self.source = source or RandomSource()
+        self.rooms = {}
+        self.by_host = {}
+        self.by_user = {}
+
+    def open(self, host_id, count=ROOM_QUESTIONS):
+        """Новая комната ведущего (прежняя закрывается)."""
+        previous = self.by_host.get(host_id)
+        if previous is not None:
+            self.close(previous)
+        code = random.randint(CODE_MIN, CODE_MAX)
+        while code in self.rooms:
+            code = random.randint(CODE_MIN, CODE_MAX)
+        room = LiveRoom(code, host_id, self.source.pick(host_id, count))
+        self.rooms[code] = room
+        self.by_host[host_id] = code
+        return room
+
+    def get(self, code):
+        return self.rooms.get(code)
+
+    def hosted_by(self, host_id):
+        code = self.by_host.get(host_id)
+        return self.rooms.get(code) if code is not None else None
+
+    def join(self, code, user_id, name):
+        """Вход в комнату по коду; комната или None."""
+        room = self.rooms.get(code)
+        if room is None:
+            return None
+        current = self.by_user.get(user_id)
+        if current is not None and current != code:
+            self.leave(user_id)
+        if not room.join(user_id, name):
+            return None
+        self.by_user[user_id] = code
+        return room
+
+    def leave(self, user_id):
+        """Выход участника; комната, из которой он вышел, или None."""
+        code = self.by_user.pop(user_id, None)
+        room = self.rooms.get(code) if code is not None else None
+        if room is not None:
+            room.leave(user_id)
+        return room
+
+    def close(self, code):
+        room = self.rooms.pop(code, None)
+        if room is None:
+            return None
+        self.by_host.pop(room.host_id, None)
+        for user_id in room.participants:
+            if self.by_user.get(user_id) == code:
+                del self.by_user[user_id]
+        return room
+
+    def stats(self):
+        return {
+            "rooms": len(self.rooms),
+            "participants": len(self.by_user),
+        }
+
+
+# Глобальный экземпляр
+live_rooms = LiveRoomManager()
@@ -0,0 +1,179 @@
+import random
+from array import array
+from collections import OrderedDict
+
+from data.answer_stats import KEY_SIZE, question_key
+from data.content import content_registry
+from data.session_db import session_db
+
+# Состояния с отпечатками вопросов (в прежнем "mastery" - только по
+# номерам вопросов, их нельзя отнести к вопросам другой версии контента)
+MASTERY_NAMESPACE = "mastery-v2"
+# Сколько пользователей держим в памяти
+CACHE_SIZE = 10_000
+# Предел счётчиков (4 бита на счётчик)
+MAX_COUNT = 15
+
+
+def _weight(correct, wrong):
+    """Вес вопроса для выборки: ошибки повышают вес, верные ответы снижают.
+
+    Невиденный вопрос (0, 0) получает вес 16 - выше, чем уже усвоенный,
+    но ниже, чем вопрос с ошибкой.
+    """
+    return max(1, 16 * (wrong + 1) // (correct + 1))
+
+
+# Вес по байту состояния: старшие 4 бита - верные ответы, младшие - ошибки
+WEIGHTS = tuple(_weight(state >> 4, state & 0x0F) for state in range(256))
+
+
+class FenwickSampler:
+    """Взвешенная выборка без повторений на дереве Фенвика.
+
+    Построение - O(n), каждое извлечение - O(log n): после выбора вес
+    элемента обнуляется, и следующий выбор идёт среди оставшихся.
+    """
+
+    __slots__ = ("weights", "tree", "total", "_top_bit")
+
+    def __init__(self, weights):
+        self.weights = array("l", weights)
+        size = len(self.weights)
+        tree = array("l", [0]) + self.weights
+        for index in range(1, size + 1):
+            parent = index + (index & -index)
+            if parent <= size:
+                tree[parent] += tree[index]
+        self.tree = tree
+        self.total = sum(self.weights)
+        self._top_bit = 1 << (size.bit_length() - 1) if size else 0
+
+    def _add(self, index, delta):
+        size = len(self.weights)
+        index += 1
+        while index <= size:
+            self.tree[index] += delta
+            index += index & -index
+        self.total += delta
+
+    def _find(self, value):
+        """Номер элемента, в отрезок которого попадает ``value``."""
+        position = 0
+        bit = self._top_bit
+        size = len(self.weights)
+        while bit:
+            following = position + bit
+            if following <= size and self.tree[following] <= value:
+                position = following
+                value -= self.tree[following]
+            bit >>= 1
+        return position
+
+    def sample(self, count, rng=random):
+        """Выбор ``count`` различных номеров с вероятностью по весу."""
+        chosen = []
+        while len(chosen) < count and self.total > 0:
+            index = self._find(rng.randrange(self.total))
+            chosen.append(index)
+            self._add(index, -self.weights[index])
+            self.weights[index] = 0
+        return chosen
+
+
+class MasteryStore:
+    """Усвоение вопросов пользователями.
+
+    На пользователя в памяти хранится ``bytearray`` по одному байту на
+    вопрос текущего банка (счётчики верных ответов и ошибок по 4 бита),
+    то есть несколько сотен байт. Данные кэшируются в памяти (LRU) и
+    сохраняются в SessionDatabase. При переполнении счётчика оба счётчика
+    делятся пополам, так что старые ответы постепенно теряют вес.
+
+    В базе состояние хранится по отпечаткам вопросов (``question_key``):
+    номер вопроса в другой версии контента может быть другим. При смене
+    версии (``rebind``) кэш сбрасывается, и состояния заново
+    раскладываются по номерам нового банка при следующем обращении.
+    """
+
+    def __init__(self, bank, database=session_db, cache_size=CACHE_SIZE):
+        self.database = database
+        self.cache_size = cache_size
+        self._users = OrderedDict()
+        self.rebind(bank)
+
+    def rebind(self, bank):
+        """Переход на новую версию банка вопросов."""
+        self.bank = bank
+        self.keys = [question_key(question) for question in bank.questions]
+        self.index = {key: qid for qid, key in enumerate(self.keys)}
+        self._users.clear()
+
+    def _decode(self, data):
+        """Состояния по номерам текущего банка из сохранённых байт."""
+        states = bytearray(len(self.bank))
+        step = KEY_SIZE + 1
+        for start in range(0, len(data) - step + 1, step):
+            qid = self.index.get(data[start:start + KEY_SIZE])
+            if qid is not None:
+                states[qid] = data[start + KEY_SIZE]
+        return states
+
+    def _encode(self, states):
+        """Ненулевые состояния вместе с отпечатками вопросов."""
+        return b"".join(
+            self.keys[qid] + bytes((state,))
+            for qid, state in enumerate(states) if state
+        )
+
+    def get(self, user_id):
+        """Состояние пользователя по номерам вопросов текущего банка."""
+        states = self._users.get(user_id)
+        if states is None:
+            data = self.database.get(MASTERY_NAMESPACE, user_id)
+            states = (self._decode(data) if data is not None
+                      else bytearray(len(self.bank)))
+            self._users[user_id] = states
+            if len(self._users) > self.cache_size:
+                self._users.popitem(last=False)
+        else:
+            self._users.move_to_end(user_id)
+        return states
+
+    def record(self, user_id, question, is_correct):
+        """Учёт ответа пользователя на вопрос (любой версии контента)."""
+        qid = question.qid
+        if (qid >= len(self.bank)
+                or self.bank.questions[qid] is not question):
+            # Вопрос из другой версии контента: ищем его по отпечатку
+            qid = self.index.get(question_key(question))
+            if qid is None:
+                return
+        states = self.get(user_id)
+        correct, wrong = states[qid] >> 4, states[qid] & 0x0F
+        if is_correct:
+            correct += 1
+        else:
+            wrong += 1
+        if correct > MAX_COUNT or wrong > MAX_COUNT:
+            correct = (correct + 1) // 2
+            wrong = (wrong + 1) // 2
+        states[qid] = (correct << 4) | wrong
+        self.database.put(MASTERY_NAMESPACE, user_id, self._encode(states))
+
+    def sample(self, user_id, qids, count, rng=random):
+        """Выбор ``count`` вопросов текущего банка из ``qids`` с упором
+        на неусвоенные."""
+        if not qids:
+            return []
+        states = self.get(user_id)
+        sampler = FenwickSampler([WEIGHTS[states[qid]] for qid in qids])
+        return [qids[index] for index in sampler.sample(count, rng)]
+
+    def stats(self):
+        return {"cached_users": len(self._users)}
+
+
+# Глобальный экземпляр
+mastery = MasteryStore(content_registry.current.bank)
+content_registry.subscribe(lambda content: mastery.rebind(content.bank))
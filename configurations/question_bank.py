@@ -0,0 +1,135 @@
+import itertools
+import random
+
+from configurations.answer_matcher import AnswerMatcher
+
+# Перемешиваются вопросы не более чем с 4 вариантами: 4! = 24 перестановки
+MAX_SHUFFLED_OPTIONS = 4
+PERMUTATION_COUNT = 24
+
+# Таблицы перестановок по числу вариантов: позиция на экране -> вариант
+PERMUTATIONS = {
+    size: tuple(itertools.permutations(range(size)))
+    for size in range(1, MAX_SHUFFLED_OPTIONS + 1)
+}
+# Обратные перестановки: вариант -> позиция на экране
+INVERSE_PERMUTATIONS = {
+    size: tuple(
+        tuple(permutation.index(option) for option in range(size))
+        for permutation in permutations
+    )
+    for size, permutations in PERMUTATIONS.items()
+}
+
+
+class Question:
+    """Скомпилированный вопрос викторины.
+
+    Варианты ответов хранятся кортежем, а словарь ``option_index``
+    сопоставляет текст варианта с его номером, поэтому проверка ответа -
+    один поиск в словаре вместо ``list.index``. Введённый вручную ответ
+    ("орден ленина") узнаётся через ``matcher``.
+    """
+
+    __slots__ = ("qid", "text", "options", "correct", "option_index",
+                 "matcher")
+
+    def __init__(self, qid, text, options, correct):
+        self.qid = qid
+        self.text = text
+        self.options = tuple(options)
+        self.correct = correct
+        self.matcher = AnswerMatcher(self.options)
+        self.option_index = self.matcher.exact
+
+    def index_of(self, answer_text):
+        """Номер варианта ответа по его тексту или None."""
+        return self.option_index.get(answer_text)
+
+    def match(self, answer_text, typos=True):
+        """Номер варианта по введённому тексту: без учёта регистра и
+        пунктуации, по началу варианта и с опечатками (см. AnswerMatcher)."""
+        return self.matcher.match(answer_text, typos)
+
+    def is_correct(self, answer_text):
+        """Проверяет правильность ответа по тексту варианта."""
+        return self.option_index.get(answer_text) == self.correct
+
+    def order(self, shuffle):
+        """Порядок вариантов на экране для номера перестановки ``shuffle``."""
+        table = PERMUTATIONS.get(len(self.options))
+        if table is None:
+            return tuple(range(len(self.options)))
+        return table[shuffle % len(table)]
+
+    def display_options(self, shuffle):
+        """Варианты ответа в порядке показа."""
+        return tuple(self.options[option] for option in self.order(shuffle))
+
+    def option_at(self, shuffle, position):
+        """Номер варианта, показанного на позиции ``position``."""
+        return self.order(shuffle)[position]
+
+    def position_of(self, shuffle, option):
+        """Позиция на экране, на которой показан вариант ``option``."""
+        table = INVERSE_PERMUTATIONS.get(len(self.options))
+        if table is None:
+            return option
+        return table[shuffle % len(table)][option]
+
+    def __repr__(self):
+        return f"Question({self.qid}, {self.text!r})"
+
+
+class QuestionBank:
+    """Банк вопросов, скомпилированный при загрузке."""
+
+    __slots__ = ("questions", "hero_questions")
+
+    def __init__(self, questions, hero_questions):
+        self.questions = tuple(questions)
+        # Номера вопросов по героям (только существующие вопросы)
+        self.hero_questions = {
+            hero_id: tuple(qid for qid in qids if qid < len(self.questions))
+            for hero_id, qids in hero_questions.items()
+        }
+
+    def __len__(self):
+        return len(self.questions)
+
+    def __getitem__(self, qid):
+        return self.questions[qid]
+
+
+def seeded_draw(seed, size, count):
+    """Вопросы и перестановки вариантов, заданные зерном ``seed``.
+
+    Возвращает ``count`` пар (номер вопроса из ``range(size)``, номер
+    перестановки) без повторений вопросов. Используется собственный
+    генератор, поэтому одно зерно на одном банке всегда даёт один набор,
+    а первые k пар не зависят от ``count`` - по зерну и числу ответов
+    можно восстановить и досрочно завершённую викторину.
+    """
+    rng = random.Random(seed)
+    pool = list(range(size))
+    draw = []
+    for position in range(min(count, size)):
+        # Частичная перетасовка Фишера-Йетса
+        chosen = rng.randrange(position, size)
+        pool[position], pool[chosen] = pool[chosen], pool[position]
+        draw.append((pool[position], rng.randrange(PERMUTATION_COUNT)))
+    return draw
+
+
+def compile_question(qid, raw):
+    """Компиляция вопроса из словаря формата storage.quiz_questions."""
+    return Question(qid, raw["question"], raw["options"],
+                    raw["correct_answer"])
+
+
+def compile_bank(raw_questions, hero_questions):
+    """Компиляция списка вопросов-словарей в QuestionBank."""
+    return QuestionBank(
+        (compile_question(qid, raw) for qid, raw in enumerate(raw_questions)),
+        hero_questions,
+    )
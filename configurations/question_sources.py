@@ -0,0 +1,62 @@
+import random
+from abc import ABC, abstractmethod
+
+from configurations.mastery import mastery
+from configurations.question_bank import seeded_draw
+from data.content import content_registry
+
+
+class QuestionSource(ABC):
+    """Источник вопросов викторины.
+
+    ``pick`` возвращает номера вопросов текущей версии контента; режим
+    викторины (см. user_panel.quiz_engine) только выбирает источник и
+    число вопросов.
+    """
+
+    @abstractmethod
+    def pick(self, user_id, count, hero_id=0):
+        """Номера ``count`` вопросов для пользователя."""
+
+
+class RandomSource(QuestionSource):
+    """Равномерная выборка из всего банка (комнаты класса)."""
+
+    def pick(self, user_id, count, hero_id=0):
+        size = len(content_registry.current.bank)
+        return random.sample(range(size), min(count, size))
+
+
+class SeededSource:
+    """Равномерная выборка, полностью заданная зерном (соревновательный
+    режим): по зерну из строки результата набор вопросов и порядок
+    вариантов восстанавливаются без сохранения самих вопросов.
+
+    Вместо ``pick`` - ``draw``: зерно берётся из сессии, и вместе с
+    вопросами выбираются перестановки вариантов.
+    """
+
+    def draw(self, seed, count):
+        """Пары (номер вопроса, номер перестановки) для зерна ``seed``."""
+        return seeded_draw(seed, len(content_registry.current.bank), count)
+
+
+class AdaptiveSource(QuestionSource):
+    """Выборка из всего банка с упором на вопросы, на которые
+    пользователь ошибался или ещё не отвечал (пробный режим)."""
+
+    def pick(self, user_id, count, hero_id=0):
+        size = len(content_registry.current.bank)
+        return mastery.sample(user_id, range(size), min(count, size))
+
+
+class HeroSource(QuestionSource):
+    """Вопросы одного героя; неусвоенные выбираются чаще."""
+
+    def pick(self, user_id, count, hero_id=0):
+        questions = content_registry.current.bank.hero_questions.get(
+            hero_id, ()
+        )
+        if len(questions) <= count:
+            return list(questions)
+        return mastery.sample(user_id, questions, count)
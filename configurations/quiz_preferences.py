@@ -0,0 +1,67 @@
+from configurations.quiz_session import (
+    TRANSPORT_INLINE,
+    TRANSPORT_POLL,
+    TRANSPORT_REPLY,
+)
+from data.session_db import session_db
+
+PREFERENCES_NAMESPACE = "quiz_prefs"
+
+# Подписи способов ответа для кнопки переключения
+TRANSPORT_TITLES = {
+    TRANSPORT_REPLY: "обычные кнопки",
+    TRANSPORT_INLINE: "кнопки в сообщении",
+    TRANSPORT_POLL: "опросы-викторины",
+}
+TRANSPORT_BUTTON_PREFIX = "🔁 Ответы:"
+
+
+def transport_button_text(transport):
+    """Текст кнопки переключения способа ответа."""
+    return f"{TRANSPORT_BUTTON_PREFIX} {TRANSPORT_TITLES[transport]}"
+
+
+class QuizPreferences:
+    """Настройки викторины пользователей (способ показа вопросов).
+
+    Значения кэшируются в памяти и сохраняются в SessionDatabase,
+    поэтому переживают перезапуск бота.
+    """
+
+    def __init__(self, database=session_db):
+        self.database = database
+        self._transports = {}
+
+    def get_transport(self, user_id, polls=True):
+        """Способ ответа пользователя.
+
+        При ``polls=False`` (соревновательный режим) опросы-викторины
+        заменяются обычными кнопками: опрос сразу показывает правильный
+        ответ.
+        """
+        transport = self._transports.get(user_id)
+        if transport is None:
+            value = self.database.get(PREFERENCES_NAMESPACE, user_id)
+            transport = int(value) if value is not None else TRANSPORT_REPLY
+            if transport not in TRANSPORT_TITLES:
+                transport = TRANSPORT_REPLY
+            self._transports[user_id] = transport
+        if transport == TRANSPORT_POLL and not polls:
+            return TRANSPORT_REPLY
+        return transport
+
+    def set_transport(self, user_id, transport):
+        self._transports[user_id] = transport
+        self.database.put(PREFERENCES_NAMESPACE, user_id, str(transport))
+
+    def toggle_transport(self, user_id):
+        """Переключение на следующий способ ответа. Возвращает новый."""
+        transports = list(TRANSPORT_TITLES)
+        current = transports.index(self.get_transport(user_id))
+        transport = transports[(current + 1) % len(transports)]
+        self.set_transport(user_id, transport)
+        return transport
+
+
+# Глобальный экземпляр
+quiz_preferences = QuizPreferences()
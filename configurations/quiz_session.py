@@ -0,0 +1,225 @@
+import random
+import struct
+import time
+from array import array
+
+from configurations.question_bank import PERMUTATION_COUNT
+from data.content import content_registry
+
+# Режимы викторины
+MODE_PRACTICE = 0
+MODE_COMPETITIVE = 1
+MODE_HERO = 2
+
+# Время на ответ в соревновательном режиме (в секундах)
+QUESTION_TIME_LIMIT = 30
+
+# Способы показа вопросов
+TRANSPORT_REPLY = 0  # Обычная клавиатура под полем ввода
+TRANSPORT_INLINE = 1  # Кнопки в сообщении, вопрос редактируется на месте
+TRANSPORT_POLL = 2  # Нативные опросы-викторины Telegram
+
+# Заголовок сериализованной сессии: режим, герой, счёт, курсор,
+# способ показа, токен сессии, номер сообщения с вопросом, время ответов,
+# версия контента, зерно набора вопросов
+_HEADER = struct.Struct("<BBHHBHIIII")
+_PROFILE_SEPARATOR = "\x1f"
+# Билет опроса: пользователь, токен сессии, номер вопроса
+_TICKET = struct.Struct("<qHH")
+
+# Запись ответов в строке результата: символ - номер выбранного варианта,
+# NO_ANSWER - время на вопрос вышло
+ANSWER_DIGITS = "0123456789abcdefghijklmnopqrstuvwxyz"
+NO_ANSWER = "-"
+
+
+def encode_answers(answers):
+    """Ответы (номера вариантов, -1 - нет ответа) в строку "20-13"."""
+    return "".join(
+        ANSWER_DIGITS[option] if option >= 0 else NO_ANSWER
+        for option in answers
+    )
+
+
+def decode_answers(text):
+    """Обратное преобразование ``encode_answers``; ValueError при ошибке."""
+    answers = []
+    for char in text:
+        if char == NO_ANSWER:
+            answers.append(-1)
+        else:
+            option = ANSWER_DIGITS.find(char)
+            if option < 0:
+                raise ValueError(f"Неизвестный ответ {char!r}")
+            answers.append(option)
+    return answers
+
+
+class QuizSession:
+    """Компактная сессия викторины одного пользователя.
+
+    Хранит только номера вопросов (``array('H')``), номера перестановок
+    вариантов ответа для каждого вопроса (``array('B')``, см.
+    question_bank.PERMUTATIONS), счёт, номер текущего вопроса, режим и
+    героя - сами вопросы берутся из банка по номеру.
+    ``profile`` заполняется только в соревновательном режиме:
+    (имя, фамилия, учебное заведение).
+
+    ``token`` - случайный номер сессии, по нему отбрасываются ответы на
+    опросы из прошлых викторин. ``message_id`` - сообщение с текущим
+    вопросом: в режиме TRANSPORT_INLINE оно редактируется, а ответ
+    текстом принимается только из более позднего сообщения (см.
+    ``accepts_reply``). ``asked_at`` - время
+    показа текущего вопроса (time.monotonic), не сохраняется.
+    ``elapsed_ms`` - суммарное время ответов, по нему при равенстве баллов
+    упорядочивается таблица лидеров. ``version`` - версия контента, из
+    которой берутся вопросы до конца викторины (см. ContentRegistry).
+
+    ``seed`` - зерно, из которого соревновательный режим получает набор
+    вопросов (см. question_bank.seeded_draw), ``answers`` - выбранные
+    варианты (-1 - время вышло). Оба сохраняются в строке результата,
+    и по ним результат можно проверить (см. data.verify_results).
+    """
+
+    __slots__ = ("question_ids", "shuffles", "score", "cursor", "mode",
+                 "hero_id", "profile", "transport", "token", "message_id",
+                 "asked_at", "elapsed_ms", "version", "seed", "answers")
+
+    def __init__(self, mode, question_ids=(), hero_id=0,
+                 transport=TRANSPORT_REPLY):
+        self.question_ids = array("H")
+        self.shuffles = array("B")
+        self.add_questions(question_ids)
+        self.score = 0
+        self.cursor = 0
+        self.mode = mode
+        self.hero_id = hero_id
+        self.profile = None
+        self.transport = transport
+        self.token = random.getrandbits(16)
+        self.message_id = 0
+        self.asked_at = 0.0
+        self.elapsed_ms = 0
+        self.version = content_registry.version
+        self.seed = random.getrandbits(32)
+        self.answers = array("b")
+
+    def add_questions(self, question_ids):
+        """Добавление вопросов со случайным порядком вариантов."""
+        for qid in question_ids:
+            self.question_ids.append(qid)
+            self.shuffles.append(random.randrange(PERMUTATION_COUNT))
+
+    def record_answer(self, option, is_correct):
+        """Учёт ответа на текущий вопрос (``option`` -1 - нет ответа)."""
+        self.answers.append(option)
+        if is_correct:
+            self.score += 1
+        self.cursor += 1
+
+    def record_response_time(self, limit=QUESTION_TIME_LIMIT):
+        """Учёт времени ответа на текущий вопрос (по монотонным часам).
+
+        Если время показа неизвестно (сессия восстановлена после
+        перезапуска), засчитывается всё отведённое время.
+        """
+        elapsed = time.monotonic() - self.asked_at if self.asked_at else limit
+        self.elapsed_ms += int(min(elapsed, limit) * 1000)
+
+    @property
+    def deadline_token(self):
+        """Токен таймера текущего вопроса: сессия и номер вопроса."""
+        return (self.token << 8) | (self.cursor & 0xFF)
+
+    @property
+    def total_questions(self):
+        return len(self.question_ids)
+
+    @property
+    def current_question_id(self):
+        """Номер текущего вопроса в банке или None, если вопросы
+        закончились."""
+        if self.cursor < len(self.question_ids):
+            return self.question_ids[self.cursor]
+        return None
+
+    def accepts_reply(self, message_id):
+        """Ответ текстом из сообщения ``message_id`` относится к текущему
+        вопросу, только если отправлен после него: номера сообщений в
+        личном чате возрастают. Повторное нажатие кнопки, отправленное
+        до показа следующего вопроса, отбрасывается."""
+        return message_id > self.message_id
+
+    @property
+    def current_shuffle(self):
+        """Номер перестановки вариантов текущего вопроса."""
+        if self.cursor < len(self.shuffles):
+            return self.shuffles[self.cursor]
+        return 0
+
+    def to_bytes(self):
+        """Сериализация сессии для постоянного хранения."""
+        data = _HEADER.pack(self.mode, self.hero_id, self.score, self.cursor,
+                            self.transport, self.token, self.message_id,
+                            self.elapsed_ms, self.version, self.seed)
+        data += struct.pack("<B", len(self.question_ids))
+        data += self.question_ids.tobytes()
+        data += self.shuffles.tobytes()
+        data += struct.pack("<B", len(self.answers))
+        data += self.answers.tobytes()
+        if self.profile is not None:
+            data += _PROFILE_SEPARATOR.join(self.profile).encode("utf-8")
+        return data
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Восстановление сессии из результата ``to_bytes``."""
+        (mode, hero_id, score, cursor, transport, token, message_id,
+         elapsed_ms, version, seed) = _HEADER.unpack_from(data)
+        offset = _HEADER.size
+        count = data[offset]
+        offset += 1
+
+        session = cls(mode, hero_id=hero_id, transport=transport)
+        session.question_ids.frombytes(data[offset:offset + 2 * count])
+        offset += 2 * count
+        session.shuffles.frombytes(data[offset:offset + count])
+        offset += count
+        if len(session.shuffles) != count or any(
+            shuffle >= PERMUTATION_COUNT for shuffle in session.shuffles
+        ):
+            raise ValueError("Повреждены перестановки вариантов")
+        answered = data[offset]
+        offset += 1
+        session.answers.frombytes(data[offset:offset + answered])
+        offset += answered
+        session.score = score
+        session.cursor = cursor
+        session.token = token
+        session.message_id = message_id
+        session.elapsed_ms = elapsed_ms
+        session.version = version
+        session.seed = seed
+        if offset < len(data):
+            session.profile = tuple(
+                data[offset:].decode("utf-8").split(_PROFILE_SEPARATOR)
+            )
+        return session
+
+
+class PollTicket:
+    """Связь отправленного опроса-викторины с вопросом сессии."""
+
+    __slots__ = ("user_id", "token", "cursor")
+
+    def __init__(self, user_id, token, cursor):
+        self.user_id = user_id
+        self.token = token
+        self.cursor = cursor
+
+    def to_bytes(self):
+        return _TICKET.pack(self.user_id, self.token, self.cursor)
+
+    @classmethod
+    def from_bytes(cls, data):
+        return cls(*_TICKET.unpack(data))
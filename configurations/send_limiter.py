@@ -0,0 +1,108 @@
+import asyncio
+import logging
+import time
+
+from aiogram.exceptions import TelegramForbiddenError, TelegramRetryAfter
+
+logger = logging.getLogger("bot_logger")
+
+# Лимиты Telegram: около 30 сообщений в секунду на бота
+# и не чаще 1 сообщения в секунду в один чат
+GLOBAL_RATE = 30
+CHAT_INTERVAL = 1.0
+# Сколько чатов помнить до очистки устаревших записей
+CHAT_TABLE_LIMIT = 10_000
+
+
+class SendRateLimiter:
+    """Ограничитель частоты отправки сообщений.
+
+    Каждая отправка заранее резервирует себе момент времени: общий слот
+    (``GLOBAL_RATE`` в секунду) и слот чата (не чаще ``CHAT_INTERVAL``).
+    Резервирование выполняется без ``await``, поэтому в одном цикле
+    событий блокировки не нужны: сотни одновременных отправок просто
+    ждут каждая своего слота.
+    """
+
+    def __init__(self, rate=GLOBAL_RATE, chat_interval=CHAT_INTERVAL):
+        self.interval = 1 / rate
+        self.chat_interval = chat_interval
+        self._next_global = 0.0
+        self._next_chat = {}
+        self.sent = 0
+        self.retries = 0
+        self.failed = 0
+
+    def reserve(self, chat_id):
+        """Резервирование слота; возвращает, сколько секунд ждать."""
+        now = time.monotonic()
+        slot = max(now, self._next_global)
+        self._next_global = slot + self.interval
+        slot = max(slot, self._next_chat.get(chat_id, 0.0))
+        self._next_chat[chat_id] = slot + self.chat_interval
+        if len(self._next_chat) > CHAT_TABLE_LIMIT:
+            self._next_chat = {
+                chat: due for chat, due in self._next_chat.items() if due > now
+            }
+        return slot - now
+
+    def pause(self, delay):
+        """Сдвиг всех отправок (ответ Telegram ``retry_after``)."""
+        self._next_global = max(self._next_global, time.monotonic() + delay)
+
+    async def acquire(self, chat_id):
+        delay = self.reserve(chat_id)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def send(self, bot, chat_id, text, **kwargs):
+        """Отправка сообщения с учётом лимитов и одним повтором.
+
+        Возвращает отправленное сообщение или None, если отправить не
+        удалось (например, пользователь заблокировал бота).
+        """
+        for attempt in range(2):
+            await self.acquire(chat_id)
+            try:
+                message = await bot.send_message(chat_id, text, **kwargs)
+                self.sent += 1
+                return message
+            except TelegramRetryAfter as e:
+                self.retries += 1
+                self.pause(e.retry_after)
+            except TelegramForbiddenError:
+                break
+            except Exception as e:
+                logger.error(f"❌ Ошибка отправки в чат {chat_id}: {e}")
+                break
+        self.failed += 1
+        return None
+
+    async def send_many(self, bot, messages):
+        """Одновременная отправка ``(chat_id, text, kwargs)``.
+
+        Возвращает список chat_id, в которые отправить не удалось.
+        """
+        messages = list(messages)
+        results = await asyncio.gather(
+            *(
+                self.send(bot, chat_id, text, **kwargs)
+                for chat_id, text, kwargs in messages
+            )
+        )
+        return [
+            chat_id
+            for (chat_id, _, _), result in zip(messages, results)
+            if result is None
+        ]
+
+    def stats(self):
+        return {
+            "sent": self.sent,
+            "retries": self.retries,
+            "failed": self.failed,
+        }
+
+
+# Глобальный экземпляр
+send_limiter = SendRateLimiter()
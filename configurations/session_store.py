@@ -0,0 +1,181 @@
+import asyncio
+import logging
+import sys
+import time
+from collections import OrderedDict
+
+logger = logging.getLogger("bot_logger")
+
+# Сессия удаляется после стольких секунд без активности
+SESSION_TTL = 30 * 60
+# Максимальное число одновременных сессий в одном хранилище
+MAX_SESSIONS = 10_000
+# Период фоновой очистки (в секундах)
+SWEEP_INTERVAL = 60
+
+# Все созданные хранилища (для фоновой очистки и статистики)
+session_stores = []
+
+
+class SessionStore:
+    """Хранилище сессий викторин с TTL и LRU-вытеснением.
+
+    Сессии упорядочены по времени последней активности: каждое обращение
+    переносит сессию в конец, поэтому истёкшие сессии всегда лежат в
+    начале и очистка просматривает только их. При превышении
+    ``max_sessions`` вытесняется самая давно неактивная сессия.
+
+    Если задана ``database``, сессии дублируются в постоянное хранилище
+    (сериализация через ``serializer.to_bytes/from_bytes``) и лениво
+    восстанавливаются при первом обращении пользователя после
+    перезапуска бота. После изменения сессии на месте нужно вызвать
+    ``save``.
+    """
+
+    def __init__(self, name, ttl=SESSION_TTL, max_sessions=MAX_SESSIONS,
+                 database=None, serializer=None):
+        self.name = name
+        self.ttl = ttl
+        self.max_sessions = max_sessions
+        self.database = database
+        self.serializer = serializer
+        self._sessions = OrderedDict()
+        self._last_activity = {}
+        # Ключи, уже проверенные в постоянном хранилище
+        self._checked = set()
+        self.evicted_ttl = 0
+        self.evicted_lru = 0
+        session_stores.append(self)
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def __contains__(self, key):
+        return key in self._sessions or self._restore(key)
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        session = self._sessions[key]
+        self.touch(key)
+        return session
+
+    def __setitem__(self, key, session):
+        self._insert(key, session)
+        self.save(key)
+
+    def __delitem__(self, key):
+        del self._sessions[key]
+        del self._last_activity[key]
+        self._checked.discard(key)
+        if self.database is not None:
+            self.database.delete(self.name, key)
+
+    def _insert(self, key, session):
+        self._sessions[key] = session
+        self._checked.add(key)
+        self.touch(key)
+        while len(self._sessions) > self.max_sessions:
+            # Из памяти вытесняем, в постоянном хранилище сессия остаётся
+            oldest, _ = self._sessions.popitem(last=False)
+            del self._last_activity[oldest]
+            self._checked.discard(oldest)
+            self.evicted_lru += 1
+
+    def _restore(self, key):
+        """Ленивое восстановление сессии из постоянного хранилища."""
+        if self.database is None or key in self._checked:
+            return False
+        if len(self._checked) >= 2 * self.max_sessions:
+            # Проверенные ключи без сессии забываются: при следующем
+            # обращении они один раз проверятся в хранилище заново
+            self._checked = set(self._sessions)
+        self._checked.add(key)
+        data = self.database.get(self.name, key, max_age=self.ttl)
+        if data is None:
+            return False
+        try:
+            self._insert(key, self.serializer.from_bytes(data))
+        except Exception as e:
+            logger.error(f"❌ Не удалось восстановить сессию {key}: {e}")
+            self.database.delete(self.name, key)
+            return False
+        return True
+
+    def save(self, key):
+        """Сохранение сессии в постоянное хранилище (запись отложенная)."""
+        if self.database is not None and key in self._sessions:
+            self.database.put(
+                self.name, key, self._sessions[key].to_bytes()
+            )
+
+    def get(self, key, default=None):
+        if key not in self:
+            return default
+        return self[key]
+
+    def pop(self, key, default=None):
+        if key not in self:
+            return default
+        session = self._sessions[key]
+        del self[key]
+        return session
+
+    def touch(self, key):
+        """Отметка активности пользователя."""
+        self._sessions.move_to_end(key)
+        self._last_activity[key] = time.monotonic()
+
+    def evict_expired(self, now=None):
+        """Удаление сессий без активности дольше TTL. Возвращает число."""
+        deadline = (now or time.monotonic()) - self.ttl
+        evicted = 0
+        while self._sessions:
+            key = next(iter(self._sessions))
+            if self._last_activity[key] > deadline:
+                break
+            del self[key]
+            evicted += 1
+        self.evicted_ttl += evicted
+        return evicted
+
+    def memory_usage(self):
+        """Примерный объём памяти, занимаемый сессиями (в байтах)."""
+        total = sys.getsizeof(self._sessions) + sys.getsizeof(
+            self._last_activity
+        )
+        for session in self._sessions.values():
+            total += sys.getsizeof(session)
+            if isinstance(session, dict):
+                values = session.values()
+            else:
+                values = (getattr(session, slot, None)
+                          for slot in getattr(session, "__slots__", ()))
+            total += sum(sys.getsizeof(value) for value in values)
+        return total
+
+    def stats(self):
+        """Статистика хранилища."""
+        return {
+            "sessions": len(self._sessions),
+            "memory_bytes": self.memory_usage(),
+            "evicted_ttl": self.evicted_ttl,
+            "evicted_lru": self.evicted_lru,
+        }
+
+
+async def sweep_sessions(interval=SWEEP_INTERVAL):
+    """Фоновая очистка истёкших сессий во всех хранилищах."""
+    while True:
+        await asyncio.sleep(interval)
+        for store in session_stores:
+            evicted = store.evict_expired()
+            if evicted:
+                logger.info(
+                    f"Удалено {evicted} неактивных сессий ({store.name})"
+                )
+            if store.database is not None:
+                # Сессии, которые так и не были восстановлены после рестарта
+                await asyncio.to_thread(
+                    store.database.purge, store.name, store.ttl
+                )
@@ -0,0 +1,51 @@
+import asyncio
+from contextlib import asynccontextmanager
+
+
+class UserLocks:
+    """Поочерёдная обработка обновлений одного пользователя.
+
+    aiogram обрабатывает обновления параллельно (``handle_as_tasks``),
+    поэтому два быстрых ответа одного пользователя могут выполняться
+    одновременно и менять одну сессию между ``await``. Обработчик ответа
+    выполняется внутри ``hold(user_id)``: второй ответ ждёт, пока первый
+    не отправит следующий вопрос, и затем отбрасывается проверкой сессии.
+
+    Замок существует, только пока его держат или ждут, поэтому память
+    занимают лишь активные пользователи.
+    """
+
+    def __init__(self):
+        self._locks = {}
+        # user_id -> число держащих и ожидающих замок
+        self._holders = {}
+        self.contended = 0
+
+    @asynccontextmanager
+    async def hold(self, user_id):
+        lock = self._locks.get(user_id)
+        if lock is None:
+            lock = self._locks[user_id] = asyncio.Lock()
+        elif lock.locked():
+            self.contended += 1
+        self._holders[user_id] = self._holders.get(user_id, 0) + 1
+        try:
+            async with lock:
+                yield
+        finally:
+            holders = self._holders[user_id] - 1
+            if holders:
+                self._holders[user_id] = holders
+            else:
+                del self._holders[user_id]
+                del self._locks[user_id]
+
+    def stats(self):
+        return {
+            "locked": len(self._locks),
+            "contended": self.contended,
+        }
+
+
+# Глобальный экземпляр
+user_locks = UserLocks()
@@ -0,0 +1,208 @@
+import asyncio
+import hashlib
+import logging
+import struct
+import time
+from array import array
+
+from data.content import content_registry
+from data.session_db import session_db
+
+logger = logging.getLogger("bot_logger")
+
+STATS_NAMESPACE = "answer_stats"
+# Счётчики с отпечатками вопросов (прежние "counters" без отпечатков
+# нельзя надёжно отнести к вопросам и не загружаются)
+STATS_KEY = "counters-v2"
+# Период записи счётчиков на диск (в секундах)
+FLUSH_INTERVAL = 60
+# Время ответа дольше этого не учитывается (пользователь отвлёкся)
+MAX_LATENCY = 10 * 60
+
+# Заголовок сохранённых счётчиков: число вопросов, вариантов на вопрос
+_HEADER = struct.Struct("<II")
+# Длина отпечатка вопроса в байтах
+KEY_SIZE = 8
+
+
+def question_key(question):
+    """Отпечаток вопроса по тексту и вариантам ответа.
+
+    Не зависит от номера вопроса в банке: по нему счётчики переносятся
+    между версиями контента, а ответы из сессий прошлых версий попадают
+    к тому же вопросу (или не учитываются, если его больше нет).
+    """
+    text = "\x1f".join((question.text,) + question.options)
+    return hashlib.blake2b(text.encode("utf-8"),
+                           digest_size=KEY_SIZE).digest()
+
+
+class AnswerStats:
+    """Статистика ответов по вопросам.
+
+    Счётчики лежат в плоских массивах ``array``: выборы вариантов
+    (``stride`` ячеек на вопрос), сумма времени ответа в миллисекундах и
+    число замеров времени. Запись ответа - только увеличение счётчиков;
+    на диск (через SessionDatabase) массивы целиком записываются раз в
+    ``FLUSH_INTERVAL`` секунд, если были новые ответы.
+
+    Счётчики привязаны к вопросу по отпечатку (``question_key``), а не
+    только по номеру: номер одного и того же вопроса в другой версии
+    контента может быть другим.
+    """
+
+    def __init__(self, bank, database=session_db):
+        self.database = database
+        self.answers = 0
+        self._flushed_answers = 0
+        self._allocate(bank)
+
+    def _allocate(self, bank):
+        self.bank = bank
+        self.size = len(bank)
+        self.stride = max((len(q.options) for q in bank.questions), default=1)
+        self.keys = [question_key(question) for question in bank.questions]
+        self.index = {key: qid for qid, key in enumerate(self.keys)}
+        self.choices = array("I", [0]) * (self.size * self.stride)
+        self.latency_ms = array("Q", [0]) * self.size
+        self.latency_count = array("I", [0]) * self.size
+
+    def rebind(self, bank):
+        """Переход на новую версию банка вопросов (перезагрузка контента).
+
+        Счётчики переносятся по отпечаткам вопросов, как при загрузке
+        сохранённой статистики.
+        """
+        data = self.to_bytes()
+        self._allocate(bank)
+        self.merge_bytes(data)
+        # Формат счётчиков изменился - записываем при следующем сбросе
+        self._flushed_answers = -1
+
+    def record(self, question, option, asked_at=0.0):
+        """Учёт ответа: вопрос, выбранный вариант, время показа вопроса."""
+        qid = question.qid
+        if qid >= self.size or self.bank.questions[qid] is not question:
+            # Вопрос из другой версии контента: ищем его по отпечатку
+            qid = self.index.get(question_key(question))
+            if qid is None:
+                return
+        if option >= self.stride:
+            return
+        self.choices[qid * self.stride + option] += 1
+        self.answers += 1
+        if asked_at:
+            latency = time.monotonic() - asked_at
+            if latency < MAX_LATENCY:
+                self.latency_ms[qid] += int(latency * 1000)
+                self.latency_count[qid] += 1
+
+    def to_bytes(self):
+        return (
+            _HEADER.pack(self.size, self.stride)
+            + b"".join(self.keys)
+            + self.choices.tobytes()
+            + self.latency_ms.tobytes()
+            + self.latency_count.tobytes()
+        )
+
+    def merge_bytes(self, data):
+        """Добавление сохранённых счётчиков к текущим.
+
+        Если с тех пор изменился банк вопросов, переносятся счётчики
+        только тех вопросов, отпечатки которых есть в текущем банке.
+        """
+        size, stride = _HEADER.unpack_from(data)
+        offset = _HEADER.size
+        keys = [
+            data[start:start + KEY_SIZE]
+            for start in range(offset, offset + size * KEY_SIZE, KEY_SIZE)
+        ]
+        offset += size * KEY_SIZE
+        arrays = []
+        for typecode, count in (("I", size * stride), ("Q", size),
+                                ("I", size)):
+            values = array(typecode)
+            end = offset + values.itemsize * count
+            values.frombytes(data[offset:end])
+            arrays.append(values)
+            offset = end
+        choices, latency_ms, latency_count = arrays
+
+        if len(latency_count) != size:
+            raise ValueError("Счётчики обрезаны")
+
+        for old_qid, key in enumerate(keys):
+            qid = self.index.get(key)
+            if qid is None:
+                continue
+            # Одинаковый отпечаток - одинаковые варианты в том же порядке
+            for option in range(min(stride, self.stride)):
+                self.choices[qid * self.stride + option] += (
+                    choices[old_qid * stride + option]
+                )
+            self.latency_ms[qid] += latency_ms[old_qid]
+            self.latency_count[qid] += latency_count[old_qid]
+
+    def load(self):
+        """Загрузка накопленной статистики (при запуске бота)."""
+        data = self.database.get(STATS_NAMESPACE, STATS_KEY)
+        if data is None:
+            return
+        try:
+            self.merge_bytes(data)
+        except (struct.error, ValueError) as e:
+            logger.error(f"❌ Повреждена статистика ответов: {e}")
+
+    def flush(self):
+        """Передача счётчиков в SessionDatabase, если были новые ответы."""
+        if self.answers == self._flushed_answers:
+            return False
+        self.database.put(STATS_NAMESPACE, STATS_KEY, self.to_bytes())
+        self._flushed_answers = self.answers
+        return True
+
+    async def run_flusher(self, interval=FLUSH_INTERVAL):
+        """Фоновая периодическая запись статистики."""
+        while True:
+            await asyncio.sleep(interval)
+            self.flush()
+
+    def question_stats(self, qid):
+        """(ответов, верных, самый частый неверный вариант, его доля,
+        среднее время ответа в секундах или None)."""
+        question = self.bank[qid]
+        base = qid * self.stride
+        counts = self.choices[base:base + len(question.options)]
+        total = sum(counts)
+        correct = counts[question.correct]
+
+        distractor, distractor_count = None, 0
+        for option, count in enumerate(counts):
+            if option != question.correct and count > distractor_count:
+                distractor, distractor_count = option, count
+
+        latency = None
+        if self.latency_count[qid]:
+            latency = self.latency_ms[qid] / self.latency_count[qid] / 1000
+        return (
+            total,
+            correct,
+            distractor,
+            distractor_count / total if total else 0.0,
+            latency,
+        )
+
+    def hero_stats(self, hero_id):
+        """(ответов, верных) по всем вопросам героя."""
+        total = correct = 0
+        for qid in self.bank.hero_questions.get(hero_id, ()):
+            question_total, question_correct, *_ = self.question_stats(qid)
+            total += question_total
+            correct += question_correct
+        return total, correct
+
+
+# Глобальный экземпляр
+answer_stats = AnswerStats(content_registry.current.bank)
+content_registry.subscribe(lambda content: answer_stats.rebind(content.bank))
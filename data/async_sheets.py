@@ -0,0 +1,198 @@
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from data.google_sheets import sheets_manager
+from data.sheets_scheduler import (
+    READ_PRIORITY,
+    WRITE_PRIORITY,
+    SheetsScheduler,
+    is_quota_error,
+)
+
+logger = logging.getLogger("bot_logger")
+
+# Размер пула потоков для запросов к Google Таблицам
+SHEETS_MAX_WORKERS = 4
+# Таймаут одного вызова (в секундах)
+SHEETS_CALL_TIMEOUT = 15.0
+# Сколько запись результата ждёт подключения к таблице (в секундах)
+SHEETS_CONNECT_WAIT = 30.0
+# Пауза между попытками подключения (в секундах)
+RECONNECT_MIN_DELAY = 1.0
+RECONNECT_MAX_DELAY = 60.0
+# После стольких ошибок подряд соединение пересоздаётся
+RECONNECT_AFTER_FAILURES = 3
+
+
+class AsyncSheetsManager:
+    """Асинхронная обёртка над GoogleSheetsManager.
+
+    Все блокирующие вызовы gspread выполняются в отдельном ограниченном
+    пуле потоков, поэтому медленный ответ Google не останавливает
+    обработку обновлений других пользователей. Клиент gspread общий -
+    тот, что хранится в обёрнутом менеджере. Запросы проходят через
+    планировщик с учётом квот API.
+
+    Подключение выполняется в фоне после запуска бота и повторяется при
+    ошибках, поэтому старт бота не зависит от задержек Google.
+    """
+
+    def __init__(self, manager, max_workers=SHEETS_MAX_WORKERS,
+                 timeout=SHEETS_CALL_TIMEOUT):
+        self.manager = manager
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="sheets"
+        )
+        self.scheduler = SheetsScheduler(self._executor, max_workers)
+        self._ready = None
+        self._connect_task = None
+        self._failures = 0
+
+    @property
+    def is_ready(self):
+        """Подключена ли таблица."""
+        return self.manager.sheet is not None
+
+    def start(self):
+        """Запуск фонового подключения (вызывается при старте бота)."""
+        if self._ready is None:
+            self._ready = asyncio.Event()
+        if self.is_ready:
+            self._ready.set()
+            return
+        self._ready.clear()
+        if self._connect_task is None or self._connect_task.done():
+            self._connect_task = asyncio.create_task(self._connect_loop())
+
+    async def _connect_loop(self):
+        """Подключение с повторами и экспоненциальной паузой."""
+        delay = RECONNECT_MIN_DELAY
+        while not await self.connect():
+            logger.warning(
+                "⚠️ Повторное подключение к Google Таблицам "
+                f"через {delay:.0f} с"
+            )
+            await asyncio.sleep(delay)
+            delay = min(RECONNECT_MAX_DELAY, delay * 2)
+        self._ready.set()
+
+    async def wait_ready(self, timeout=SHEETS_CONNECT_WAIT):
+        """Ожидание подключения к таблице. Возвращает успешность."""
+        self.start()
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
+        return self.is_ready
+
+    async def _run(self, func, *args, default=None, priority=READ_PRIORITY,
+                   cost=1, timeout=None):
+        """Выполнение блокирующего вызова через очередь запросов.
+
+        ``default`` может быть функцией - тогда она вызывается только при
+        ошибке (например, чтобы вернуть последние закэшированные данные).
+        Чтение до подключения сразу возвращает ``default``, запись ждёт
+        подключения не дольше ``SHEETS_CONNECT_WAIT``.
+        """
+        if not self.is_ready:
+            if priority == READ_PRIORITY:
+                self.start()
+                return default() if callable(default) else default
+            if not await self.wait_ready():
+                logger.error(
+                    f"❌ Таблица не подключена, запрос {func.__name__} отменён"
+                )
+                return default() if callable(default) else default
+
+        try:
+            result = await self.scheduler.submit(
+                func, *args, priority=priority, cost=cost,
+                timeout=timeout or self.timeout,
+            )
+            self._failures = 0
+            return result
+        except asyncio.TimeoutError:
+            logger.error(
+                f"❌ Таймаут запроса к Google Таблицам: {func.__name__}"
+            )
+            self._on_failure()
+        except Exception as e:
+            logger.error(
+                f"❌ Ошибка запроса к Google Таблицам ({func.__name__}): {e}"
+            )
+            if not is_quota_error(e):
+                self._on_failure()
+        return default() if callable(default) else default
+
+    def _on_failure(self):
+        """Переподключение после нескольких ошибок подряд."""
+        self._failures += 1
+        if self._failures >= RECONNECT_AFTER_FAILURES:
+            logger.warning(
+                "⚠️ Соединение с Google Таблицами будет пересоздано"
+            )
+            self._failures = 0
+            self.manager.sheet = None
+            self.start()
+
+    async def connect(self):
+        """Подключение к Google Таблицам."""
+        try:
+            return await self.scheduler.submit(
+                self.manager.connect, priority=WRITE_PRIORITY, cost=3,
+                timeout=self.timeout,
+            )
+        except Exception as e:
+            logger.error(f"❌ Ошибка подключения к Google Таблицам: {e}")
+            return False
+
+    async def get_all_results(self):
+        """Получение всех результатов из таблицы."""
+        return await self._run(self.manager.get_all_results, default=list)
+
+    async def get_leaderboard_records(self):
+        """Получение имён и баллов участников для таблицы лидеров."""
+        return await self._run(
+            self.manager.get_leaderboard_records,
+            default=self.manager.get_cached_leaderboard_records,
+        )
+
+    async def save_competitive_result(self, user_data):
+        """Сохранение результата в таблицу."""
+        return await self._run(
+            self.manager.save_competitive_result, user_data, default=False,
+            priority=WRITE_PRIORITY, cost=2,
+        )
+
+    async def is_competitive_completed(self, chat_id):
+        """Проверка, проходил ли пользователь соревновательный режим."""
+        return await self._run(
+            self.manager.is_competitive_completed, chat_id,
+            default=lambda: (
+                str(chat_id) in self.manager.results_index.chat_ids
+            ),
+        )
+
+    async def get_statistics(self):
+        """Получение статистики по результатам."""
+        return await self._run(
+            self.manager.get_statistics,
+            default={"total_participants": 0, "average_score": 0,
+                     "best_score": 0},
+        )
+
+    def stats(self):
+        """Состояние очереди запросов к Google Таблицам."""
+        return self.scheduler.stats()
+
+    def shutdown(self):
+        """Остановка фонового подключения и пула потоков."""
+        if self._connect_task is not None:
+            self._connect_task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+# Глобальный экземпляр
+async_sheets = AsyncSheetsManager(sheets_manager)
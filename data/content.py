@@ -0,0 +1,367 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import pickle
+
+from configurations.question_bank import compile_bank
+
+logger = logging.getLogger("bot_logger")
+
+CONTENT_FILE = os.path.join(os.path.dirname(__file__), "content.json")
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "cache")
+# Меняется при изменении формата скомпилированного кэша
+CACHE_FORMAT = 2
+# Сколько прошлых версий держать в памяти для уже начатых викторин
+KEEP_VERSIONS = 3
+# Сколько последних версий хранить на диске (для сессий после перезапуска)
+ARCHIVE_VERSIONS = 20
+# Период проверки файла контента на изменения (в секундах)
+WATCH_INTERVAL = 10
+# Ограничения Telegram для викторины-опроса: вопросы в режиме опросов
+# отправляются как есть, а ответы кодируются одной цифрой на вопрос
+MAX_QUESTION_LENGTH = 300
+MAX_OPTION_LENGTH = 100
+MAX_OPTIONS = 10
+
+
+class ContentError(ValueError):
+    """Ошибка в файле с вопросами и героями."""
+
+
+class ContentVersionError(LookupError):
+    """Версия контента, закреплённая за викториной, больше недоступна."""
+
+
+class Content:
+    """Загруженный контент: банк вопросов и данные о героях."""
+
+    __slots__ = ("version", "digest", "bank", "hero_names", "hero_urls",
+                 "hero_questions")
+
+    def __init__(self, version, digest, bank, hero_names, hero_urls,
+                 hero_questions):
+        self.version = version
+        self.digest = digest
+        self.bank = bank
+        self.hero_names = hero_names
+        self.hero_urls = hero_urls
+        self.hero_questions = hero_questions
+
+
+def validate_content(data):
+    """Проверка структуры файла контента. Ошибки - ContentError."""
+    if not isinstance(data, dict):
+        raise ContentError("Корень файла должен быть объектом")
+    if not isinstance(data.get("version"), int):
+        raise ContentError("Поле 'version' должно быть целым числом")
+
+    heroes = data.get("heroes")
+    if not isinstance(heroes, list) or not heroes:
+        raise ContentError("Поле 'heroes' должно быть непустым списком")
+    for position, hero in enumerate(heroes, 1):
+        if not isinstance(hero, dict) or hero.get("id") != position:
+            raise ContentError(
+                f"Герой №{position}: 'id' должен быть равен {position}"
+            )
+        for field in ("name", "url"):
+            if not isinstance(hero.get(field), str) or not hero[field]:
+                raise ContentError(
+                    f"Герой №{position}: поле '{field}' должно быть строкой"
+                )
+
+    questions = data.get("questions")
+    if not isinstance(questions, list):
+        raise ContentError("Поле 'questions' должно быть списком")
+    for index, question in enumerate(questions):
+        where = f"Вопрос №{index}"
+        if not isinstance(question, dict):
+            raise ContentError(f"{where}: ожидается объект")
+        hero = question.get("hero")
+        if not isinstance(hero, int) or not 1 <= hero <= len(heroes):
+            raise ContentError(f"{where}: неизвестный герой {hero!r}")
+        text = question.get("question")
+        if not isinstance(text, str) or not text.strip():
+            raise ContentError(f"{where}: пустой текст вопроса")
+        if len(text) > MAX_QUESTION_LENGTH:
+            raise ContentError(
+                f"{where}: текст длиннее {MAX_QUESTION_LENGTH} символов"
+            )
+        options = question.get("options")
+        if (
+            not isinstance(options, list)
+            or len(options) < 2
+            or not all(isinstance(option, str) and option
+                       for option in options)
+        ):
+            raise ContentError(f"{where}: нужно минимум 2 варианта ответа")
+        if len(set(options)) != len(options):
+            raise ContentError(f"{where}: варианты ответа повторяются")
+        if len(options) > MAX_OPTIONS:
+            raise ContentError(
+                f"{where}: больше {MAX_OPTIONS} вариантов ответа"
+            )
+        if any(len(option) > MAX_OPTION_LENGTH for option in options):
+            raise ContentError(
+                f"{where}: вариант длиннее {MAX_OPTION_LENGTH} символов"
+            )
+        correct = question.get("correct_answer")
+        if not isinstance(correct, int) or not 0 <= correct < len(options):
+            raise ContentError(f"{where}: неверный 'correct_answer'")
+
+
+def build_content(data, digest):
+    """Компиляция проверенного контента."""
+    heroes = data["heroes"]
+    hero_names = {hero["id"]: hero["name"] for hero in heroes}
+    hero_urls = [hero["url"] for hero in heroes]
+
+    # Вопросы героя определяются по тегу 'hero' у каждого вопроса
+    hero_questions = {hero["id"]: [] for hero in heroes}
+    for qid, question in enumerate(data["questions"]):
+        hero_questions[question["hero"]].append(qid)
+
+    bank = compile_bank(data["questions"], hero_questions)
+    return Content(data["version"], digest, bank, hero_names, hero_urls,
+                   hero_questions)
+
+
+def _cache_path(digest):
+    return os.path.join(CACHE_DIR, f"content-{digest}.pickle")
+
+
+def _write_cache(content):
+    """Атомарная запись кэша и удаление устаревших файлов."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        path = _cache_path(content.digest)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(content, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        for name in os.listdir(CACHE_DIR):
+            if name.startswith("content-") and name != os.path.basename(path):
+                os.remove(os.path.join(CACHE_DIR, name))
+    except OSError as e:
+        logger.warning(f"⚠️ Не удалось сохранить кэш контента: {e}")
+
+
+def _archive_path(version):
+    return os.path.join(CACHE_DIR, f"version-{version}.pickle")
+
+
+def archive_content(content):
+    """Сохранение скомпилированной версии под её номером.
+
+    По архиву восстанавливаются версии, выгруженные из памяти или
+    загруженные до перезапуска, пока на них ещё идут викторины. Хранятся
+    ``ARCHIVE_VERSIONS`` последних номеров.
+    """
+    path = _archive_path(content.version)
+    try:
+        archived = read_archive(content.version)
+        if archived is not None and archived.digest == content.digest:
+            return
+        if archived is not None:
+            logger.warning(
+                f"⚠️ Версия контента {content.version} изменилась без "
+                f"увеличения номера - архив версии перезаписан"
+            )
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as file:
+            pickle.dump(content, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+        versions = sorted(
+            int(name[len("version-"):-len(".pickle")])
+            for name in os.listdir(CACHE_DIR)
+            if name.startswith("version-") and name.endswith(".pickle")
+        )
+        for version in versions[:-ARCHIVE_VERSIONS]:
+            os.remove(_archive_path(version))
+    except OSError as e:
+        logger.warning(f"⚠️ Не удалось сохранить версию контента: {e}")
+
+
+def read_archive(version):
+    """Версия контента из архива или None."""
+    try:
+        with open(_archive_path(version), "rb") as file:
+            return pickle.load(file)
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.warning(f"⚠️ Повреждён архив версии {version}: {e}")
+        return None
+
+
+def load_content(path=CONTENT_FILE, use_cache=True):
+    """Загрузка контента с использованием скомпилированного кэша.
+
+    Кэш привязан к хэшу содержимого файла, поэтому любое изменение
+    вопросов автоматически приводит к перекомпиляции.
+    """
+    with open(path, "rb") as file:
+        raw = file.read()
+    digest = hashlib.sha256(
+        CACHE_FORMAT.to_bytes(2, "big") + raw
+    ).hexdigest()[:16]
+
+    if use_cache:
+        try:
+            with open(_cache_path(digest), "rb") as file:
+                return pickle.load(file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"⚠️ Повреждён кэш контента, пересобираем: {e}")
+
+    data = json.loads(raw.decode("utf-8"))
+    validate_content(data)
+    content = build_content(data, digest)
+
+    if use_cache:
+        _write_cache(content)
+    return content
+
+
+class ContentRegistry:
+    """Версии контента: текущая и закреплённые за начатыми викторинами.
+
+    Новая версия загружается, проверяется и компилируется в отдельном
+    потоке (вместе с подготовкой зависящих от неё клавиатур - см.
+    ``add_preparer``), затем в цикле событий подменяет текущую одним
+    присваиванием, после чего вызываются подписчики (``subscribe``).
+
+    Сессия викторины запоминает номер версии при старте и до конца берёт
+    вопросы из неё (``bank(version)``). В памяти хранятся
+    ``KEEP_VERSIONS`` прошлых версий, остальные (и версии до
+    перезапуска) подгружаются из архива на диске (``archive_content``).
+    Если версии нет и там, ``get`` выбрасывает ContentVersionError -
+    подменять её текущей нельзя: номера вопросов в ней другие.
+    """
+
+    def __init__(self, path=CONTENT_FILE):
+        self.path = path
+        self.current = load_content(path)
+        archive_content(self.current)
+        self.versions = {self.current.version: self.current}
+        self._preparers = []
+        self._listeners = []
+        self._mtime = self._stat()
+        self._reload_lock = asyncio.Lock()
+        self.reloads = 0
+
+    @property
+    def version(self):
+        return self.current.version
+
+    def get(self, version):
+        """Контент указанной версии; ContentVersionError, если её нет."""
+        content = self.versions.get(version)
+        if content is None:
+            # Редкий случай: версия выгружена из памяти или загружена до
+            # перезапуска - читаем её из архива (один раз)
+            content = read_archive(version)
+            if content is None:
+                raise ContentVersionError(version)
+            self.versions[version] = content
+            self._trim()
+        return content
+
+    def bank(self, version):
+        """Банк вопросов указанной версии."""
+        return self.get(version).bank
+
+    def add_preparer(self, preparer):
+        """``preparer(content)`` вызывается в потоке до подмены версии.
+
+        Подготовленное не должно попадать в общие структуры из потока:
+        preparer может вернуть функцию без аргументов, которая будет
+        вызвана в цикле событий сразу после подмены версии.
+        """
+        self._preparers.append(preparer)
+
+    def subscribe(self, listener):
+        """``listener(content)`` вызывается в цикле событий после подмены."""
+        self._listeners.append(listener)
+
+    def _stat(self):
+        try:
+            return os.stat(self.path).st_mtime_ns
+        except OSError:
+            return None
+
+    def _prepare(self):
+        """Загрузка и компиляция новой версии (в отдельном потоке)."""
+        content = load_content(self.path)
+        if content.digest == self.current.digest:
+            return None
+        if content.version <= self.current.version:
+            raise ContentError(
+                f"Поле 'version' должно быть больше {self.current.version}"
+            )
+        archive_content(content)
+        appliers = []
+        for preparer in self._preparers:
+            applier = preparer(content)
+            if applier is not None:
+                appliers.append(applier)
+        return content, appliers
+
+    async def reload(self):
+        """Перезагрузка контента из файла.
+
+        Возвращает новую версию или None, если файл не изменился.
+        Ошибки в файле - ContentError (текущая версия остаётся).
+
+        Перезагрузки (наблюдатель и команда администратора) идут по
+        очереди: следующая сравнивает файл уже с подменённой версией и
+        не применяет тот же контент второй раз.
+        """
+        async with self._reload_lock:
+            self._mtime = self._stat()
+            prepared = await asyncio.to_thread(self._prepare)
+            if prepared is None:
+                return None
+            content, appliers = prepared
+
+            self.versions[content.version] = content
+            self.current = content
+            self._trim()
+            self.reloads += 1
+            for applier in appliers:
+                applier()
+            for listener in self._listeners:
+                listener(content)
+        logger.info(
+            f"✅ Загружена версия контента {content.version}: "
+            f"вопросов {len(content.bank)}, героев {len(content.hero_names)}"
+        )
+        return content
+
+    def _trim(self):
+        """Выгрузка из памяти давно загруженных версий (кроме текущей)."""
+        for version in list(self.versions):
+            if len(self.versions) <= KEEP_VERSIONS + 1:
+                break
+            if version != self.current.version:
+                del self.versions[version]
+
+    async def watch(self, interval=WATCH_INTERVAL):
+        """Фоновая перезагрузка при изменении файла контента."""
+        while True:
+            await asyncio.sleep(interval)
+            if self._stat() == self._mtime:
+                continue
+            try:
+                await self.reload()
+            except (ValueError, OSError) as e:
+                logger.error(f"❌ Новая версия контента отклонена: {e}")
+
+
+# Глобальный экземпляр
+content_registry = ContentRegistry()
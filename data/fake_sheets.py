@@ -0,0 +1,151 @@
+import json
+import re
+import threading
+import time
+from collections import Counter
+
+from gspread.exceptions import APIError
+from requests import Response
+
+_RANGE_RE = re.compile(r"^([A-Z]+)(\d*)(?::([A-Z]+)(\d*))?$")
+
+
+def _column_index(letters):
+    """Номер колонки (с 0) по буквенному обозначению."""
+    index = 0
+    for char in letters:
+        index = index * 26 + ord(char) - ord("A") + 1
+    return index - 1
+
+
+def quota_error():
+    """Ошибка API, которую возвращает Google при превышении квоты."""
+    response = Response()
+    response.status_code = 429
+    response._content = json.dumps(
+        {
+            "error": {
+                "code": 429,
+                "message": "Quota exceeded for quota metric 'Read requests'",
+                "status": "RESOURCE_EXHAUSTED",
+            }
+        }
+    ).encode()
+    return APIError(response)
+
+
+class FakeWorksheet:
+    """Локальная замена листа gspread для тестов и бенчмарков.
+
+    Реализует используемую ботом часть API Worksheet, считает вызовы и
+    переданные ячейки, умеет имитировать задержку сети и ошибки квоты.
+    """
+
+    def __init__(self, rows=None, latency=0.0, quota_errors=0):
+        self.rows = [list(row) for row in rows or []]
+        self.latency = latency
+        self.quota_errors = quota_errors  # Сколько ближайших вызовов упадут
+        self.calls = Counter()
+        self.cells_read = 0
+        self._lock = threading.Lock()
+
+    def _call(self, name):
+        """Учёт вызова, задержка и при необходимости ошибка квоты."""
+        with self._lock:
+            self.calls[name] += 1
+            fail = self.quota_errors > 0
+            if fail:
+                self.quota_errors -= 1
+        if self.latency:
+            time.sleep(self.latency)
+        if fail:
+            raise quota_error()
+
+    def _read(self, values):
+        self.cells_read += sum(len(row) for row in values)
+        return values
+
+    def _slice(self, range_name):
+        """Значения диапазона в A1-нотации (пустые хвосты обрезаются)."""
+        match = _RANGE_RE.match(range_name)
+        if match is None:
+            raise ValueError(f"Неподдерживаемый диапазон: {range_name}")
+        first_col, first_row, last_col, last_row = match.groups()
+        start_col = _column_index(first_col)
+        end_col = _column_index(last_col or first_col)
+        start_row = int(first_row or 1) - 1
+        end_row = int(last_row) if last_row else len(self.rows)
+
+        values = [
+            row[start_col:end_col + 1] for row in self.rows[start_row:end_row]
+        ]
+        values = [self._trim(row) for row in values]
+        while values and not values[-1]:
+            values.pop()
+        return values
+
+    @staticmethod
+    def _trim(row):
+        row = [str(value) for value in row]
+        while row and row[-1] == "":
+            row.pop()
+        return row
+
+    def row_values(self, row):
+        self._call("row_values")
+        if row - 1 < len(self.rows):
+            return self._read([self._trim(self.rows[row - 1])])[0]
+        return []
+
+    def col_values(self, col):
+        self._call("col_values")
+        values = [row[col - 1] if col - 1 < len(row) else ""
+                  for row in self.rows]
+        while values and values[-1] == "":
+            values.pop()
+        return self._read([[str(value) for value in values]])[0]
+
+    def get_all_values(self):
+        self._call("get_all_values")
+        width = max((len(row) for row in self.rows), default=0)
+        return self._read(
+            [[str(value) for value in row] + [""] * (width - len(row))
+             for row in self.rows]
+        )
+
+    def get(self, range_name):
+        self._call("get")
+        return self._read(self._slice(range_name))
+
+    def batch_get(self, ranges):
+        self._call("batch_get")
+        return [self._read(self._slice(range_name)) for range_name in ranges]
+
+    def update_cell(self, row, col, value):
+        self._call("update_cell")
+        while len(self.rows) < row:
+            self.rows.append([])
+        cells = self.rows[row - 1]
+        while len(cells) < col:
+            cells.append("")
+        cells[col - 1] = value
+
+    def append_row(self, values):
+        self._call("append_row")
+        self.rows.append(list(values))
+
+    def append_rows(self, values):
+        self._call("append_rows")
+        self.rows.extend(list(row) for row in values)
+
+    def clear(self):
+        self._call("clear")
+        self.rows = []
+
+    @property
+    def total_calls(self):
+        return sum(self.calls.values())
+
+    def reset_counters(self):
+        self.calls.clear()
+        self.cells_read = 0
@@ -0,0 +1,113 @@
+import json
+from collections import OrderedDict
+
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage
+
+from data.session_db import session_db
+
+STATE_NAMESPACE = "fsm_state"
+DATA_NAMESPACE = "fsm_data"
+# Сколько пользователей держим в кэше состояний
+CACHE_SIZE = 50_000
+
+_MISSING = object()
+
+
+class SQLiteStorage(BaseStorage):
+    """FSM-хранилище aiogram поверх SessionDatabase.
+
+    Состояния и данные пользователей переживают перезапуск бота.
+    Чтения обслуживаются из кэша в памяти, а запись выполняется только
+    при реальном изменении значения: повторный ``set_state`` с тем же
+    состоянием, который вызывают почти все обработчики, ничего не пишет.
+    Изменённые ключи записываются на диск пакетами (SessionDatabase.flush).
+    """
+
+    def __init__(self, database=session_db, cache_size=CACHE_SIZE):
+        self.database = database
+        self.cache_size = cache_size
+        # ключ -> (состояние, данные); данные хранятся в виде JSON-строки
+        self._cache = OrderedDict()
+        self.writes = 0
+        self.skipped_writes = 0
+
+    @staticmethod
+    def _key(key):
+        return (
+            f"{key.bot_id}:{key.chat_id}:{key.user_id}:"
+            f"{key.thread_id or ''}:{key.business_connection_id or ''}:"
+            f"{key.destiny}"
+        )
+
+    def _record(self, db_key):
+        """Запись кэша для ключа (загружается из базы при промахе)."""
+        record = self._cache.get(db_key, _MISSING)
+        if record is _MISSING:
+            record = [
+                self.database.get(STATE_NAMESPACE, db_key),
+                self.database.get(DATA_NAMESPACE, db_key),
+            ]
+            self._cache[db_key] = record
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        else:
+            self._cache.move_to_end(db_key)
+        return record
+
+    async def set_state(self, key, state=None):
+        state = state.state if isinstance(state, State) else state
+        db_key = self._key(key)
+        record = self._record(db_key)
+        if record[0] == state:
+            self.skipped_writes += 1
+            return
+
+        record[0] = state
+        self.writes += 1
+        if state is None:
+            self.database.delete(STATE_NAMESPACE, db_key)
+        else:
+            self.database.put(STATE_NAMESPACE, db_key, state)
+
+    async def get_state(self, key):
+        return self._record(self._key(key))[0]
+
+    async def set_data(self, key, data):
+        if not isinstance(data, dict):
+            raise DataNotDictLikeError(
+                f"Data must be a dict or dict-like object, "
+                f"got {type(data).__name__}"
+            )
+        db_key = self._key(key)
+        record = self._record(db_key)
+        value = json.dumps(data, ensure_ascii=False) if data else None
+        if record[1] == value:
+            self.skipped_writes += 1
+            return
+
+        record[1] = value
+        self.writes += 1
+        if value is None:
+            self.database.delete(DATA_NAMESPACE, db_key)
+        else:
+            self.database.put(DATA_NAMESPACE, db_key, value)
+
+    async def get_data(self, key):
+        data = self._record(self._key(key))[1]
+        return json.loads(data) if data else {}
+
+    def stats(self):
+        return {
+            "cached": len(self._cache),
+            "writes": self.writes,
+            "skipped_writes": self.skipped_writes,
+        }
+
+    async def close(self):
+        self.database.flush()
+
+
+# Глобальный экземпляр
+fsm_storage = SQLiteStorage()
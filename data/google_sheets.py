@@ -5,43 +5,83 @@ import gspread
 from google.oauth2.service_account import Credentials
 
 from config import GOOGLE_SHEETS_CREDENTIALS, SPREADSHEET_ID
+from data.results_index import ResultsIndex
+from data.sheets_scheduler import is_quota_error
 
 # Настройки
 SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+# Доступ только на чтение (проверка результатов, см. data.verify_results)
+READ_ONLY_SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
 SERVICE_ACCOUNT_FILE = GOOGLE_SHEETS_CREDENTIALS
 SPREADSHEET_ID = SPREADSHEET_ID
 
 logger = logging.getLogger("bot_logger")
 
+# Заголовки листа результатов
+EXPECTED_HEADERS = [
+    "ID",
+    "Timestamp",
+    "Chat ID",
+    "First Name",
+    "Last Name",
+    "Educational Institution",
+    "Correct Answers",
+    "Total Questions",
+    "Percentage",
+    "Grade",
+    "Response Time",
+    "Content Version",
+    "Seed",
+    "Answers",
+]
+
 
 class GoogleSheetsManager:
     def __init__(self):
+        # Подключение выполняется лениво, после запуска бота
+        # (см. AsyncSheetsManager.start)
         self.client = None
         self.sheet = None
-        self.connect()
+        self.results_index = ResultsIndex()
+
+    def connect(self, read_only=False):
+        """Подключение к Google Таблицам. Возвращает успешность.
 
-    def connect(self):
-        """Подключение к Google Таблицам."""
+        С ``read_only=True`` токен выдаётся только на чтение, а заголовки
+        не проверяются и не исправляются - лист не может быть изменён.
+        """
         try:
             creds = Credentials.from_service_account_file(
-                SERVICE_ACCOUNT_FILE, scopes=SCOPES
+                SERVICE_ACCOUNT_FILE,
+                scopes=READ_ONLY_SCOPES if read_only else SCOPES,
             )
             self.client = gspread.authorize(creds)
 
             # Используем ID таблицы вместо названия
-            self.sheet = self.client.open_by_key(SPREADSHEET_ID).sheet1
+            self.attach(self.client.open_by_key(SPREADSHEET_ID).sheet1,
+                        repair_headers=not read_only)
             logger.info("✅ Успешное подключение к Google Таблицам")
 
-            # Проверяем и исправляем заголовки при подключении
-            self._ensure_headers()
-
         except gspread.SpreadsheetNotFound:
             logger.error(f"❌ Таблица с ID '{SPREADSHEET_ID}' не найдена")
             logger.error("Проверьте ID таблицы и доступ сервисного аккаунта")
             self.sheet = None
         except Exception as e:
-            logger.error(f"❌ Ошибка подключения к Google Таблицам: {e}")
             self.sheet = None
+            if is_quota_error(e):
+                raise  # Повтор выполнит планировщик запросов
+            logger.error(f"❌ Ошибка подключения к Google Таблицам: {e}")
+
+        return self.sheet is not None
+
+    def attach(self, sheet, repair_headers=True):
+        """Подключение к уже открытому листу (например, FakeWorksheet)."""
+        self.sheet = sheet
+        self.results_index.reset()
+
+        # Проверяем и исправляем заголовки при подключении
+        if repair_headers:
+            self._ensure_headers()
 
     def _ensure_headers(self):
         """Проверка и создание правильных заголовков"""
@@ -52,19 +92,17 @@ class GoogleSheetsManager:
             # Получаем первую строку
             first_row = self.sheet.row_values(1)
 
-            # Ожидаемые заголовки
-            expected_headers = [
-                "ID",
-                "Timestamp",
-                "Chat ID",
-                "First Name",
-                "Last Name",
-                "Educational Institution",
-                "Correct Answers",
-                "Total Questions",
-                "Percentage",
-                "Grade",
-            ]
+            expected_headers = EXPECTED_HEADERS
+
+            # Таблица из прошлой версии: дописываем новые колонки,
+            # не трогая сохранённые результаты
+            if first_row and first_row == expected_headers[:len(first_row)]:
+                for col in range(len(first_row), len(expected_headers)):
+                    self.sheet.update_cell(1, col + 1, expected_headers[col])
+                    logger.info(
+                        f"📝 Добавлена колонка '{expected_headers[col]}'"
+                    )
+                first_row = expected_headers
 
             # Если первая строка пустая или не совпадает с
             # ожидаемыми заголовками
@@ -72,29 +110,21 @@ class GoogleSheetsManager:
                 logger.info("📝 Создаем правильные заголовки в таблице...")
                 self.sheet.clear()  # Очищаем лист
                 self.sheet.append_row(expected_headers)  # Добавляем заголовки
+                self.results_index.reset()
                 logger.info("✅ Заголовки созданы успешно")
             else:
                 logger.info("✅ Заголовки уже настроены правильно")
 
         except Exception as e:
+            if is_quota_error(e):
+                raise  # Подключение повторится целиком
             logger.error(f"❌ Ошибка настройки заголовков: {e}")
 
     def _get_clean_records(self):
         """Получение записей с обработкой дублирующихся заголовков"""
         try:
             # Используем явное указание заголовков
-            expected_headers = [
-                "ID",
-                "Timestamp",
-                "Chat ID",
-                "First Name",
-                "Last Name",
-                "Educational Institution",
-                "Correct Answers",
-                "Total Questions",
-                "Percentage",
-                "Grade",
-            ]
+            expected_headers = EXPECTED_HEADERS
 
             # Получаем все данные начиная со второй строки
             all_data = self.sheet.get_all_values()
@@ -122,6 +152,8 @@ class GoogleSheetsManager:
             return records
 
         except Exception as e:
+            if is_quota_error(e):
+                raise  # Повтор выполнит планировщик запросов
             logger.error(f"❌ Ошибка получения записей: {e}")
             return []
 
@@ -134,9 +166,9 @@ class GoogleSheetsManager:
         try:
             timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            # Получаем следующий ID
-            records = self._get_clean_records()
-            next_id = len(records) + 1
+            # Получаем следующий ID (дочитываем только новые Chat ID)
+            self.results_index.sync_chat_ids(self.sheet)
+            next_id = self.results_index.row_count + 1
 
             # Рассчет процента и оценки
             correct_answers = user_data["correct_answers"]
@@ -155,6 +187,10 @@ class GoogleSheetsManager:
                 total_questions,
                 f"{percentage}%",
                 grade,
+                user_data.get("response_time", ""),
+                user_data.get("content_version", ""),
+                user_data.get("seed", ""),
+                user_data.get("answers", ""),
             ]
 
             # Добавляем строку в конец таблицы
@@ -166,6 +202,8 @@ class GoogleSheetsManager:
             return True
 
         except Exception as e:
+            if is_quota_error(e):
+                raise  # Повтор выполнит планировщик запросов
             logger.error(f"❌ Ошибка сохранения в Google Таблицы: {e}")
             return False
 
@@ -186,14 +224,11 @@ class GoogleSheetsManager:
             return False
 
         try:
-            records = self._get_clean_records()
-            for record in records:
-                if record.get(
-                  "Chat ID"
-                 ) and str(record["Chat ID"]) == str(chat_id):
-                    return True
-            return False
+            self.results_index.sync_chat_ids(self.sheet)
+            return str(chat_id) in self.results_index.chat_ids
         except Exception as e:
+            if is_quota_error(e):
+                raise  # Повтор выполнит планировщик запросов
             logger.error(f"❌ Ошибка проверки завершения режима: {e}")
             return False
 
@@ -201,10 +236,45 @@ class GoogleSheetsManager:
         """Получение всех результатов из таблицы"""
         return self._get_clean_records()
 
+    def get_leaderboard_records(self):
+        """Получение имён и баллов участников для таблицы лидеров"""
+        if self.sheet is None:
+            return []
+
+        try:
+            return [
+                {
+                    "First Name": first_name,
+                    "Last Name": last_name,
+                    "Correct Answers": correct,
+                    "Response Time": seconds,
+                }
+                for first_name, last_name, correct, seconds
+                in self.results_index.sync_scores(self.sheet)
+            ]
+        except Exception as e:
+            if is_quota_error(e):
+                raise  # Повтор выполнит планировщик запросов
+            logger.error(f"❌ Ошибка получения таблицы лидеров: {e}")
+            return []
+
+    def get_cached_leaderboard_records(self):
+        """Последние прочитанные данные таблицы лидеров (без запросов)"""
+        return [
+            {
+                "First Name": first_name,
+                "Last Name": last_name,
+                "Correct Answers": correct,
+                "Response Time": seconds,
+            }
+            for first_name, last_name, correct, seconds
+            in self.results_index.cached_scores()
+        ]
+
     def get_statistics(self):
         """Получение статистики по результатам"""
         try:
-            results = self.get_all_results()
+            results = self.get_leaderboard_records()
             if not results:
                 return {
                     "total_participants": 0,
@@ -238,6 +308,8 @@ class GoogleSheetsManager:
                 "best_score": best_score,
             }
         except Exception as e:
+            if is_quota_error(e):
+                raise  # Повтор выполнит планировщик запросов
             logger.error(f"❌ Ошибка получения статистики: {e}")
             return {"total_participants": 0, "average_score": 0,
                     "best_score": 0}
@@ -0,0 +1,88 @@
+import threading
+
+# Колонки листа результатов (нумерация строк с 1, первая строка - заголовки)
+CHAT_ID_COLUMN = "C"
+NAME_COLUMNS = ("D", "E")
+SCORE_COLUMN = "G"
+TIME_COLUMN = "K"
+
+
+class ResultsIndex:
+    """Локальный индекс листа результатов с дельта-синхронизацией.
+
+    Вместо ``get_all_values()`` каждый сценарий читает только нужные ему
+    колонки и только строки, добавленные с прошлой синхронизации:
+    проверка прохождения - колонку Chat ID, таблица лидеров - имя,
+    фамилию, число правильных ответов и время ответов. Объём
+    передаваемых данных не растёт вместе с числом участников.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """Сброс индекса (после очистки таблицы или переподключения)."""
+        with self._lock:
+            self.chat_ids = set()
+            # (имя, фамилия, правильные ответы, время в секундах или None)
+            self.scores = []
+            # Номер последней прочитанной строки для каждой группы колонок
+            self._chat_id_row = 1
+            self._score_row = 1
+
+    @property
+    def row_count(self):
+        """Количество прочитанных строк с данными (без заголовков)."""
+        return self._chat_id_row - 1
+
+    def cached_scores(self):
+        """Копия уже прочитанных строк таблицы лидеров."""
+        with self._lock:
+            return list(self.scores)
+
+    def sync_chat_ids(self, sheet):
+        """Дочитывает новые значения колонки Chat ID."""
+        with self._lock:
+            start = self._chat_id_row + 1
+            values = sheet.get(f"{CHAT_ID_COLUMN}{start}:{CHAT_ID_COLUMN}")
+            for row in values:
+                if row and row[0]:
+                    self.chat_ids.add(str(row[0]))
+            self._chat_id_row += len(values)
+
+    def sync_scores(self, sheet):
+        """Дочитывает новые строки для таблицы лидеров."""
+        with self._lock:
+            start = self._score_row + 1
+            first, last = NAME_COLUMNS
+            names, scores, times = sheet.batch_get(
+                [
+                    f"{first}{start}:{last}",
+                    f"{SCORE_COLUMN}{start}:{SCORE_COLUMN}",
+                    f"{TIME_COLUMN}{start}:{TIME_COLUMN}",
+                ]
+            )
+            # Пустые хвосты диапазонов API обрезает, выравниваем по длине
+            count = max(len(names), len(scores))
+            for i in range(count):
+                name_row = names[i] if i < len(names) else []
+                score_row = scores[i] if i < len(scores) else []
+                time_row = times[i] if i < len(times) else []
+                if not any(name_row) and not any(score_row):
+                    continue  # Пропускаем полностью пустые строки
+
+                first_name = name_row[0] if len(name_row) > 0 else ""
+                last_name = name_row[1] if len(name_row) > 1 else ""
+                try:
+                    correct = int(score_row[0]) if score_row else 0
+                except (ValueError, TypeError):
+                    correct = 0
+                try:
+                    # Результаты до появления таймера времени не имеют
+                    seconds = float(time_row[0]) if time_row else None
+                except (ValueError, TypeError):
+                    seconds = None
+                self.scores.append((first_name, last_name, correct, seconds))
+            self._score_row += count
+            return list(self.scores)
@@ -0,0 +1,219 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+
+logger = logging.getLogger("bot_logger")
+
+SESSIONS_DB = "sessions.db"
+# Период записи накопленных изменений на диск (в секундах)
+FLUSH_INTERVAL = 1.0
+
+_UPSERT_SQL = (
+    "INSERT INTO sessions (namespace, key, value, updated) "
+    "VALUES (?, ?, ?, ?) "
+    "ON CONFLICT (namespace, key) DO UPDATE SET "
+    "value = excluded.value, updated = excluded.updated"
+)
+_DELETE_SQL = "DELETE FROM sessions WHERE namespace = ? AND key = ?"
+
+
+class SessionDatabase:
+    """Постоянное хранилище сессий на SQLite (режим WAL).
+
+    Записи не идут на диск сразу: ``put``/``delete`` только запоминают
+    последнее значение ключа, а ``flush`` записывает все накопленные
+    изменения одной транзакцией. Несколько изменений одного ключа между
+    сбросами превращаются в одну запись.
+
+    ``_lock`` защищает только словари изменений и никогда не держится
+    во время записи на диск: ``flush`` забирает накопленное под замком
+    (оно остаётся видимым для ``get`` как "записываемое") и пишет его
+    через отдельное соединение. Чтение из цикла событий идёт через своё
+    соединение - в режиме WAL запись его не блокирует.
+    """
+
+    def __init__(self, path=SESSIONS_DB):
+        self.path = path
+        self._conn = None
+        self._writer = None
+        self._lock = threading.Lock()
+        # Сбросы выполняются строго по одному
+        self._flush_lock = threading.Lock()
+        # (пространство имён, ключ) -> (значение, время) или None для удаления
+        self._pending = {}
+        # Изменения, которые сейчас записывает ``flush``
+        self._inflight = {}
+        self.flushes = 0
+        self.rows_written = 0
+
+    def _open(self):
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                namespace TEXT NOT NULL,
+                key TEXT NOT NULL,
+                value BLOB NOT NULL,
+                updated REAL NOT NULL,
+                PRIMARY KEY (namespace, key)
+            ) WITHOUT ROWID
+            """
+        )
+        conn.commit()
+        return conn
+
+    def _connection(self):
+        """Соединение для чтения (цикл событий)."""
+        if self._conn is None:
+            self._conn = self._open()
+        return self._conn
+
+    def _writer_connection(self):
+        """Соединение для записи (поток ``flush``/``purge``)."""
+        if self._writer is None:
+            self._writer = self._open()
+        return self._writer
+
+    def _unwritten(self, pending_key):
+        """Ещё не записанное изменение ключа: (есть ли, значение)."""
+        with self._lock:
+            for changes in (self._pending, self._inflight):
+                if pending_key in changes:
+                    item = changes[pending_key]
+                    return True, None if item is None else item[0]
+        return False, None
+
+    def get(self, namespace, key, max_age=None):
+        """Чтение значения с учётом ещё не записанных изменений."""
+        pending_key = (namespace, str(key))
+        found, value = self._unwritten(pending_key)
+        if found:
+            return value
+
+        row = self._connection().execute(
+            "SELECT value, updated FROM sessions "
+            "WHERE namespace = ? AND key = ?",
+            pending_key,
+        ).fetchone()
+        if row is None:
+            return None
+        value, updated = row
+        if max_age is not None and updated < time.time() - max_age:
+            self.delete(namespace, key)
+            return None
+        return value
+
+    def items(self, namespace):
+        """Все пары (ключ, значение) пространства имён."""
+        rows = dict(
+            self._connection().execute(
+                "SELECT key, value FROM sessions WHERE namespace = ?",
+                (namespace,),
+            ).fetchall()
+        )
+        with self._lock:
+            # Сначала записываемые, затем более новые накопленные
+            for changes in (self._inflight, self._pending):
+                for (pending_namespace, key), item in changes.items():
+                    if pending_namespace != namespace:
+                        continue
+                    if item is None:
+                        rows.pop(key, None)
+                    else:
+                        rows[key] = item[0]
+        return list(rows.items())
+
+    def put(self, namespace, key, value):
+        """Отложенная запись значения."""
+        with self._lock:
+            self._pending[(namespace, str(key))] = (value, time.time())
+
+    def delete(self, namespace, key):
+        """Отложенное удаление значения."""
+        with self._lock:
+            self._pending[(namespace, str(key))] = None
+
+    @property
+    def pending(self):
+        return len(self._pending)
+
+    def flush(self):
+        """Запись накопленных изменений одной транзакцией."""
+        with self._flush_lock:
+            with self._lock:
+                if not self._pending:
+                    return 0
+                pending, self._pending = self._pending, {}
+                self._inflight = pending
+
+            upserts = []
+            deletes = []
+            for (namespace, key), item in pending.items():
+                if item is None:
+                    deletes.append((namespace, key))
+                else:
+                    upserts.append((namespace, key, item[0], item[1]))
+
+            # Запись идёт без _lock: put/get в цикле событий не ждут диска
+            conn = self._writer_connection()
+            try:
+                with conn:
+                    conn.executemany(_UPSERT_SQL, upserts)
+                    conn.executemany(_DELETE_SQL, deletes)
+            except sqlite3.Error:
+                # Возвращаем изменения в очередь, не затирая более новые
+                with self._lock:
+                    for pending_key, item in pending.items():
+                        self._pending.setdefault(pending_key, item)
+                    self._inflight = {}
+                raise
+            with self._lock:
+                self._inflight = {}
+            self.flushes += 1
+            self.rows_written += len(pending)
+            return len(pending)
+
+    def purge(self, namespace, max_age):
+        """Удаление записей, не обновлявшихся дольше ``max_age`` секунд."""
+        with self._flush_lock:
+            conn = self._writer_connection()
+            with conn:
+                conn.execute(
+                    "DELETE FROM sessions WHERE namespace = ? AND updated < ?",
+                    (namespace, time.time() - max_age),
+                )
+
+    async def run_flusher(self, interval=FLUSH_INTERVAL):
+        """Фоновая периодическая запись изменений на диск."""
+        while True:
+            await asyncio.sleep(interval)
+            if self._pending:
+                try:
+                    await asyncio.to_thread(self.flush)
+                except Exception as e:
+                    logger.error(f"❌ Ошибка записи сессий на диск: {e}")
+
+    def close(self):
+        """Запись оставшихся изменений и закрытие базы."""
+        try:
+            self.flush()
+        finally:
+            for conn in (self._conn, self._writer):
+                if conn is not None:
+                    conn.close()
+            self._conn = self._writer = None
+
+    def stats(self):
+        return {
+            "pending": len(self._pending),
+            "flushes": self.flushes,
+            "rows_written": self.rows_written,
+        }
+
+
+# Глобальный экземпляр
+session_db = SessionDatabase()
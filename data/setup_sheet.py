@@ -51,6 +51,10 @@ def setup_spreadsheet():
                 "Total Questions",
                 "Percentage",
                 "Grade",
+                "Response Time",
+                "Content Version",
+                "Seed",
+                "Answers",
             ]
 
             sheet.append_row(headers)
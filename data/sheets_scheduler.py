@@ -0,0 +1,165 @@
+import asyncio
+import itertools
+import logging
+import random
+import time
+
+logger = logging.getLogger("bot_logger")
+
+# Приоритеты запросов: запись результатов важнее чтения
+WRITE_PRIORITY = 0
+READ_PRIORITY = 1
+
+# Квота Sheets API - 60 запросов в минуту на пользователя
+REQUESTS_PER_MINUTE = 60
+BUCKET_CAPACITY = 10
+MAX_RETRIES = 5
+BASE_BACKOFF = 1.0
+MAX_BACKOFF = 32.0
+
+
+def is_quota_error(error):
+    """Проверка, что ошибка API означает превышение квоты (HTTP 429)."""
+    code = getattr(error, "code", None)
+    if code is None:
+        response = getattr(error, "response", None)
+        code = getattr(response, "status_code", None)
+    return code == 429
+
+
+class TokenBucket:
+    """Ведро токенов: не больше ``rate`` запросов в секунду с запасом
+    ``capacity`` на короткие всплески."""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self._updated = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self, cost=1):
+        """Ожидание, пока в ведре не наберётся ``cost`` токенов."""
+        cost = min(cost, self.capacity)
+        while True:
+            self._refill()
+            if self.tokens >= cost:
+                self.tokens -= cost
+                return
+            await asyncio.sleep((cost - self.tokens) / self.rate)
+
+
+class SheetsScheduler:
+    """Единая очередь всех запросов к Google Таблицам.
+
+    Запросы выполняются по приоритету (запись раньше чтения) и проходят
+    через общее ведро токенов. При ответе 429 очередь приостанавливается
+    с экспоненциальной задержкой, а запрос возвращается в очередь и
+    повторяется, вместо того чтобы молча вернуть пустой результат.
+    """
+
+    def __init__(self, executor, workers,
+                 requests_per_minute=REQUESTS_PER_MINUTE,
+                 capacity=BUCKET_CAPACITY, max_retries=MAX_RETRIES):
+        self._executor = executor
+        self._workers_count = workers
+        self._workers = []
+        self._queue = None
+        self._seq = itertools.count()
+        self._paused_until = 0.0
+        self.bucket = TokenBucket(requests_per_minute / 60, capacity)
+        self.max_retries = max_retries
+
+        # Счётчики для мониторинга
+        self.throttled = 0
+        self.retries = 0
+        self.failed = 0
+        self.in_flight = 0
+
+    def _ensure_workers(self):
+        """Ленивый запуск обработчиков очереди в текущем цикле событий."""
+        if self._queue is None:
+            self._queue = asyncio.PriorityQueue()
+        self._workers = [task for task in self._workers if not task.done()]
+        while len(self._workers) < self._workers_count:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def submit(self, func, *args, priority=READ_PRIORITY, cost=1,
+                     timeout=None):
+        """Постановка блокирующего вызова в очередь и ожидание результата."""
+        self._ensure_workers()
+        future = asyncio.get_running_loop().create_future()
+        job = (func, args, cost, timeout, future, 0)
+        await self._queue.put((priority, next(self._seq), job))
+        return await future
+
+    def _backoff(self, attempt):
+        delay = min(MAX_BACKOFF, BASE_BACKOFF * 2 ** attempt)
+        return delay + random.uniform(0, delay / 2)
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            priority, seq, job = await self._queue.get()
+            func, args, cost, timeout, future, attempt = job
+            try:
+                if future.done():
+                    continue  # Вызывающий уже не ждёт результата
+
+                pause = self._paused_until - time.monotonic()
+                if pause > 0:
+                    await asyncio.sleep(pause)
+                await self.bucket.acquire(cost)
+
+                self.in_flight += 1
+                try:
+                    result = await asyncio.wait_for(
+                        loop.run_in_executor(self._executor, func, *args),
+                        timeout=timeout,
+                    )
+                finally:
+                    self.in_flight -= 1
+                if not future.done():
+                    future.set_result(result)
+
+            except Exception as e:
+                if is_quota_error(e) and attempt < self.max_retries:
+                    self.throttled += 1
+                    self.retries += 1
+                    delay = self._backoff(attempt)
+                    self._paused_until = max(
+                        self._paused_until, time.monotonic() + delay
+                    )
+                    logger.warning(
+                        f"⚠️ Квота Google Таблиц превышена, повтор "
+                        f"{func.__name__} через {delay:.1f} с"
+                    )
+                    # Сохраняем исходный порядковый номер запроса
+                    await self._queue.put(
+                        (priority, seq,
+                         (func, args, cost, timeout, future, attempt + 1))
+                    )
+                else:
+                    if is_quota_error(e):
+                        self.throttled += 1
+                    self.failed += 1
+                    if not future.done():
+                        future.set_exception(e)
+            finally:
+                self._queue.task_done()
+
+    def stats(self):
+        """Текущее состояние очереди запросов."""
+        return {
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "in_flight": self.in_flight,
+            "throttled": self.throttled,
+            "retries": self.retries,
+            "failed": self.failed,
+        }
@@ -0,0 +1,159 @@
+"""Проверка результатов соревновательного режима.
+
+Для каждой строки листа результатов набор вопросов восстанавливается по
+зерну (колонка "Seed") из банка той версии контента, на которой прошла
+викторина, ответы из колонки "Answers" проверяются заново, и полученный
+счёт сравнивается с записанным.
+
+Запуск из корня проекта:
+
+    python -m data.verify_results
+    python -m data.verify_results --csv results.csv --content old.json
+
+Без ``--csv`` результаты читаются из Google Таблицы. ``--content`` можно
+указать несколько раз, чтобы проверить строки прошлых версий контента;
+версии, для которых файл не указан, берутся из архива data/cache.
+Завершается с кодом 1, если найдены расхождения.
+"""
+import argparse
+import csv
+import sys
+import time
+
+from configurations.question_bank import seeded_draw
+from configurations.quiz_session import decode_answers
+from data.content import CONTENT_FILE, load_content, read_archive
+
+# Итоги проверки строки
+VERIFIED = "verified"
+MISMATCH = "mismatch"
+INVALID = "invalid"
+NO_SEED = "no_seed"
+UNKNOWN_VERSION = "unknown_version"
+
+TITLES = {
+    VERIFIED: "✅ Совпадает",
+    MISMATCH: "❌ Расхождение",
+    INVALID: "⚠️ Повреждена строка",
+    NO_SEED: "⏭️ Без зерна (старые записи)",
+    UNKNOWN_VERSION: "⏭️ Нет файла версии контента",
+}
+
+
+def find_bank(banks, version):
+    """Банк версии из ``banks`` или из архива версий (запоминается)."""
+    if version not in banks:
+        content = read_archive(version)
+        banks[version] = content.bank if content is not None else None
+    return banks[version]
+
+
+def replay(bank, seed, answers):
+    """Счёт по зерну и ответам; ValueError, если ответ не подходит."""
+    draw = seeded_draw(seed, len(bank), len(answers))
+    if len(draw) != len(answers):
+        raise ValueError("Ответов больше, чем вопросов в банке")
+    score = 0
+    for (qid, _), option in zip(draw, answers):
+        question = bank[qid]
+        if option >= len(question.options):
+            raise ValueError(f"Нет варианта {option} у вопроса {qid}")
+        if option == question.correct:
+            score += 1
+    return score
+
+
+def verify_record(record, banks):
+    """Проверка одной строки: (итог, пояснение)."""
+    seed = record.get("Seed")
+    if not seed:
+        return NO_SEED, ""
+    try:
+        version = int(record["Content Version"])
+        seed = int(seed)
+        answers = decode_answers(record.get("Answers", ""))
+        correct = int(record["Correct Answers"])
+        total = int(record["Total Questions"])
+    except (KeyError, TypeError, ValueError) as e:
+        return INVALID, str(e)
+
+    bank = find_bank(banks, version)
+    if bank is None:
+        return UNKNOWN_VERSION, f"версия {version}"
+    if len(answers) != total:
+        return MISMATCH, f"ответов {len(answers)}, записано вопросов {total}"
+    try:
+        score = replay(bank, seed, answers)
+    except ValueError as e:
+        return INVALID, str(e)
+    if score != correct:
+        return MISMATCH, f"пересчитано {score}, записано {correct}"
+    return VERIFIED, ""
+
+
+def verify_records(records, banks):
+    """Проверка всех строк: счётчики итогов и список расхождений."""
+    counts = dict.fromkeys(TITLES, 0)
+    problems = []
+    for record in records:
+        status, detail = verify_record(record, banks)
+        counts[status] += 1
+        if status in (MISMATCH, INVALID):
+            problems.append((record, status, detail))
+    return counts, problems
+
+
+def read_csv(path):
+    with open(path, encoding="utf-8", newline="") as file:
+        return list(csv.DictReader(file, restval=""))
+
+
+def read_sheet():
+    """Строки листа результатов из Google Таблицы (только чтение)."""
+    from data.google_sheets import GoogleSheetsManager
+
+    manager = GoogleSheetsManager()
+    # Проверка не должна менять проверяемые данные: без исправления
+    # заголовков и с токеном только на чтение
+    if not manager.connect(read_only=True):
+        raise SystemExit("❌ Не удалось подключиться к Google Таблице")
+    return manager.get_all_results()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--csv", help="Выгрузка листа результатов в CSV")
+    parser.add_argument("--content", action="append",
+                        help="Файл контента (можно указать несколько раз)")
+    parser.add_argument("--show", type=int, default=20,
+                        help="Сколько расхождений вывести")
+    args = parser.parse_args()
+
+    banks = {}
+    for path in args.content or [CONTENT_FILE]:
+        content = load_content(path)
+        banks[content.version] = content.bank
+
+    records = read_csv(args.csv) if args.csv else read_sheet()
+    started = time.perf_counter()
+    counts, problems = verify_records(records, banks)
+    elapsed = time.perf_counter() - started
+
+    versions = sorted(
+        version for version, bank in banks.items() if bank is not None
+    )
+    print(f"Строк: {len(records)}, версии контента: "
+          f"{', '.join(map(str, versions))}")
+    print(f"Время проверки: {elapsed * 1000:.1f} мс")
+    for status, title in TITLES.items():
+        print(f"  {title}: {counts[status]}")
+    for record, status, detail in problems[:args.show]:
+        print(f"{TITLES[status]}: ID {record.get('ID')}, "
+              f"Chat ID {record.get('Chat ID')}, "
+              f"{record.get('First Name')} {record.get('Last Name')} - "
+              f"{detail}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,7 @@ import asyncio
 from openai import OpenAI                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                                       
 import sqlite3
 from aiogram import Bot, Dispatcher, types, F
-from aiogram.filters.command import Command
+from aiogram.filters.command import Command, CommandObject
 from aiogram.filters.state import StateFilter
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
@@ -15,36 +15,61 @@ from aiogram.types import (
 from configurations.keyboards import get_admin_keyboard
 from storage import admin_IDs
 import storage
+from admin_panel.content_reload import reload_content_button
+from admin_panel.question_report import question_report_button
 from admin_panel.see_statistick import stat_button
 from commands.main_menu_command import show_main_menu
 from commands.start import process_start_command
 from commands.unknown_message import unknown_message
 from config import BOT_TOKEN, GROQ_KEY
+from data.answer_stats import answer_stats
+from data.async_sheets import async_sheets
+from data.content import content_registry
+from data.fsm_storage import fsm_storage
+from data.session_db import session_db
 from configurations.callbacks import (
     handle_hero_quiz_selection,
     handle_heroes_pagination,
     handle_main_menu,
     start_hero_quiz_mode,
 )
+from configurations.callback_data import (
+    QuizAnswerCallback,
+    QuizCancelCallback,
+    RoomAnswerCallback,
+    RoomControlCallback,
+)
+from configurations.delayed_sends import delayed_sends
+from configurations.keyboards import prebuild_keyboards
 from configurations.quiz_manager import HeroQuizStates
+from configurations.quiz_preferences import TRANSPORT_BUTTON_PREFIX
+from configurations.session_store import sweep_sessions
 from logs.logging_setup import setup_logger
-from user_panel.hero_quiz_handler import (
-    cancel_hero_quiz,
-    handle_hero_quiz_answer,
-)
 from user_panel.heroes import heroes_button
 from user_panel.information import information_button
+from user_panel.inline_quiz_handler import (
+    handle_inline_answer,
+    handle_inline_cancel,
+    handle_poll_answer,
+)
 from user_panel.leaderboard import show_leaderboard
+from user_panel.live_room_handler import (
+    handle_room_answer,
+    handle_room_control,
+    join_room,
+    leave_room,
+    open_room_button,
+)
+from user_panel.quiz_engine import cancel_quiz, handle_quiz_answer
 from user_panel.quiz_handler import (
     QuizStates,
-    cancel_quiz,
-    handle_quiz_answer,
     process_educational_info,
     process_first_name,
     process_last_name,
     quiz_button,
     start_competitive_mode,
     start_practice_mode,
+    toggle_quiz_transport,
 )
 
 # Настройка логирования
@@ -52,7 +77,8 @@ logger = setup_logger()
 
 # Инициализация бота и диспетчера
 bot = Bot(token=BOT_TOKEN)
-dp = Dispatcher()
+# Состояния FSM хранятся в SQLite и переживают перезапуск бота
+dp = Dispatcher(storage=fsm_storage)
 
 # ==================== СОСТОЯНИЯ ДЛЯ ИИ ЧАТА ====================
 
@@ -196,6 +222,25 @@ def register_callbacks():
         lambda callback: callback.data.startswith("heroes_page_"),
     )
 
+    # Ответы на вопросы кнопками в сообщении
+    dp.callback_query.register(
+        handle_inline_answer, QuizAnswerCallback.filter()
+    )
+    dp.callback_query.register(
+        handle_inline_cancel, QuizCancelCallback.filter()
+    )
+
+    # Ответы на опросы-викторины
+    dp.poll_answer.register(handle_poll_answer)
+
+    # Комнаты для игры класса: ответы участников и кнопки ведущего
+    dp.callback_query.register(
+        handle_room_answer, RoomAnswerCallback.filter()
+    )
+    dp.callback_query.register(
+        handle_room_control, RoomControlCallback.filter()
+    )
+
     # Выбор викторины по героям
     dp.callback_query.register(
         handle_hero_quiz_selection, HeroQuizStates.choosing_hero_quiz
@@ -232,6 +277,7 @@ async def command_help(message: types.Message):
         "👤 *Узнать о героях* - информация о героях "
         "Великой Отечественной войны\n\n"
         "📊 *Таблица лидеров* - лучшие результаты в соревновательном режиме\n\n"
+        "🏫 *Игра класса* - /join код: вход в комнату, открытую учителем\n\n"
         "⚙️ *Информация о проекте* - общая информация о боте\n\n"
         "🔄 *Назад* - вернуться в главное меню\n\n"
         "📞 *Поддержка:* Если возникли проблемы, обратитесь к администратору."
@@ -239,6 +285,18 @@ async def command_help(message: types.Message):
     await message.answer(help_text, parse_mode="Markdown")
 
 
+@dp.message(Command("join"))
+async def command_join(message: types.Message, command: CommandObject):
+    """Обработчик команды /join - вход в комнату класса по коду."""
+    await join_room(message, command)
+
+
+@dp.message(Command("leave"))
+async def command_leave(message: types.Message):
+    """Обработчик команды /leave - выход из комнаты класса."""
+    await leave_room(message)
+
+
 # ==================== ОБРАБОТЧИКИ ИИ ЧАТА ====================
 
 
@@ -340,6 +398,40 @@ async def stat_handler(message: types.Message, state: FSMContext):
     await stat_button(message)
 
 
+@dp.message(F.text == "📈 Статистика вопросов",
+            StateFilter(ChatState.main_menu))
+async def question_report_handler(message: types.Message, state: FSMContext):
+    """Обработчик кнопки Статистика вопросов."""
+    if message.from_user.id not in admin_IDs:
+        await message.answer("У вас нет доступа к этой команде.")
+        return
+
+    await state.set_state(ChatState.main_menu)
+    await question_report_button(message)
+
+
+@dp.message(F.text == "🔄 Обновить вопросы", StateFilter(ChatState.main_menu))
+async def reload_content_handler(message: types.Message, state: FSMContext):
+    """Обработчик кнопки Обновить вопросы."""
+    if message.from_user.id not in admin_IDs:
+        await message.answer("У вас нет доступа к этой команде.")
+        return
+
+    await state.set_state(ChatState.main_menu)
+    await reload_content_button(message)
+
+
+@dp.message(F.text == "🏫 Открыть комнату", StateFilter(ChatState.main_menu))
+async def open_room_handler(message: types.Message, state: FSMContext):
+    """Обработчик кнопки Открыть комнату."""
+    if message.from_user.id not in admin_IDs:
+        await message.answer("У вас нет доступа к этой команде.")
+        return
+
+    await state.set_state(ChatState.main_menu)
+    await open_room_button(message)
+
+
 @dp.message(F.text == "🎯 Викторина", StateFilter(ChatState.main_menu))
 async def quiz_handler(message: types.Message, state: FSMContext):
     """Обработчик кнопки Викторина - переход к выбору режима."""
@@ -356,10 +448,10 @@ dp.message.register(
     QuizStates.choosing_mode,
 )
 
-dp.message.register(handle_hero_quiz_answer, HeroQuizStates.in_hero_quiz)
+dp.message.register(handle_quiz_answer, HeroQuizStates.in_hero_quiz)
 
 dp.message.register(
-    cancel_hero_quiz,
+    cancel_quiz,
     lambda message: message.text == "⏹️ Назад в меню",
     HeroQuizStates.in_hero_quiz,
 )
@@ -382,6 +474,13 @@ async def competitive_mode_handler(message: types.Message, state: FSMContext):
     await start_competitive_mode(message, state)
 
 
+@dp.message(F.text.startswith(TRANSPORT_BUTTON_PREFIX),
+            QuizStates.choosing_mode)
+async def quiz_transport_handler(message: types.Message, state: FSMContext):
+    """Обработчик переключения способа ответа на вопросы."""
+    await toggle_quiz_transport(message, state)
+
+
 @dp.message(lambda message: message.text == "⏹️ Назад в меню", QuizStates.choosing_mode)
 async def back_to_menu_handler(message: types.Message, state: FSMContext):
     """Обработчик возврата в меню из выбора режима викторины."""
@@ -566,6 +665,30 @@ async def cancel_competitive_quiz_handler(message: types.Message, state: FSMCont
 # ==================== ФУНКЦИИ ЗАПУСКА И ОСТАНОВКИ ====================
 
 
+# Фоновые задачи бота (храним ссылки, чтобы задачи не были удалены GC)
+background_tasks = []
+
+
+async def on_startup(bot: Bot):
+    """Фоновые задачи, запускаемые вместе с поллингом."""
+    # Все клавиатуры строятся один раз и дальше только переиспользуются
+    built = prebuild_keyboards()
+    logger.info(f"Подготовлено клавиатур: {built}")
+    # Подключение к Google Таблицам не задерживает старт бота
+    async_sheets.start()
+    # Фоновая очистка неактивных сессий викторин
+    background_tasks.append(asyncio.create_task(sweep_sessions()))
+    # Пакетная запись сессий и состояний FSM на диск
+    background_tasks.append(asyncio.create_task(session_db.run_flusher()))
+    # Статистика ответов по вопросам: загрузка и периодическая запись
+    answer_stats.load()
+    background_tasks.append(asyncio.create_task(answer_stats.run_flusher()))
+    # Отложенные отправки (первый вопрос викторины после паузы)
+    background_tasks.append(asyncio.create_task(delayed_sends.run(bot)))
+    # Перезагрузка вопросов при изменении data/content.json
+    background_tasks.append(asyncio.create_task(content_registry.watch()))
+
+
 async def main():
     """
     Основная функция запуска бота.
@@ -574,13 +697,17 @@ async def main():
     try:
         # Регистрация callback обработчиков
         register_callbacks()
+        dp.startup.register(on_startup)
         # Запуск бота с разрешенными типами обновлений
         await dp.start_polling(bot, allowed_updates=dp.resolve_used_update_types())
 
     except Exception as e:
         logger.error(f"Критическая ошибка: {e}")
     finally:
-        # Закрытие сессии бота при завершении
+        # Закрытие сессии бота и пула запросов к таблицам при завершении
+        async_sheets.shutdown()
+        answer_stats.flush()
+        session_db.close()
         await bot.session.close()
 
 
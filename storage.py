@@ -1,1723 +1,28 @@
+from data.content import content_registry
+
 # Хранилище данных
 user_chat_ids = set()
 broadcast_mode = False
 admin_IDs = {7950838601}
 
-quiz_questions = [
-    {
-        "question": "Какой подвиг совершил Агадил Сухомбаев?",
-        "options": ["Закрыл собой пулемёт", "Взорвал немцев", "Помогал раненым", "Уничтожил танк"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком селе родился А. Сухомбаев?",
-        "options": ["Колочава", "Карасу", "Канев", "Кабаниха"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Каким ордером был посмертно награждён А. Сухомбаев?",
-        "options": ["Ордером Сталина", "Орденом Брежнева", "Орденом Ленина", "Орденом Багартиона"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где в Гродно находится мемориальная доска А. Сухомбаева?",
-        "options": ["ул. Доватора, 21", "ул. Ленина, 3,", "ул. Сухомбаева, 231", "ул. Сухомбаева, 3"],
-        "correct_answer": 3
-    },
-    {
-        "question": "А. Сухомбаев командовал отделением 628 стрелкого полка 174 стрелковой девизии ??? армии 3 Белорусского фронта.",
-        "options": ["31-ой", "29-ой", "10-ой", "46-ой"],
-        "correct_answer": 0
-    },
-    {
-        "question": "С какого года Агадил Сухомбаев на фронте?",
-        "options": ["С 1942 г.", "С 1941 г.", "С 1945 г.", "С 1940 г."],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем работал А. Сухомбаев после школы?",
-        "options": ["Журналистом", "Командиром армии", "Трактористом", "Учителем"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком городе был похоронен А. Сухомбаев?",
-        "options": ["Гродно", "Вильнюс", "Каунас", "Друскининкай"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Сколько классов закончил А. Сухамбаев?",
-        "options": ["10 классов", "9 классов", "11 классов", "4 класса"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какая школа названа именем А. Сухомбаева?",
-        "options": ["СШ 21", "СШ 16", "СШ 40", "СШ 20"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком звании Антонов получил орден «Победа»?",
-        "options": ["Маршал Советского Союза", "Генерал армии", "Генерал-полковник", "Генерал-лейтенант"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где родился Алексей Антонов?",
-        "options": ["Москва", "Киев", "Гродно", "Минск"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Чем был награждён Антонов за храбрость в Первую Мировую?",
-        "options": ["Орден Св. Георгия", "Орден Св. Анны", "Орден Красного Знамени", "Георгиевский крест"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую должность занял Антонов в Генштабе в 1942 году?",
-        "options": ["Начальник Генштаба", "Заместитель нач. Генштаба", "Начальник штаба фронта", "Координатор фронтов"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Разработкой какой операции Антонов руководил в 1944 году?",
-        "options": ["Курская битва", "Берлинская операция", "Операция «Багратион»", "Сталинградская битва"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько человек разрабатывало план «Багратиона»?",
-        "options": ["Трое", "Пятеро", "Семеро", "Десятеро"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каких конференциях участвовал Антонов?",
-        "options": ["Тегеранская и Потсдам", "Крымская и Потсдам", "Тегеранская и Крымская", "Только Потсдамская"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где находится прах Антонова?",
-        "options": ["Новодевичье кладбище", "Гродно", "Ваганьковское кладбище", "Кремлёвская стена"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Каким орденом, кроме «Победы», был награждён Антонов?",
-        "options": ["Орден «За службу Родине»", "Орден Суворова", "Орден Александра Невского", "Орден Красной Звезды"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что установили в Гродно в 2021 году?",
-        "options": ["Памятник-бюст", "Мемориальная доска", "Названа школа", "Стела"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году родился Михаил Белуш?",
-        "options": ["1925", "1927", "1929", "1931"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Куда была заброшена диверсионная группа Альфреда Курьяна?",
-        "options": ["Налибокская пуща", "Липичанская пуща", "Беловежская пуща", "Березинский заповедник"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой партизанский отряд попал Михаил Белуш?",
-        "options": ["«Октябрь»", "«Первомайский»", "«Красный»", "«Боевой»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько выходов на «рельсовую войну» совершил Белуш?",
-        "options": ["Пять", "Восемь", "Десять", "Двенадцать"],
-        "correct_answer": 1
-    },
-    {
-        "question": "На какую деревню планировалось наступление 15 июня 1944 года?",
-        "options": ["Руда Липичанская", "Зачепичи", "Куписк", "Любачи"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какую реку переходили партизаны во время атаки?",
-        "options": ["Днепр", "Березина", "Неман", "Припять"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что представляло главное препятствие для партизан в деревне?",
-        "options": ["Каменная церковь", "Дот", "Кирпичный завод", "Мост"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какой подвиг совершил Михаил Белуш в бою?",
-        "options": ["Подорвал мост", "Бросился на пулемет", "Захватил знамя", "Взорвал склад"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где был первоначально похоронен Михаил Белуш?",
-        "options": ["В родной деревне", "Около деревни Куписк", "В Лиде", "В Гродно"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какой наградой был посмертно награжден Белуш?",
-        "options": ["Орденом Ленина", "Орденом Отечественной войны", "Орденом Красной Звезды", "Орденом Славы"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько раз боевой путь Болдина пролегал через гродненскую землю?",
-        "options": ["Три", "Четыре", "Пять", "Шесть"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Когда Ивану Болдину присвоили звание генерал-полковника?",
-        "options": ["При освобождении Минска", "Во время боев за Гродно", "При взятии Берлина", "После войны"],
-        "correct_answer": 1
-    },
-    {
-        "question": "За что Иван Болдин был награжден в Первую мировую войну?",
-        "options": ["Орденами Ленина", "Георгиевскими крестами", "Орденами Красного Знамени", "Медалями «За отвагу»"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую должность занимал Болдин в гражданскую войну на белорусской земле?",
-        "options": ["Командир батальона", "Командир дивизии", "Командир полка", "Командующий фронтом"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году Болдин впервые оказался на белорусской земле?",
-        "options": ["1919", "1920", "1921", "1939"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую армию возглавил Болдин летом 1940 года?",
-        "options": ["5-ю армию", "9-ю армию", "50-ю армию", "3-ю армию"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько раз Болдин попадал в окружение во время Великой Отечественной войны?",
-        "options": ["Один", "Два", "Три", "Четыре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какой армией командовал Болдин с ноября 1941 по февраль 1945 года?",
-        "options": ["19-й армией", "50-й армией", "9-й армией", "3-й армией"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где встретил Победу Иван Болдин?",
-        "options": ["В Берлине", "В Вене", "В Праге", "В Варшаве"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какие награды Болдина упомянуты в тексте?",
-        "options": ["Ордена Суворова и Кутузова", "Ордена Ленина и Красного Знамени", "Ордена Отечественной войны", "Все перечисленные"],
-        "correct_answer": 3
-    },
-    {
-        "question": "В каком году улица в Гродно была названа в честь Павла Брикеля?",
-        "options": ["1945", "1965", "1985", "1995"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какое почетное название получила дивизия Брикеля в июле 1944 года?",
-        "options": ["«Гродненская»", "«Лидовская»", "«Белорусская»", "«Неманская»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько километров прошла дивизия Брикеля за 36 дней операции «Багратион»?",
-        "options": ["550 км", "670 км", "770 км", "890 км"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году Павел Брикель начал службу в кавалерии?",
-        "options": ["1918", "1920", "1922", "1924"],
-        "correct_answer": 1
-    },
-    {
-        "question": "С какого года Брикель стал бессменным командиром 6-й гвардейской кавалерийской дивизии?",
-        "options": ["1941", "1942", "1943", "1944"],
-        "correct_answer": 2
-    },
-    {
-        "question": "За сколько дней дивизия преодолела расстояние от Лиды до Гродно?",
-        "options": ["1 день", "3 дня", "5 дней", "7 дней"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Когда был освобожден Гродно?",
-        "options": ["13 июля 1944", "14 июля 1944", "15 июля 1944", "16 июля 1944"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Какое звание получил Брикель за высокое командное мастерство?",
-        "options": ["Герой Советского Союза", "Герой Социалистического Труда", "Заслуженный военный специалист", "Народный герой"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком городе жил Брикель после увольнения в запас?",
-        "options": ["Москве", "Киеве", "Ростове-на-Дону", "Минске"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какие города удостоили Брикеля звания почетного гражданина?",
-        "options": ["Гродно и Минск", "Лида и Вильнюс", "Гродно и Лида", "Минск и Брест"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Как называлась первая подпольная группа в оккупированном Гродно?",
-        "options": ["«Группа дяди Васи»", "«Группа дяди Коли»", "«Группа Николая»", "«Группа Волкова»"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем был Николай Волков по профессии?",
-        "options": ["Врач", "Учитель", "Инженер-строитель", "Военный"],
-        "correct_answer": 2
-    },
-    {
-        "question": "За что Волков был награжден орденом Красной Звезды?",
-        "options": ["За оборону Брестской крепости", "За организацию переправы через Финский залив", "За участие в Сталинградской битве", "За создание подполья"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком месяце 1941 года начала формироваться подпольная группа Волкова?",
-        "options": ["Июне", "Июле", "Августе", "Сентябре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько человек насчитывала группа Волкова к осени 1941 года?",
-        "options": ["8", "12", "16", "20"],
-        "correct_answer": 1
-    },
-    {
-        "question": "По какому принципу была построена конспирация в группе?",
-        "options": ["Пятерок", "Троек", "Двоек", "Десяток"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Когда был арестован Николай Волков?",
-        "options": ["26 декабря 1941", "26 января 1942", "26 февраля 1942", "26 марта 1942"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где были расстреляны подпольщики?",
-        "options": ["В форте №2", "В центре Гродно", "В тюрьме гестапо", "В парке"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой школе Гродно присвоено имя Волкова?",
-        "options": ["СШ №10", "СШ №20", "СШ №35", "СШ №40"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году Волков был внесен в Книгу Славы Гродно?",
-        "options": ["2010", "2015", "2016", "2020"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какой подвиг совершил Андрей Данилов в небе над Гродненщиной?",
-        "options": ["Первый воздушный таран", "Сбил 10 самолетов за день", "Спас командира полка", "Провел ночной бой"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году Андрей Данилов окончил Оренбургскую школу летчиков?",
-        "options": ["1930", "1933", "1935", "1940"],
-        "correct_answer": 1
-    },
-    {
-        "question": "На каком самолете летал Данилов во время подвига?",
-        "options": ["И-16", "И-153 «Чайка»", "Як-1", "ЛаГГ-3"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько вражеских самолетов сбил Данилов в том бою до тарана?",
-        "options": ["1", "2", "3", "4"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Кто спас раненого Данилова после тарана?",
-        "options": ["Однополчане", "Партизаны", "Жители деревни Черлена", "Медсестры с фронта"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какой наградой был первоначально награжден Данилов посмертно?",
-        "options": ["Орден Ленина", "Орден Красного Знамени", "Звание Героя Советского Союза", "Орден Отечественной войны"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком звании Данилов вышел в запас?",
-        "options": ["Гвардии майор", "Гвардии подполковник", "Гвардии полковник", "Гвардии капитан"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Данилову было присвоено звание Героя Советского Союза?",
-        "options": ["В 1941 году", "В 1945 году", "Уже в мирное время", "Посмертно в 1998 году"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Когда улица в Гродно была названа именем Данилова?",
-        "options": ["1964", "1998", "2010", "2013"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Где жил Данилов после выхода в запас?",
-        "options": ["В Гродно", "В Москве", "В Аткарске", "В Оренбурге"],
-        "correct_answer": 2
-    },
-    {
-        "question": "За голову какого советского командира немецкое командование назначило награду в 100 тысяч рейхсмарок?",
-        "options": ["Льва Доватора", "Ивана Панфилова", "Виктора Талалихина", "Георгия Жукова"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком звании встретил начало войны Лев Доватор?",
-        "options": ["Полковник", "Генерал-майор", "Майор", "Подполковник"],
-        "correct_answer": 0
-    },
-    {
-        "question": "За что Доватор был награжден орденом Красного Знамени в августе 1941 года?",
-        "options": ["За оборону Москвы", "За бои на Соловьевской переправе", "За рейд по тылам врага", "За освобождение Гродно"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое соединение возглавил Доватор в ноябре 1941 года?",
-        "options": ["3-й кавалерийский корпус", "36-ю кавалерийскую дивизию", "2-ю гвардейскую дивизию", "5-ю танковую бригаду"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где погиб Лев Доватор?",
-        "options": ["Под Москвой", "Под Сталинградом", "Под Ленинградом", "Под Киевом"],
-        "correct_answer": 0
-    },
-    {
-        "question": "С кем похоронен Доватор в одной могиле?",
-        "options": ["С Жуковым и Рокоссовским", "С Панфиловым и Талалихиным", "С Ватутиным и Черняховским", "С Коневым и Малиновским"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Когда Доватору присвоили звание Героя Советского Союза?",
-        "options": ["В день гибели", "Через два дня после гибели", "Через месяц после гибели", "В 1945 году"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где находится могила Доватора?",
-        "options": ["В Кремлевской стене", "На Новодевичьем кладбище", "На Мамаевом кургане", "В родном селе"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое прозвище получила батарея капитана Флерова, с которой сотрудничал Доватор?",
-        "options": ["«Катюши»", "«Ванюши»", "«Светланы»", "«Гаубицы»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой корпус был переименован в гвардейский под командованием Доватора?",
-        "options": ["3-й кавалерийский", "5-й стрелковый", "7-й танковый", "9-й механизированный"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Кем был Константин Заслонов до войны по профессии?",
-        "options": ["Учителем", "Железнодорожником", "Врачом", "Военным"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую диверсионную тактику применяла группа Заслонова?",
-        "options": ["«Рельсовые мины»", "«Угольные мины»", "«Водяные мины»", "«Песочные мины»"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько паровозов подорвала группа Заслонова за три месяца?",
-        "options": ["93", "73", "53", "33"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году Заслонов организовал партизанский отряд?",
-        "options": ["1941", "1942", "1943", "1944"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где погиб Константин Заслонов?",
-        "options": ["В Орше", "В Витебске", "У деревни Куповать", "В Смоленске"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какое звание было присвоено Заслонову посмертно?",
-        "options": ["Герой Советского Союза", "Герой Социалистического Труда", "Генерал-майор", "Полковник"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько орденов Ленина получил Заслонов?",
-        "options": ["Один", "Два", "Три", "Четыре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что названо именем Заслонова в Минске?",
-        "options": ["Техникум", "Паровозное депо", "Детская железная дорога", "Вокзал"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком городе установлен памятник Заслонову на привокзальной площади?",
-        "options": ["В Орше", "В Гродно", "В Осташкове", "В Витебске"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что отсутствует на улице Заслонова в Гродно?",
-        "options": ["Памятник", "Мемориальная доска", "Название улицы", "Парк"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком возрасте Георгий Захаров стал начальником штаба Уральского военного округа?",
-        "options": ["28 лет", "32 года", "35 лет", "40 лет"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую должность занимал Захаров в начале Великой Отечественной войны?",
-        "options": ["Начальник штаба 22-й армии", "Командующий Брянским фронтом", "Начальник Генштаба", "Командир дивизии"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В какой операции участвовал Захаров как начальник штаба Брянского фронта?",
-        "options": ["Курская битва", "Орловско-Брянская операция", "Сталинградская битва", "Берлинская операция"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Когда Захаров вступил в командование 2-м Белорусским фронтом?",
-        "options": ["7 июня 1944", "22 июня 1944", "1 июля 1944", "15 июля 1944"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой город освободили войска Захарова 16 июля 1944 года?",
-        "options": ["Минск", "Брест", "Гродно", "Витебск"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько орденов Красного Знамени получил Захаров?",
-        "options": ["Два", "Три", "Четыре", "Пять"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какое воинское звание имел Захаров к концу войны?",
-        "options": ["Генерал-лейтенант", "Генерал-полковник", "Генерал армии", "Маршал"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году была установлена памятная доска Захарову в Гродно?",
-        "options": ["1965", "1970", "1975", "1980"],
-        "correct_answer": 2
-    },
-    {
-        "question": "На каком кладбище похоронен Георгий Захаров?",
-        "options": ["Новодевичьем", "Ваганьковском", "В Кремлёвской стене", "В родном селе"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какую реку форсировала 4-я гвардейская армия под командованием Захарова?",
-        "options": ["Днепр", "Волга", "Дунай", "Висла"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Кем был Сергей Зернов в годы войны?",
-        "options": ["Командир пехотного полка", "Командир артиллерийского полка", "Командир танковой бригады", "Летчик-истребитель"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Сергей Зернов начал службу в Красной Армии?",
-        "options": ["1933", "1935", "1937", "1939"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько ранений получил Зернов за время войны?",
-        "options": ["Одно", "Два", "Три", "Четыре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое почетное наименование получил полк под командованием Зернова?",
-        "options": ["Верхнеднепровский", "Днепровский", "Могилевский", "Гродненский"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В освобождении какого города участвовал Зернов в июле 1944 года?",
-        "options": ["Минска", "Бреста", "Гродно", "Витебска"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где погиб Сергей Зернов?",
-        "options": ["Под Берлином", "Под Гданьском", "Под Варшавой", "Под Кенигсбергом"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько орденов Отечественной войны I степени получил Зернов?",
-        "options": ["Один", "Два", "Три", "Четыре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где находится могила Сергея Зернова?",
-        "options": ["В Киеве", "В Москве", "В Гродно", "В Польше"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком парке Гродно похоронен Зернов?",
-        "options": ["Парк Жилибера", "Парк Горького", "Пушкинский парк", "Советский парк"],
-        "correct_answer": 0
-    },
-    {
-        "question": "На каком доме установлена мемориальная доска Зернову?",
-        "options": ["Дом №4", "Дом №6", "Дом №8", "Дом №10"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Юрий Ивлиев окончил авиационную школу пилотов?",
-        "options": ["1940", "1941", "1942", "1943"],
-        "correct_answer": 2
-    },
-    {
-        "question": "На каком самолете летал Юрий Ивлиев?",
-        "options": ["Як-1", "Ил-2", "Пе-2", "Ла-5"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько боевых вылетов насчитывалось у Ивлиева к августу 1944 года?",
-        "options": ["80", "100", "120", "140"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько вражеских танков уничтожил Ивлиев по данным на август 1944 года?",
-        "options": ["15", "20", "25", "30"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какой подвиг совершил Ивлиев в январе 1945 года?",
-        "options": ["Сбил 5 самолетов за один день", "Направил горящий самолет на врага", "Провел воздушный таран", "Спас командира полка"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое звание получил Ивлиев за свой подвиг?",
-        "options": ["Герой Советского Союза", "Герой России", "Кавалер ордена Славы", "Заслуженный летчик"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где похоронен Юрий Ивлиев?",
-        "options": ["В Ташкенте", "В Москве", "В Гродно", "На месте гибели"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком парке Гродно находится могила Ивлиева?",
-        "options": ["Парк Жилибера", "Парк Горького", "Пушкинский парк", "Советский парк"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каких городах есть улицы имени Ивлиева?",
-        "options": ["Гродно и Минск", "Ташкент и Москва", "Гродно и Ташкент", "Минск и Киев"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько лет было Ивлиеву, когда он погиб?",
-        "options": ["20 лет", "21 год", "22 года", "23 года"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком концлагере погиб Дмитрий Карбышев?",
-        "options": ["Освенцим", "Дахау", "Маутхаузен", "Бухенвальд"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году родился Дмитрий Карбышев?",
-        "options": ["1870", "1880", "1890", "1900"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую крепость реконструировал Карбышев в 1911-1914 годах?",
-        "options": ["Брестскую", "Гродненскую", "Киевскую", "Смоленскую"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком городе застала Карбышева начало Великой Отечественной войны?",
-        "options": ["Бресте", "Минске", "Гродно", "Москве"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько лет Карбышев провел в немецком плену?",
-        "options": ["Около 2 лет", "Около 3 лет", "Около 4 лет", "Около 5 лет"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Как погиб Карбышев?",
-        "options": ["Расстрелян", "Замучен пытками", "Обливали водой на морозе", "Отравлен"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Когда Карбышеву присвоили звание Героя Советского Союза?",
-        "options": ["В 1945 году", "В 1946 году", "В 1947 году", "В 1948 году"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Карбышева?",
-        "options": ["СШ №10", "СШ №15", "СШ №20", "СШ №25"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько научных трудов опубликовал Карбышев?",
-        "options": ["Более 50", "Более 100", "Более 150", "Более 200"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой армии служил Карбышев в начале войны в Гродно?",
-        "options": ["3-й армии", "10-й армии", "1-й армии", "5-й армии"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое звание получил Леонид Клецков за развитие Гродненского региона?",
-        "options": ["Герой Советского Союза", "Герой Социалистического Труда", "Заслуженный работник БССР", "Народный герой Беларуси"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой должности Клецков работал на Ошмянщине с 1952 по 1960 годы?",
-        "options": ["Председатель райисполкома", "Первый секретарь райкома партии", "Секретарь комсомола", "Директор совхоза"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько боевых орденов было у Клецкова к 9 Мая 1945 года?",
-        "options": ["Два", "Три", "Четыре", "Пять"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком звании Клецков был уволен в запас в 1947 году?",
-        "options": ["Лейтенант", "Старший лейтенант", "Капитан", "Майор"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Кто рекомендовал Клецкова на пост первого секретаря Гродненского обкома партии?",
-        "options": ["Петр Машеров", "Николай Слюньков", "Кирилл Мазуров", "Владимир Микулич"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какую профессию Клецков указывал в анкетах?",
-        "options": ["Агроном", "Учитель", "Инженер", "Экономист"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что было названо именем Клецкова в Гродно в 1999 году?",
-        "options": ["Улица", "Проспект", "Площадь", "Парк"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа Гродно носит имя Клецкова с 2023 года?",
-        "options": ["СШ №15", "СШ №25", "СШ №31", "СШ №35"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году Клецков возглавил делегацию БССР на сессии ООН?",
-        "options": ["1965", "1967", "1970", "1972"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Как называлась книга, изданная Клецковым в эпоху перестройки?",
-        "options": ["«Долг и должность»", "«Годы и люди»", "«Моя Беларусь»", "«Время и мы»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое звание получила Зоя Космодемьянская?",
-        "options": ["Герой Советского Союза", "Герой России", "Кавалер ордена Ленина", "Герой Социалистического Труда"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году Зоя Космодемьянская пошла на фронт?",
-        "options": ["1939", "1940", "1941", "1942"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В какой деревне Зоя совершила свой подвиг?",
-        "options": ["Петрищево", "Осинов Гай", "Волоколамск", "Новодевичье"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Кто выдал Зою немцам?",
-        "options": ["Староста деревни", "Однополчанин", "Местный житель", "Немецкий патруль"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое задание выполняла Зоя в Петрищево?",
-        "options": ["Подрыв моста", "Сожжение домов", "Уничтожение танков", "Захват пленных"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько домов успела поджечь Зоя?",
-        "options": ["Один", "Три", "Пять", "Семь"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Как казнили Зою Космодемьянскую?",
-        "options": ["Расстрел", "Повешение", "Сожжение", "Утопление"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где находится могила Зои Космодемьянской?",
-        "options": ["В родной деревне", "В Кремлёвской стене", "На Новодевичьем кладбище", "В Петрищево"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каких белорусских городах есть улицы имени Зои Космодемьянской?",
-        "options": ["Только в Минске", "Только в Гродно", "В нескольких городах", "Во всех областных центрах"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какая табличка была на груди у Зои во время казни?",
-        "options": ["«Партизанка»", "«Диверсантка»", "«Поджигатель»", "«Разведчица»"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Чем прежде всего прославился Ян Кохановский?",
-        "options": ["Спасением людей во время войны", "Созданием зоопарка", "Преподавательской деятельностью", "Участием в подполье"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году был основан Гродненский зоопарк?",
-        "options": ["1925-1927", "1927-1930", "1930-1933", "1933-1935"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем работал Кохановский до войны?",
-        "options": ["Врачом", "Учителем биологии", "Инженером", "Зоотехником"],
-        "correct_answer": 1
-    },
-    {
-        "question": "За что арестовали Кохановского в 1942 году?",
-        "options": ["За участие в подполье", "Как заложника после убийства жандарма", "За отказ сотрудничать с оккупантами", "За хранение оружия"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Чью жизнь спас Кохановский в тюрьме?",
-        "options": ["Своего брата", "Отца шестерых детей", "Бывшего директора школы", "Своего ученика"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где был расстрелян Кохановский?",
-        "options": ["В центре Гродно", "У крепостного форта", "В тюрьме гестапо", "В зоопарке"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где находится символическая могила Кохановского?",
-        "options": ["В зоопарке", "На старом католическом кладбище", "На месте расстрела", "В парке Жилибера"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где установлена памятная доска Кохановскому?",
-        "options": ["На здании гимназии", "На входе в зоопарк", "На месте его дома", "В школе где он учился"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько заложников планировали расстрелять изначально?",
-        "options": ["25", "50", "75", "100"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Сколько заложников было расстреляно в итоге?",
-        "options": ["10", "25", "50", "100"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем был Виктор Усов до службы в пограничных войсках?",
-        "options": ["Учителем", "Рабочим на заводе", "Колхозником", "Шофером"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое военное училище окончил Усов?",
-        "options": ["Харьковское военное училище МВД", "Киевское пехотное училище", "Московское пограничное училище", "Ленинградское военное училище"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько солдат было в распоряжении Усова в начале боя?",
-        "options": ["Около 30", "Около 50", "Около 70", "Около 100"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько атак отразили пограничники под командованием Усова?",
-        "options": ["5", "7", "9", "11"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько ранений получил Усов в бою?",
-        "options": ["Три", "Пять", "Семь", "Девять"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что нашли при раскопках в 1952 году?",
-        "options": ["Тело Усова с винтовкой", "Личный дневник Усова", "Знамя заставы", "Оружие немецких солдат"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Когда Усову посмертно присвоили звание Героя Советского Союза?",
-        "options": ["1945", "1958", "1965", "1970"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Усова?",
-        "options": ["Школа №1", "Школа №3", "Школа №5", "Школа №7"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая деревня была переименована в честь Усова?",
-        "options": ["Вулька-Доргунская", "Наумовичи", "Куписк", "Зачепичи"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где хранится винтовка Усова?",
-        "options": ["В музее пограничных войск в Москве", "В Гродненском музее", "В школе №3 Гродно", "В Никопольском музее"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком возрасте Михаил Курбатов был представлен к званию Героя Советского Союза?",
-        "options": ["18 лет", "19 лет", "20 лет", "21 год"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком регионе родился Михаил Курбатов?",
-        "options": ["Амурская область", "Московская область", "Ленинградская область", "Киевская область"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В какой операции особенно отличился Курбатов в июне 1944 года?",
-        "options": ["Могилевская", "Минская", "Витебская", "Брестская"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Что захватил и использовал Курбатов у деревни Будино?",
-        "options": ["Немецкий танк", "Немецкую пушку", "Пулемет", "Миномет"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую реку форсировал Курбатов в бою за Гродно?",
-        "options": ["Днепр", "Неман", "Березину", "Вислу"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где первоначально был похоронен Курбатов?",
-        "options": ["В центре Гродно", "На западном берегу Немана", "В родной деревне", "В Могилеве"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где находится окончательное место захоронения Курбатова?",
-        "options": ["На кладбище по ул. Победы", "В Кремлёвской стене", "В парке Жилибера", "На родине в Амурской области"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Когда был подписан Указ о присвоении звания Героя Советского Союза?",
-        "options": ["Июль 1944", "Март 1945", "Май 1945", "Январь 1946"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где погиб Михаил Курбатов?",
-        "options": ["У железнодорожного моста", "В центре Гродно", "На территории завода «Белкард»", "В парке"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году Курбатов был внесен в Книгу народной славы Гродно?",
-        "options": ["1958", "1963", "1965", "1970"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Иван Лебедев участвовал в Параде Победы в Москве?",
-        "options": ["1944", "1945", "1946", "1947"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую должность занимал Лебедев при форсировании Днепра?",
-        "options": ["Командир взвода", "Заместитель командира дивизиона", "Командир дивизиона", "Начальник штаба"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько раз был ранен Иван Лебедев за время войны?",
-        "options": ["Три", "Пять", "Семь", "Девять"],
-        "correct_answer": 1
-    },
-    {
-        "question": "За что Лебедев получил звание Героя Советского Союза?",
-        "options": ["За форсирование Днепра", "За взятие Берлина", "За освобождение Праги", "За участие в Курской битве"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Кого Лебедев взял в плен в Чехии?",
-        "options": ["Более 80 немецких солдат", "Генерала вермахта", "Целый батальон", "Группу диверсантов"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где работал Лебедев после войны в Гродно?",
-        "options": ["В облисполкоме", "В военкомате", "В университете", "В школе"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что было названо именем Лебедева в Гродно в 2017 году?",
-        "options": ["Улица", "Проспект", "Площадь", "Школа"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Лебедева?",
-        "options": ["СШ №35", "СШ №37", "СШ №39", "СШ №41"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком возрасте умер Иван Лебедев?",
-        "options": ["95 лет", "97 лет", "99 лет", "101 год"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где установлена мемориальная доска Лебедеву?",
-        "options": ["На здании военкомата", "На проспекте его имени", "На школе №39", "На университете"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году Александр Матросов совершил свой подвиг?",
-        "options": ["1941", "1942", "1943", "1944"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что закрыл Матросов своим телом во время боя?",
-        "options": ["Танк", "Амбразуру дзота", "Окоп с товарищами", "Вход в блиндаж"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком возрасте Матросов совершил свой подвиг?",
-        "options": ["18 лет", "19 лет", "20 лет", "21 год"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое звание получил Матросов посмертно?",
-        "options": ["Герой Советского Союза", "Герой России", "Кавалер ордена Славы", "Герой Социалистического Труда"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько дзотов обстреливало батальон Матросова?",
-        "options": ["Один", "Два", "Три", "Четыре"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что бросил Матросов в дзот перед подвигом?",
-        "options": ["Две гранаты", "Бутылку с зажигательной смесью", "Дымовую шашку", "Толовую шашку"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где воспитывался Матросов после смерти родителей?",
-        "options": ["В детском доме", "У родственников", "В интернате", "В семье опекунов"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком городе Гродненской области есть улица Матросова?",
-        "options": ["Волковыск", "Лида", "Большая Берестовица", "Сморгонь"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Каким орденом был награжден Матросов посмертно?",
-        "options": ["Орден Ленина", "Орден Красного Знамени", "Орден Отечественной войны", "Орден Красной Звезды"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Есть ли улица Матросова в Гродно?",
-        "options": ["Да", "Нет", "Была, но переименована", "Планируется назвать"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем работал Василий Розанов до войны в Гродно?",
-        "options": ["Учителем", "Рабочим на мясокомбинате", "Инженером на заводе", "Железнодорожником"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько человек насчитывала подпольная группа Розанова?",
-        "options": ["Более 10", "Более 20", "Более 30", "Более 40"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Кто из членов семьи Розанова участвовал в подпольной работе?",
-        "options": ["Только жена", "Жена и старшая дочь", "Жена и обе дочери", "Только брат"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что взорвали Розанов с Голубовичем в занеманской части города?",
-        "options": ["Мост", "Трансформаторную подстанцию", "Завод", "Склад"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году установили связь с партизанскими отрядами?",
-        "options": ["1941", "1942", "1943", "1944"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где погиб Василий Розанов?",
-        "options": ["В центре Гродно", "У железнодорожного моста", "В районе деревни Кульбаки", "В партизанском отряде"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что планировали взорвать подпольщики в последней операции?",
-        "options": ["Железнодорожный мост", "Немецкий штаб", "Электростанцию", "Завод"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где находится могила Розанова?",
-        "options": ["В парке Жилибера", "На кладбище по ул. Антонова", "На старом кладбище", "На месте гибели"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа хранит память о Розанове в своем музее?",
-        "options": ["СШ №15", "СШ №25", "СШ №35", "СШ №45"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какой наградой был посмертно награжден Розанов?",
-        "options": ["Орден Отечественной войны", "Орден Красной Звезды", "Орден Ленина", "Медаль «Партизану Отечественной войны»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой авиационный полк был у Ольги Санфировой?",
-        "options": ["46-й гвардейский Таманский", "125-й гвардейский бомбардировочный", "586-й истребительный", "73-й штурмовой"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько боевых вылетов совершила Ольга Санфирова?",
-        "options": ["430", "530", "630", "730"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где погибла Ольга Санфирова?",
-        "options": ["Под Берлином", "В Польше", "В Беларуси", "В Восточной Пруссии"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Как погибла Ольга Санфирова?",
-        "options": ["Сбита в воздушном бою", "Подорвалась на минном поле", "Погибла при крушении самолета", "Расстреляна при приземлении"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком городе похоронена Санфирова?",
-        "options": ["Самара", "Москва", "Гродно", "Коломна"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Санфировой?",
-        "options": ["СШ №20", "СШ №25", "СШ №30", "СШ №35"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какое звание получила Санфирова посмертно?",
-        "options": ["Герой Советского Союза", "Герой России", "Кавалер ордена Славы", "Заслуженный военный летчик"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какие города увековечили память Санфировой в названиях улиц?",
-        "options": ["Самара и Гродно", "Москва и Минск", "Коломна и Витебск", "Брест и Смоленск"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какую военную авиационную школу окончила Санфирова?",
-        "options": ["Батайскую", "Качинскую", "Оренбургскую", "Харьковскую"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каких операциях участвовала Санфирова?",
-        "options": ["Оборона Кавказа, освобождение Крыма", "Сталинградская битва, Курская дуга", "Берлинская операция, Прага", "Все перечисленные"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое высшее воинское звание получил Василий Соколовский?",
-        "options": ["Генерал армии", "Маршал Советского Союза", "Генералиссимус", "Главный маршал"],
-        "correct_answer": 1
-    },
-    {
-        "question": "На каком фронте Соколовский был начальником штаба в начале войны?",
-        "options": ["Западном", "Южном", "Ленинградском", "Брянском"],
-        "correct_answer": 0
-    },
-    {
-        "question": "За участие в какой операции Соколовский получил звание Героя Советского Союза?",
-        "options": ["Московской", "Сталинградской", "Берлинской", "Курской"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какую должность занимал Соколовский в Германии после войны?",
-        "options": ["Комендант Берлина", "Главнокомандующий Группой советских войск", "Посол СССР в ГДР", "Военный атташе"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой должности Соколовский работал с 1952 года?",
-        "options": ["Министр обороны", "Начальник Генерального штаба", "Командующий округом", "Начальник академии"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где похоронен Василий Соколовский?",
-        "options": ["Новодевичье кладбище", "Красная площадь у Кремлёвской стены", "Ваганьковское кладбище", "В родной деревне"],
-        "correct_answer": 1
-    },
-    {
-        "question": "С кем из военачальников Соколовский тесно сотрудничал во время войны?",
-        "options": ["Г.К. Жуковым", "К.К. Рокоссовским", "И.С. Коневым", "А.М. Василевским"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой известный военно-теоретический труд написал Соколовский?",
-        "options": ["«Военная стратегия»", "«Наука побеждать»", "«Война и мир»", "«Тактика общевойскового боя»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году Соколовский стал генералом армии?",
-        "options": ["1941", "1942", "1943", "1944"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каких операциях участвовал Соколовский как начальник штаба 1-го Украинского фронта?",
-        "options": ["Львовско-Сандомирская", "Ясско-Кишиневская", "Белорусская", "Прибалтийская"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где родилась Ольга Соломова?",
-        "options": ["В Гродно", "В деревне Лаша", "В Мордовии", "В Жорновке"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком партизанском соединении воевала Соломова?",
-        "options": ["Бригада имени Александра Невского", "Отряд «Октябрь»", "Бригада «Первомайская»", "Отряд «Смелый»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какую должность занимала Соломова в подполье?",
-        "options": ["Секретарь горкома комсомола", "Командир диверсионной группы", "Связной партизан", "Руководитель подпольного райкома"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где погибла Ольга Соломова?",
-        "options": ["В Гродно", "В деревне Жорновка", "В Липичанской пуще", "В Лаше"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько лет было Ольге Соломовой, когда она погибла?",
-        "options": ["20", "22", "24", "26"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Когда Соломовой присвоили звание Почётного гражданина Гродно?",
-        "options": ["1944", "1954", "1964", "1974"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Что было названо именем Соломовой в Гродно?",
-        "options": ["Улица", "Гимназия №3", "Школа №5", "Библиотека"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что ходило по Неману с именем Соломовой?",
-        "options": ["Пароход", "Прогулочный теплоход", "Катер", "Паром"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Соломова стала секретарем подпольного горкома комсомола?",
-        "options": ["1941", "1942", "1943", "1944"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Как погибла Ольга Соломова?",
-        "options": ["Взрывом гранаты", "Последней пулей в себя", "Застрелена в бою", "Захвачена в плен и казнена"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком городе родилась Вера Хоружая?",
-        "options": ["Мозырь", "Пинск", "Бобруйск", "Витебск"],
-        "correct_answer": 2
-    },
-    {
-        "question": "За что Хоружая была осуждена польскими властями в 1925 году?",
-        "options": ["За шпионаж", "За подпольную комсомольскую работу", "За убийство полицейского", "За организацию забастовки"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько лет Хоружая провела в польской тюрьме?",
-        "options": ["4 года", "6 лет", "7 лет", "8 лет"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком городе Хоружая начала партизанскую деятельность в 1941 году?",
-        "options": ["Гродно", "Пинск", "Минск", "Брест"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кто был командиром партизанского отряда, в который вступила Хоружая?",
-        "options": ["В.З. Корж", "С.А. Ковпак", "П.М. Машеров", "К.С. Заслонов"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В какой город Хоружую направили для организации подполья осенью 1942 года?",
-        "options": ["Минск", "Гродно", "Витебск", "Могилёв"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Когда Вере Хоружей было присвоено звание Героя Советского Союза?",
-        "options": ["1942", "1945", "1960", "1975"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где установлены памятники Вере Хоружей?",
-        "options": ["Мозырь, Пинск, Витебск", "Минск, Гродно, Брест", "Бобруйск, Гомель, Могилёв", "Все областные центры"],
-        "correct_answer": 0
-    },
-    {
-        "question": "При каких обстоятельствах погибла Вера Хоружая?",
-        "options": ["В воздушном бою", "Расстреляна в овраге", "Взорвана на мине", "Умерла в тюрьме"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем был Сергей Корнилов для Веры Хоружей?",
-        "options": ["Брат", "Муж", "Командир", "Связной"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой области родилась Лиза Чайкина?",
-        "options": ["Московской", "Ленинградской", "Калининской", "Смоленской"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какую должность занимала Лиза Чайкина в колхозе?",
-        "options": ["Заведующая избой-читальней", "Бригадир трактористов", "Председатель колхоза", "Учительница"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком году Лиза Чайкина стала членом ВКП(б)?",
-        "options": ["1937", "1939", "1941", "1942"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую подпольную должность занимала Чайкина в партизанском отряде?",
-        "options": ["Секретарь районной комсомольской организации", "Командир отряда", "Начальник разведки", "Связная"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое имя назвала Лиза на допросе?",
-        "options": ["Иванова из Ленинграда", "Петрова из Москвы", "Сидорова из Киева", "Не назвала никакого"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Когда Чайкиной присвоили звание Героя Советского Союза?",
-        "options": ["В 1941 году", "В 1942 году", "В 1943 году", "В 1945 году"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Лизы Чайкиной?",
-        "options": ["СШ №15", "СШ №20", "СШ №25", "СШ №30"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что писали на бортах самолетов полка имени Чайкиной?",
-        "options": ["«За Родину!»", "«За Лизу Чайкину!»", "«За победу!»", "«За комсомол!»"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какие знаки отличия сдала Лиза одной из первых в районе?",
-        "options": ["«ГТО» и «Ворошиловский стрелок»", "«Юный натуралист»", "«Отличник народного просвещения»", "«Мастер спорта»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где было написано имя Лизы Чайкиной 9 мая 1945 года?",
-        "options": ["На Бранденбургских воротах", "На стене Рейхстага", "На здании гестапо", "На памятнике в Берлине"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком городе родился Иван Черняховский?",
-        "options": ["Киев", "Умань", "Одесса", "Москва"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Кем работал Черняховский после смерти родителей?",
-        "options": ["Железнодорожным рабочим", "Учителем", "Сельскохозяйственным рабочим", "Слесарем"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какое военное училище окончил Черняховский?",
-        "options": ["Киевское артиллерийское", "Одесское пехотное", "Оба варианта верны", "Ни одно из перечисленных"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какую дивизию возглавил Черняховский перед войной?",
-        "options": ["28-ю танковую", "5-ю стрелковую", "10-ю механизированную", "15-ю кавалерийскую"],
-        "correct_answer": 0
-    },
-    {
-        "question": "За какую операцию Черняховский получил звание Героя Советского Союза?",
-        "options": ["Форсирование Днепра", "Оборона Москвы", "Сталинградская битва", "Курская битва"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Каким фронтом командовал Черняховский в 1944 году?",
-        "options": ["1-м Белорусским", "2-м Белорусским", "3-м Белорусским", "4-м Украинским"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько медалей «Золотая Звезда» получил Черняховский?",
-        "options": ["Одну", "Две", "Три", "Четыре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Как погиб Черняховский?",
-        "options": ["В воздушном бою", "От разрыва снаряда", "В танковом сражении", "В партизанской засаде"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что установлено в Гродно в память о Черняховском?",
-        "options": ["Памятник", "Только улица", "Мемориальная доска", "Сквер"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком звании Черняховский стал самым молодым в истории РККА?",
-        "options": ["Генерал-майор", "Генерал-лейтенант", "Генерал-полковник", "Генерал армии"],
-        "correct_answer": 3
-    },
-    {
-        "question": "Кем работал Иван Скрынник до войны?",
-        "options": ["Врачом", "Учителем", "Инженером", "Агрономом"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой должности Скрынник начал службу на Калининском фронте?",
-        "options": ["Командир роты", "Политрук роты", "Снайпер", "Разведчик"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой партизанской бригаде служил Скрынник?",
-        "options": ["«Алексея»", "«Жукова»", "«Сталина»", "«Победа»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько подпольных комсомольских организаций создал Скрынник?",
-        "options": ["10", "15", "21", "25"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком городе погиб Иван Скрынник?",
-        "options": ["Гродно", "Белосток", "Минск", "Варшава"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где похоронен Скрынник?",
-        "options": ["В родной деревне", "В городском парке Гродно", "В Минске", "На месте гибели"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Скрынника?",
-        "options": ["СШ №35", "СШ №37", "СШ №39", "СШ №41"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какие награды получил Скрынник?",
-        "options": ["Орден Отечественной войны и медаль «Партизану Отечественной войны»", "Орден Ленина и медаль «За отвагу»", "Орден Красного Знамени и медаль «За боевые заслуги»", "Орден Славы и медаль «За победу»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Где установлена мемориальная плита Скрыннику в Гродно?",
-        "options": ["На школе №39", "На здании вокзала", "На жилом доме по ул. Скрынника", "В городском парке"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Из какой области был родом Иван Скрынник?",
-        "options": ["Черниговской", "Киевской", "Гомельской", "Брестской"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какую должность занимал Александр Сивачев на момент начала войны?",
-        "options": ["Начальник пограничной заставы", "Командир батальона", "Начальник штаба отряда", "Политрук роты"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Сколько часов длился бой пограничной заставы под командованием Сивачева?",
-        "options": ["6 часов", "12 часов", "18 часов", "24 часа"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько танков подожгли пограничники Сивачева?",
-        "options": ["1", "2", "3", "4"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько немецких танков атаковало заставу в последней атаке?",
-        "options": ["5", "6", "8", "10"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько ранений получил Сивачев в бою?",
-        "options": ["Одно", "Два", "Три", "Четыре"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Сивачеву присвоили имя пограничной заставы?",
-        "options": ["1965", "1968", "1971", "1975"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какая школа в Гродно носит имя Сивачева?",
-        "options": ["Школа №20", "Школа №26", "Школа №32", "Школа №38"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году школе присвоили имя Сивачева?",
-        "options": ["2018", "2019", "2020", "2021"],
-        "correct_answer": 3
-    },
-    {
-        "question": "В каком поселке родился Сивачев?",
-        "options": ["Энем", "Головенчицы", "Августов", "Гродно"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Что было установлено на месте боя после войны?",
-        "options": ["Часовня", "Памятник", "Мемориальная доска", "Обелиск"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Феодосию Кириченко присвоили имя пограничной заставы?",
-        "options": ["1995", "2000", "2003", "2008"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Кем работал Кириченко до службы в пограничных войсках?",
-        "options": ["Учителем", "Шахтером", "Трактористом", "Строителем"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какую пограничную заставу возглавлял Кириченко?",
-        "options": ["1-ю", "2-ю", "4-ю", "5-ю"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Сколько вражеских атак отбила застава под командованием Кириченко?",
-        "options": ["3", "5", "7", "9"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько часов длился бой заставы Кириченко?",
-        "options": ["6 часов", "8 часов", "10 часов", "12 часов"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Куда Кириченко отправил женщин и детей во время боя?",
-        "options": ["В деревню Доргунь", "В Гродно", "В лес", "В соседнюю заставу"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое официальное извещение получила жена Кириченко после войны?",
-        "options": ["Погиб в бою", "Пропал без вести", "Попал в плен", "Умер от ран"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Как звали жену Феодосия Кириченко?",
-        "options": ["Константина", "Анна", "Мария", "Елена"],
-        "correct_answer": 0
-    },
-    {
-        "question": "В каком пограничном отряде служил Кириченко?",
-        "options": ["86-м Августовском", "87-м Брестском", "88-м Гродненском", "89-м Лидском"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой была судьба Кириченко согласно официальным документам?",
-        "options": ["Погиб в бою", "Пропал без вести", "Попал в плен", "Выжил и продолжил службу"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Какое воинское звание имел Николай Ватутин к концу войны?",
-        "options": ["Генерал-полковник", "Генерал армии", "Маршал Советского Союза", "Генералиссимус"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каком году Ватутину посмертно присвоили звание Героя Советского Союза?",
-        "options": ["1944", "1955", "1965", "1975"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Какую должность занимал Ватутин в начале войны в Генеральном штабе?",
-        "options": ["Начальник оперативного управления", "Начальник Генштаба", "Заместитель министра обороны", "Командир дивизии"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Каким фронтом командовал Ватутин под Сталинградом?",
-        "options": ["Юго-Западным", "Донским", "Сталинградским", "Воронежским"],
-        "correct_answer": 0
-    },
-    {
-        "question": "За какую операцию Ватутин получил орден Суворова I степени?",
-        "options": ["Сталинградскую", "Курскую", "Берлинскую", "Московскую"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какой фронт был образован из Воронежского в 1943 году?",
-        "options": ["1-й Украинский", "2-й Украинский", "3-й Украинский", "4-й Украинский"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Как погиб Николай Ватутин?",
-        "options": ["В воздушном бою", "От ранения в бою с УПА", "В автомобильной аварии", "От болезни"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Где похоронен Ватутин?",
-        "options": ["В Москве", "В Киеве", "В Сталинграде", "На родине в Белгороде"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько залпов произвела Москва в честь Ватутина в день похорон?",
-        "options": ["12", "20", "24", "30"],
-        "correct_answer": 2
-    },
-    {
-        "question": "В каком году Ватутин окончил Академию Генерального штаба?",
-        "options": ["1935", "1937", "1939", "1941"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Сколько лет было Юрию Смирнову, когда он совершил подвиг?",
-        "options": ["17", "18", "19", "20"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В какой операции совершил подвиг Юрий Смирнов?",
-        "options": ["«Багратион»", "«Уран»", "«Кутузов»", "«Суворов»"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Кем работал Смирнов до войны?",
-        "options": ["На заводе «Красное Сормово»", "В колхозе", "Шахтером", "Строителем"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Что послужило причиной ухода Смирнова на фронт?",
-        "options": ["Гибель отца под Сталинградом", "Призыв военкомата", "Желание защищать Родину", "Все перечисленное"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Какое звание имел Смирнов во время подвига?",
-        "options": ["Красноармеец", "Младший сержант", "Сержант", "Старший сержант"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Что написал Смирнов в протоколе допроса вместо ответов?",
-        "options": ["«Не знаю»", "«Молчал»", "«Не скажу»", "Ничего не написал"],
-        "correct_answer": 1
-    },
-    {
-        "question": "Когда Смирнову присвоили звание Героя Советского Союза?",
-        "options": ["1944", "1945", "1965", "1975"],
-        "correct_answer": 0
-    },
-    {
-        "question": "Что было сделано в память о Смирнове в воинской части?",
-        "options": ["Установлен памятник", "Зачислен навечно в списки роты", "Создан музей", "Названа казарма его именем"],
-        "correct_answer": 1
-    },
-    {
-        "question": "В каких городах есть улицы имени Смирнова?",
-        "options": ["Только в Гродно", "Только в Орше", "В нескольких городах Беларуси", "Во всех областных центрах"],
-        "correct_answer": 2
-    },
-    {
-        "question": "Где был похоронен Юрий Смирнов?",
-        "options": ["В родной деревне", "В поселке Ореховск", "В Орше", "В Минске"],
-        "correct_answer": 1
-    },
-]
+# Вопросы викторины и данные о героях хранятся в data/content.json
+content = content_registry.current
+
+question_bank = content.bank
+HERO_URLS = content.hero_urls
+HERO_NAMES = content.hero_names
+# Номера вопросов по героям (по тегу 'hero' у каждого вопроса)
+HERO_QUESTIONS = content.hero_questions
 
 
-HERO_URLS = [
-    "https://telegra.ph/Geroj-1-09-30",      # Герой 1
-    "https://telegra.ph/Geroj-2-10-01",      # Герой 2
-    "https://telegra.ph/Mihail-Belush-10-12",            # Герой 3
-    "https://telegra.ph/Ivan-Vasilevich-Boldin-General-sudboj-svyazannyj-s-Grodno-10-11",
-    "https://telegra.ph/Pavel-Brikel-10-12",
-    "https://telegra.ph/Nikolaj-Volkov-10-13",            # Герой 6
-    "https://telegra.ph/Andrej-Danilov-10-11",
-    "https://telegra.ph/Lev-Dovator-Legendarnyj-kavalerist-10-09",
-    "https://telegra.ph/Konstantin-Sergeevich-Zaslonov-10-13",
-    "https://telegra.ph/Zaharov-Georgij-Fyodorovich-10-13",
-    "https://telegra.ph/Sergej-Zernov-10-15",           # Герой 11
-    "https://telegra.ph/Ivlev-YUrij-Dmitrievich-10-15",           # Герой 12
-    "https://telegra.ph/Dmitrij-Karbyshev-YA-soldat-i-ostayus-veren-dolgu-10-15",           # Герой 13
-    "https://telegra.ph/Leonid-Kleckov-10-15",           # Герой 14
-    "https://telegra.ph/Zoya-Anatolevna-Kosmodemyanskaya-10-15",           # Герой 15
-    "https://telegra.ph/YAn-Kohanovskij-10-15",           # Герой 16
-    "https://telegra.ph/Viktor-Usov-10-15",           # Герой 17
-    "https://telegra.ph/Mihail-Kurbatov-10-15",           # Герой 18
-    "https://telegra.ph/Ivan-Lebedev-Znamenosec-Pobedy-10-15",           # Герой 19
-    "https://telegra.ph/Aleksandr-Matveevich-Matrosov-10-15",           # Герой 20
-    "https://telegra.ph/Vasilij-Rozanov-10-15",           # Герой 21
-    "https://telegra.ph/Sanfirova-Olga-Aleksandrovna-10-15",           # Герой 22
-    "https://telegra.ph/Sokolovskij-Vasilij-Daniilovich-10-15",           # Герой 23
-    "https://telegra.ph/Olga-Solomova-10-15",           # Герой 24
-    "https://telegra.ph/Horuzhaya-Vera-Zaharovna-10-15",           # Герой 25
-    "https://telegra.ph/Liza-CHajkina-10-15",           # Герой 26
-    "https://telegra.ph/Ivan-Danilovich-CHernyahovskij-10-15",           # Герой 27
-    "https://telegra.ph/Skrynnik-Ivan-Nesterovich-10-15",           # Герой 28
-    "https://telegra.ph/Aleksandr-Sivachyov-10-15",           # Герой 29
-    "https://telegra.ph/Kirichenko-Feodosij-Petrovich-10-15",   # Герой 30
-    "https://telegra.ph/Vatutin-Nikolaj-Fedorovich-10-11",           # Герой 31
-    "https://telegra.ph/Sergej-Vorkov-10-15",           # Герой 32
-    "https://telegra.ph/YUrij-Smirnov-10-15",           # Герой 33
-    "https://telegra.ph/Pavel-Sadakov-10-15",           # Герой 34
-    "https://telegra.ph/Ivan-Konstantinovich-Molokov-10-15",           # Герой 35
-]
+def _apply_content(new_content):
+    """Обновление ссылок после перезагрузки контента."""
+    global content, question_bank, HERO_URLS, HERO_NAMES, HERO_QUESTIONS
+    content = new_content
+    question_bank = new_content.bank
+    HERO_URLS = new_content.hero_urls
+    HERO_NAMES = new_content.hero_names
+    HERO_QUESTIONS = new_content.hero_questions
 
-HERO_NAMES = {
-    1: "Агадил Сухамбаев",
-    2: "Алексей Антонов",
-    3: "Михаил Белуш",
-    4: "Иван Болдин",
-    5: "Павел Брикель",
-    6: "Николай Волков",
-    7: "Андрей Данилов",
-    8: "Лев Доватор",
-    9: "Константин Заслонов",
-    10: "Георгий Захаров",
-    11: "Сергей Зернов",
-    12: "Юрий Ивлев",
-    13: "Дмитрий Карбышев",
-    14: "Леонид Клецков",
-    15: "Зоя Космодемьянская",
-    16: "Ян Кохановский",
-    17: "Виктор Усов",
-    18: "Михаил Курбатов",
-    19: "Иван Лебедев",
-    20: "Александр Матросов",
-    21: "Василий Розанов",
-    22: "Ольга Санфирова",
-    23: "Василий Соколовский",
-    24: "Ольга Соломова",
-    25: "Вера Хоружая",
-    26: "Лиза Чайкина",
-    27: "Иван Черняховский",
-    28: "Иван Скрынник",
-    29: "Александр Сивачев",
-    30: "Феодосий Кириченко",
-    31: "Николай Ватутин",
-    32: "Сергей Ворков",
-    33: "Юрий Смирнов",
-    34: "Павел Садаков",
-    35: "Иван Молоков",
-}
 
-# Разделение вопросов по героям (каждому герою по 10 вопросов)
-HERO_QUESTIONS = {
-    1: list(range(0, 10)),
-    2: list(range(10, 20)),
-    3: list(range(20, 30)),
-    4: list(range(30, 40)),
-    5: list(range(40, 50)),
-    6: list(range(50, 60)),
-    7: list(range(60, 70)),
-    8: list(range(70, 80)),
-    9: list(range(80, 90)),
-    10: list(range(90, 100)),
-    11: list(range(100, 110)),
-    12: list(range(110, 120)),
-    13: list(range(120, 130)),
-    14: list(range(130, 140)),
-    15: list(range(140, 150)),
-    16: list(range(150, 160)),
-    17: list(range(160, 170)),
-    18: list(range(170, 180)),
-    19: list(range(180, 190)),
-    20: list(range(190, 200)),
-    21: list(range(200, 210)),
-    22: list(range(210, 220)),
-    23: list(range(220, 230)),
-    24: list(range(230, 240)),
-    25: list(range(240, 250)),
-    26: list(range(250, 260)),
-    27: list(range(260, 270)),
-    28: list(range(270, 280)),
-    29: list(range(280, 290)),
-    30: list(range(290, 300)),
-    31: list(range(300, 310)),
-    32: list(range(310, 320)),
-    33: list(range(320, 330)),
-    34: list(range(330, 340)),
-    35: list(range(340, 350))
-}
+content_registry.subscribe(_apply_content)
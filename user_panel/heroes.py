@@ -1,7 +1,7 @@
 from aiogram.types import Message, ReplyKeyboardRemove
 
 import storage
-from configurations.keyboards import heroes_keyboard
+from configurations.keyboards import create_heroes_keyboard
 
 
 async def heroes_button(message: Message):
@@ -19,5 +19,5 @@ async def heroes_button(message: Message):
     await message.answer(
         "📖 Используйте кнопки навигации для просмотра всех героев\n\n"
         "Выберите героя для просмотра информации:",
-        reply_markup=heroes_keyboard
+        reply_markup=create_heroes_keyboard(0)
     )
@@ -0,0 +1,91 @@
+from aiogram import Bot, types
+from aiogram.fsm.context import FSMContext
+
+from configurations.callback_data import QuizAnswerCallback, QuizCancelCallback
+from configurations.user_locks import user_locks
+from data.content import ContentVersionError
+from user_panel.quiz_engine import (
+    answer_question,
+    cancel_quiz,
+    current_question,
+    drop_outdated,
+    find_session,
+)
+from user_panel.quiz_transport import chat_message, poll_index
+
+
+async def apply_answer(message: types.Message, user_id: int, session,
+                       position: int):
+    """Засчитывает ответ по позиции варианта и показывает следующий вопрос."""
+    try:
+        question = current_question(session)
+    except ContentVersionError:
+        await drop_outdated(message, user_id)
+        return
+    if question is None or not 0 <= position < len(question.options):
+        return
+
+    # Позиция на экране -> номер варианта через перестановку сессии;
+    # дальше сравнение номеров вместо сравнения текста
+    option = question.option_at(session.current_shuffle, position)
+    await answer_question(message, user_id, session, question, option)
+
+
+async def handle_inline_answer(callback: types.CallbackQuery,
+                               callback_data: QuizAnswerCallback):
+    """Обработчик ответа кнопкой в сообщении."""
+    user_id = callback.from_user.id
+    async with user_locks.hold(user_id):
+        session = find_session(
+            user_id, message_id=callback.message.message_id
+        )
+
+        if session is None:
+            await callback.answer("❌ Викторина не активна")
+            return
+
+        # Повторное нажатие или кнопка от уже отвеченного вопроса
+        if callback_data.q != session.current_question_id:
+            await callback.answer("⏳ Этот вопрос уже отвечен")
+            return
+
+        await callback.answer()
+        await apply_answer(callback.message, user_id, session,
+                           callback_data.o)
+
+
+async def handle_poll_answer(poll_answer: types.PollAnswer, bot: Bot):
+    """
+    Обработчик ответа на опрос-викторину.
+
+    Правильность ответа Telegram показывает сам, поэтому на ответ бот
+    делает ровно один запрос - отправляет следующий вопрос (или итог).
+    """
+    ticket = poll_index.pop(poll_answer.poll_id)
+    if ticket is None or not poll_answer.option_ids:
+        return
+
+    async with user_locks.hold(ticket.user_id):
+        session = find_session(ticket.user_id, token=ticket.token)
+        if session is None or ticket.cursor != session.cursor:
+            return
+
+        await apply_answer(chat_message(bot, ticket.user_id),
+                           ticket.user_id, session,
+                           poll_answer.option_ids[0])
+
+
+async def handle_inline_cancel(callback: types.CallbackQuery,
+                               callback_data: QuizCancelCallback,
+                               state: FSMContext):
+    """Обработчик кнопки завершения викторины в сообщении."""
+    user_id = callback.from_user.id
+    await callback.answer()
+    async with user_locks.hold(user_id):
+        session = find_session(
+            user_id, message_id=callback.message.message_id
+        )
+        if session is None:
+            return
+
+        await cancel_quiz(callback.message, state, user_id)
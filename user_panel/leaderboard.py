@@ -2,7 +2,7 @@ from aiogram import Router
 from aiogram.filters import Command
 from aiogram.types import Message
 
-from data.google_sheets import sheets_manager
+from data.async_sheets import async_sheets
 
 leaderboard_router = Router()
 
@@ -17,20 +17,27 @@ def get_score_text(score):
         return f"{score} баллов"
 
 
-def format_leaderboard():
+async def format_leaderboard():
     """Форматирование таблицы лидеров из Google Sheets"""
     try:
-        # Получаем все результаты
-        all_results = sheets_manager.get_all_results()
+        # Получаем имена и баллы участников
+        all_results = await async_sheets.get_leaderboard_records()
 
         if not all_results:
             return "🏆 <b>Топ пять лучших учеников:</b>\n\n1."
         " —\n2. —\n3. —\n4. —\n5. —"
 
-        # Сортируем по количеству правильных ответов (по убыванию)
+        # Сортируем по количеству правильных ответов (по убыванию),
+        # при равенстве - по суммарному времени ответов (по возрастанию);
+        # результаты без времени - в конце (время 0.0 - настоящее)
         sorted_results = sorted(
-            all_results, key=lambda x: int(x.get("Correct Answers", 0)),
-            reverse=True
+            all_results,
+            key=lambda x: (
+                -int(x.get("Correct Answers", 0)),
+                x["Response Time"]
+                if x.get("Response Time") is not None
+                else float("inf"),
+            ),
         )
 
         # Берем топ-5 результатов
@@ -56,6 +63,9 @@ def format_leaderboard():
 
             # Используем правильное склонение слова "балл"
             score_text = get_score_text(correct_answers)
+            response_time = result.get("Response Time")
+            if response_time is not None:
+                score_text += f" (⏱ {response_time:.1f} с)"
             leaderboard_text += f"{i}. {name} - {score_text}\n"
 
         # Добавляем информацию об общем количестве участников
@@ -73,5 +83,5 @@ def format_leaderboard():
 @leaderboard_router.message(Command("leaders"))
 async def show_leaderboard(message: Message):
     """Показать таблицу лидеров"""
-    leaderboard_text = format_leaderboard()
+    leaderboard_text = await format_leaderboard()
     await message.answer(leaderboard_text, parse_mode="HTML")
@@ -0,0 +1,219 @@
+import time
+
+from aiogram import Bot, types
+from aiogram.filters import CommandObject
+
+from configurations.callback_data import (
+    RoomAnswerCallback,
+    RoomControlCallback,
+)
+from configurations.keyboards import (
+    get_admin_keyboard,
+    get_room_host_keyboard,
+    get_room_question_keyboard,
+)
+from configurations.live_rooms import (
+    ANSWER_ACCEPTED,
+    ANSWER_REPEATED,
+    MAX_PARTICIPANTS,
+    live_rooms,
+)
+from configurations.send_limiter import send_limiter
+
+# Сколько лучших участников показывать после вопроса
+LEADERS_SHOWN = 5
+
+
+async def open_room_button(message: types.Message):
+    """Открытие комнаты ведущим (администратором)."""
+    room = live_rooms.open(message.from_user.id)
+    await message.answer(
+        f"🏫 Комната открыта! Код: {room.code}\n\n"
+        f"Ученики входят командой /join {room.code}\n"
+        f"Вопросов: {room.total_questions}, "
+        f"участников не более {MAX_PARTICIPANTS}.\n\n"
+        "Когда все войдут, нажмите «Начать игру».",
+        reply_markup=get_room_host_keyboard(False),
+    )
+
+
+async def join_room(message: types.Message, command: CommandObject):
+    """Вход ученика в комнату по коду: /join 123456."""
+    code = (command.args or "").strip()
+    if not code.isdigit():
+        await message.answer("Введите код комнаты: /join 123456")
+        return
+
+    room = live_rooms.join(
+        int(code), message.from_user.id, message.from_user.full_name
+    )
+    if room is None:
+        await message.answer("❌ Комната не найдена или уже заполнена.")
+        return
+
+    await message.answer(
+        f"✅ Вы в комнате {room.code}. Участников: {len(room.participants)}\n"
+        "Вопросы придут сюда, когда ведущий начнёт игру.\n"
+        "Выйти из комнаты: /leave"
+    )
+
+
+async def leave_room(message: types.Message):
+    """Выход ученика из комнаты."""
+    if live_rooms.leave(message.from_user.id) is None:
+        await message.answer("Вы не участвуете ни в одной комнате.")
+        return
+    await message.answer("👋 Вы вышли из комнаты.")
+
+
+def question_summary(room):
+    """Итог закрытого вопроса: верный ответ, выбор вариантов, лидеры."""
+    question = room.current_question
+    text = (
+        f"✅ Верный ответ: {question.options[question.correct]}\n"
+        f"Ответили: {len(room.answered)} из {len(room.participants)}\n"
+    )
+    for option in question.order(room.current_shuffle):
+        text += f"• {question.options[option]} - {room.counts[option]}\n"
+    return text + leaders_text(room)
+
+
+def leaders_text(room):
+    text = "\n🏆 Лидеры:\n"
+    for place, (score, user_id) in enumerate(
+        room.leaders(LEADERS_SHOWN), 1
+    ):
+        text += f"{place}. {room.participants[user_id]} - {score}\n"
+    return text
+
+
+async def broadcast_question(bot: Bot, room, summary):
+    """Одновременная рассылка вопроса всем участникам комнаты."""
+    question = room.current_question
+    keyboard = get_room_question_keyboard(room, question)
+    header = (
+        f"❓ Вопрос {room.number + 1}/{room.total_questions}\n\n"
+        f"{question.text}"
+    )
+    places = room.places() if summary else {}
+    total = len(room.participants)
+
+    messages = []
+    for user_id in list(room.participants):
+        text = header
+        if summary:
+            text = (
+                f"{summary}\n"
+                f"Ваши очки: {room.scores[user_id]}, "
+                f"место {places[user_id]} из {total}\n\n{header}"
+            )
+        messages.append((user_id, text, {"reply_markup": keyboard}))
+    return await send_limiter.send_many(bot, messages)
+
+
+async def finish_room(bot: Bot, room, summary=""):
+    """Закрытие комнаты и рассылка итогов."""
+    live_rooms.close(room.code)
+    if not summary and room.number >= 0:
+        # Комната закрыта досрочно - показываем текущих лидеров
+        summary = leaders_text(room).lstrip()
+    if summary:
+        summary += "\n"
+    places = room.places()
+    total = len(room.participants)
+
+    messages = [
+        (
+            user_id,
+            f"🏁 Игра окончена!\n\n{summary}"
+            f"Ваш результат: {room.scores[user_id]} "
+            f"из {room.total_questions}, "
+            f"место {places[user_id]} из {total}",
+            {},
+        )
+        for user_id in room.participants
+    ]
+    await send_limiter.send_many(bot, messages)
+    await bot.send_message(
+        room.host_id,
+        f"🏁 Комната {room.code} закрыта. Участников: {total}\n"
+        f"{leaders_text(room) if total else ''}",
+        reply_markup=get_admin_keyboard(),
+    )
+
+
+async def handle_room_control(callback: types.CallbackQuery,
+                              callback_data: RoomControlCallback, bot: Bot):
+    """Кнопки ведущего: следующий вопрос, число ответов, закрытие."""
+    room = live_rooms.hosted_by(callback.from_user.id)
+    if room is None:
+        await callback.answer("Комната уже закрыта")
+        return
+
+    if callback_data.action == "count":
+        await callback.answer(
+            f"Ответили: {len(room.answered)} из {len(room.participants)}"
+        )
+        return
+
+    if room.sending:
+        await callback.answer("⏳ Рассылка ещё идёт")
+        return
+
+    if callback_data.action == "close":
+        await callback.answer()
+        await callback.message.edit_reply_markup(reply_markup=None)
+        await finish_room(bot, room)
+        return
+
+    if not room.participants:
+        await callback.answer("В комнате пока нет участников", show_alert=True)
+        return
+
+    await callback.answer()
+    # Итог прошлого вопроса считается до сброса счётчиков
+    summary = question_summary(room) if room.number >= 0 else ""
+    if not room.open_next():
+        await callback.message.edit_reply_markup(reply_markup=None)
+        await finish_room(bot, room, summary)
+        return
+
+    room.sending = True
+    started = time.monotonic()
+    try:
+        failed = await broadcast_question(bot, room, summary)
+    finally:
+        room.sending = False
+
+    await callback.message.edit_text(
+        f"🏫 Комната {room.code}\n"
+        f"Вопрос {room.number + 1}/{room.total_questions} разослан "
+        f"{len(room.participants) - len(failed)} участникам "
+        f"за {time.monotonic() - started:.1f} с"
+        + (f", не доставлено: {len(failed)}" if failed else ""),
+        reply_markup=get_room_host_keyboard(True),
+    )
+
+
+async def handle_room_answer(callback: types.CallbackQuery,
+                             callback_data: RoomAnswerCallback):
+    """Ответ участника на вопрос комнаты."""
+    room = live_rooms.get(callback_data.r)
+    question = room.current_question if room is not None else None
+    if question is None:
+        await callback.answer("Игра уже закончилась")
+        return
+
+    if not 0 <= callback_data.o < len(question.options):
+        await callback.answer()
+        return
+
+    result = room.record(
+        question, callback.from_user.id, callback_data.n, callback_data.o
+    )
+    if result == ANSWER_ACCEPTED:
+        await callback.answer("✅ Ответ принят")
+    elif result == ANSWER_REPEATED:
+        await callback.answer("Ответ на этот вопрос уже засчитан")
+    else:
+        await callback.answer("Этот вопрос уже закрыт")
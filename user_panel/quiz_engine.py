@@ -0,0 +1,485 @@
+import logging
+from abc import ABC, abstractmethod
+
+from aiogram import Bot, types
+from aiogram.fsm.context import FSMContext
+
+import storage
+from configurations.delayed_sends import delayed_sends
+from configurations.keyboards import get_main_keyboard
+from configurations.mastery import mastery
+from configurations.question_sources import (
+    AdaptiveSource,
+    HeroSource,
+    SeededSource,
+)
+from configurations.quiz_session import (
+    MODE_COMPETITIVE,
+    MODE_HERO,
+    MODE_PRACTICE,
+    QUESTION_TIME_LIMIT,
+    QuizSession,
+    encode_answers,
+)
+from configurations.session_store import SessionStore
+from configurations.user_locks import user_locks
+from data.answer_stats import answer_stats
+from data.async_sheets import async_sheets
+from data.content import ContentVersionError, content_registry
+from data.session_db import session_db
+from user_panel.quiz_transport import (
+    chat_message,
+    close_question,
+    show_question,
+)
+
+logger = logging.getLogger("bot_logger")
+
+# Сессии всех режимов викторины (пробный, соревновательный, по героям)
+quiz_sessions = SessionStore(
+    "quiz", database=session_db, serializer=QuizSession
+)
+
+# Пороги оценок: процент верных ответов, оценка, эмодзи
+GRADES = (
+    (90, "🎉 Отлично!", "🏆"),
+    (75, "👍 Очень хорошо!", "⭐"),
+    (60, "🙂 Хорошо!", "✅"),
+    (40, "😐 Удовлетворительно", "📘"),
+    (0, "💪 Попробуйте еще раз!", "📚"),
+)
+# Самая длинная викторина; для неё и коротких оценки считаются заранее
+MAX_QUESTIONS = 10
+
+
+def _grade(score, total):
+    percentage = score * 100 / total if total else 0.0
+    for threshold, grade, emoji in GRADES:
+        if percentage >= threshold:
+            return percentage, grade, emoji
+    return percentage, GRADES[-1][1], GRADES[-1][2]
+
+
+# Таблица оценок: GRADE_TABLE[всего вопросов][верных ответов]
+GRADE_TABLE = tuple(
+    tuple(_grade(score, total) for score in range(total + 1))
+    for total in range(MAX_QUESTIONS + 1)
+)
+
+
+def calculate_grade(score, total_questions):
+    """(процент, оценка, эмодзи) по числу верных ответов."""
+    if 0 <= score <= total_questions <= MAX_QUESTIONS:
+        return GRADE_TABLE[total_questions][score]
+    return _grade(score, total_questions)
+
+
+def score_text(score, total):
+    """Строки результата с процентом и оценкой."""
+    percentage, grade, _ = calculate_grade(score, total)
+    return (
+        f"📊 *Ваш результат:*\n"
+        f"• Правильных ответов: {score}/{total}\n"
+        f"• Процент: {percentage:.1f}%\n"
+        f"• Оценка: {grade}"
+    )
+
+
+def get_hero_name(hero_id: int):
+    """Имя героя по номеру"""
+    return storage.HERO_NAMES.get(hero_id, f"Герой {hero_id}")
+
+
+class QuizMode(ABC):
+    """Режим викторины: источник и число вопросов, пауза перед первым
+    вопросом, ограничение времени на ответ и тексты. Цикл викторины
+    (показ вопроса, ответ, таймер, итог) общий для всех режимов.
+    """
+
+    start_delay = 2
+    time_limit = 0
+
+    def __init__(self, source, count):
+        self.source = source
+        self.count = count
+
+    def fill(self, user_id, session):
+        """Выбор вопросов сессии источником режима."""
+        session.add_questions(
+            self.source.pick(user_id, self.count, session.hero_id)
+        )
+
+    def question_text(self, session, question):
+        return (
+            f"❓ *Вопрос {session.cursor + 1}/{session.total_questions}*"
+            "\n\n"
+            f"{question.text}"
+        )
+
+    @abstractmethod
+    async def result_text(self, user_id, session, early):
+        """Текст итога викторины (``early`` - завершена досрочно)."""
+
+
+class PracticeMode(QuizMode):
+    start_delay = 1.5
+
+    async def result_text(self, user_id, session, early):
+        if early:
+            return (
+                f"🎯 *Пробный режим завершен досрочно!*\n\n"
+                f"📊 *Ваш результат:*\n"
+                f"• Правильных ответов: {session.score}/{session.cursor}"
+            )
+        _, _, emoji = calculate_grade(session.score, session.total_questions)
+        return (
+            f"{emoji} *Пробный режим завершен!* {emoji}\n\n"
+            f"{score_text(session.score, session.total_questions)}\n\n"
+            f"🔄 Можете попробовать еще раз!"
+        )
+
+
+class CompetitiveMode(QuizMode):
+    time_limit = QUESTION_TIME_LIMIT
+
+    def fill(self, user_id, session):
+        # Вопросы и порядок вариантов задаются зерном сессии, чтобы
+        # результат можно было воспроизвести и проверить
+        for qid, shuffle in self.source.draw(session.seed, self.count):
+            session.question_ids.append(qid)
+            session.shuffles.append(shuffle)
+
+    async def result_text(self, user_id, session, early):
+        score = session.score
+        total = session.cursor if early else session.total_questions
+        response_time = round(session.elapsed_ms / 1000, 1)
+        first_name, last_name, educational_institution = session.profile
+        educational_institution = educational_institution or "Не указано"
+        success = await async_sheets.save_competitive_result(
+            {
+                "chat_id": user_id,
+                "first_name": first_name,
+                "last_name": last_name,
+                "educational_institution": educational_institution,
+                "correct_answers": score,
+                "total_questions": total,
+                "response_time": response_time,
+                "content_version": session.version,
+                "seed": session.seed,
+                "answers": encode_answers(session.answers),
+            }
+        )
+
+        if early:
+            text = (
+                f"🏆 *Соревновательный режим завершен досрочно!*\n\n"
+                f"📊 *Ваш результат:*\n"
+                f"• Правильных ответов: {score}/{total}\n\n"
+            )
+            if success:
+                return text + (
+                    "✅ *Результат сохранен в Google Таблицу!*\n"
+                    "Больше нельзя пройти этот режим."
+                )
+            return text + (
+                "❌ *Ошибка сохранения результата*\n"
+                "Обратитесь к администратору."
+            )
+
+        _, _, emoji = calculate_grade(score, total)
+        text = (
+            f"{emoji} *Соревновательный режим завершен!* {emoji}\n\n"
+            f"{score_text(score, total)}\n"
+        )
+        if success:
+            return text + (
+                f"• Время ответов: {response_time} с\n"
+                "• Учебное заведение:"
+                f"{educational_institution}\n\n"
+                f"✅ *Результат сохранен!*\n"
+                f"Спасибо за участие! 🎯"
+            )
+        return text + (
+            "\n❌ *Ошибка сохранения результата*\n"
+            "Обратитесь к администратору."
+        )
+
+
+class HeroMode(QuizMode):
+
+    def question_text(self, session, question):
+        return (
+            f"🎖️ *{get_hero_name(session.hero_id)}*\n"
+            "❓ "
+            f"Вопрос {session.cursor + 1}/{session.total_questions}\n\n"
+            f"{question.text}"
+        )
+
+    async def result_text(self, user_id, session, early):
+        hero_name = get_hero_name(session.hero_id)
+        if early:
+            return (
+                f"🎖️ *Викторина отменена: {hero_name}*\n\n"
+                f"📊 *Ваш результат:*\n"
+                f"• Правильных ответов: {session.score}/{session.cursor}"
+            )
+        return (
+            f"🎖️ *Викторина завершена: {hero_name}*\n\n"
+            f"{score_text(session.score, session.total_questions)}\n\n"
+            f"🔄 Можете пройти викторину еще раз или выбрать другого героя!"
+        )
+
+
+# Режимы по номеру режима сессии
+QUIZ_MODES = {
+    MODE_PRACTICE: PracticeMode(AdaptiveSource(), 5),
+    MODE_COMPETITIVE: CompetitiveMode(SeededSource(), 10),
+    MODE_HERO: HeroMode(HeroSource(), 5),
+}
+
+
+def current_question(session):
+    """Текущий вопрос сессии из закреплённой за ней версии контента.
+
+    ContentVersionError, если этой версии больше нет (см. drop_outdated).
+    """
+    qid = session.current_question_id
+    if qid is None:
+        return None
+    return content_registry.bank(session.version)[qid]
+
+
+async def drop_outdated(message: types.Message, user_id: int):
+    """
+    Завершение викторины, версия контента которой недоступна: номера её
+    вопросов относятся к другому банку, поэтому продолжить её нельзя.
+    Сессия удаляется без сохранения результата, пользователь получает
+    уведомление.
+    """
+    delayed_sends.cancel("quiz_question", user_id)
+    delayed_sends.cancel("question_deadline", user_id)
+    session = quiz_sessions.pop(user_id)
+    if session is None:
+        return
+    logger.warning(
+        f"⚠️ Викторина пользователя {user_id} завершена: версия контента "
+        f"{session.version} недоступна"
+    )
+    await close_question(message, session)
+    await message.answer(
+        "⚠️ Вопросы викторины обновились, и эту викторину нельзя "
+        "продолжить.\nПожалуйста, начните её заново.",
+        reply_markup=get_main_keyboard(),
+    )
+
+
+def find_session(user_id: int, token: int = None, message_id: int = None):
+    """Сессия пользователя с указанным токеном или сообщением."""
+    session = quiz_sessions.get(user_id)
+    if session is None:
+        return None
+    if token is not None and session.token != token:
+        return None
+    if message_id is not None and session.message_id != message_id:
+        return None
+    return session
+
+
+def start_quiz(user_id: int, session: QuizSession):
+    """
+    Запуск викторины: вопросы выбираются источником режима, первый
+    вопрос придёт по таймеру (обработчик не ждёт).
+    """
+    fill_questions(user_id, session)
+    quiz_sessions[user_id] = session
+    schedule_first_question(user_id, session)
+
+
+def schedule_first_question(user_id: int, session: QuizSession):
+    """Первый вопрос - после паузы режима, по таймеру delayed_sends."""
+    delayed_sends.schedule(
+        "quiz_question", user_id, QUIZ_MODES[session.mode].start_delay,
+        session.token,
+    )
+
+
+def fill_questions(user_id: int, session: QuizSession):
+    """Выбор вопросов сессии из текущей версии контента."""
+    # Вопросы берутся из текущей версии контента - закрепляем её
+    session.version = content_registry.version
+    QUIZ_MODES[session.mode].fill(user_id, session)
+
+
+async def send_delayed_question(bot: Bot, user_id: int, token: int):
+    """Отправка первого вопроса по таймеру (см. delayed_sends)."""
+    session = quiz_sessions.get(user_id)
+    if session is None or session.token != token:
+        return
+    await send_question(chat_message(bot, user_id), user_id)
+
+
+delayed_sends.register("quiz_question", send_delayed_question)
+
+
+async def expire_question(bot: Bot, user_id: int, token: int):
+    """
+    Истечение времени на вопрос (режимы с ``time_limit``): вопрос
+    засчитывается как неверный, и сразу показывается следующий.
+    Таймеры всех пользователей обслуживает одна задача delayed_sends.
+    """
+    async with user_locks.hold(user_id):
+        session = quiz_sessions.get(user_id)
+        if session is None or session.deadline_token != token:
+            return
+
+        try:
+            question = current_question(session)
+        except ContentVersionError:
+            # Сессию завершит send_question (см. drop_outdated)
+            question = None
+        if question is not None:
+            mastery.record(user_id, question, False)
+        session.record_response_time(QUIZ_MODES[session.mode].time_limit)
+        session.record_answer(-1, False)
+        quiz_sessions.save(user_id)
+        await send_question(chat_message(bot, user_id), user_id,
+                            notice="⏰ Время на предыдущий вопрос вышло!\n\n")
+
+
+delayed_sends.register("question_deadline", expire_question)
+
+
+async def send_question(message: types.Message, user_id: int,
+                        notice: str = ""):
+    """Отправляет текущий вопрос или итог, если вопросы закончились."""
+    session = quiz_sessions.get(user_id)
+    if session is None:
+        await message.answer("❌ Викторина не активна",
+                             reply_markup=get_main_keyboard())
+        return
+
+    try:
+        question = current_question(session)
+    except ContentVersionError:
+        await drop_outdated(message, user_id)
+        return
+    if question is None:
+        await finish_quiz(message, user_id)
+        return
+
+    mode = QUIZ_MODES[session.mode]
+    await show_question(
+        message,
+        session,
+        notice + mode.question_text(session, question),
+        question,
+    )
+    quiz_sessions.save(user_id)
+
+    if mode.time_limit:
+        # Новый срок заменяет таймер предыдущего вопроса
+        delayed_sends.schedule("question_deadline", user_id,
+                               mode.time_limit, session.deadline_token)
+
+
+async def answer_question(message: types.Message, user_id: int, session,
+                          question, option: int):
+    """
+    Общий путь ответа для всех режимов и способов показа: учёт ответа,
+    переход к следующему вопросу и его отправка.
+    """
+    is_correct = option == question.correct
+    mastery.record(user_id, question, is_correct)
+    answer_stats.record(question, option, session.asked_at)
+    session.record_response_time()
+    session.record_answer(option, is_correct)
+    quiz_sessions.save(user_id)
+    await send_question(message, user_id)
+
+
+async def handle_quiz_answer(message: types.Message, state: FSMContext):
+    """Обработчик ответов текстом (обычная клавиатура)."""
+    # Ответы одного пользователя обрабатываются строго по очереди
+    async with user_locks.hold(message.from_user.id):
+        await _process_quiz_answer(message, state)
+
+
+async def _process_quiz_answer(message: types.Message, state: FSMContext):
+    user_id = message.from_user.id
+    session = quiz_sessions.get(user_id)
+
+    if session is None:
+        await message.answer(
+            "❌ Викторина не активна. Начните заново.",
+            reply_markup=get_main_keyboard()
+        )
+        await state.clear()
+        return
+
+    if message.text == "⏹️ Завершить викторину":
+        await cancel_quiz(message, state)
+        return
+
+    if not session.accepts_reply(message.message_id):
+        # Ответ отправлен до показа текущего вопроса (двойное нажатие)
+        return
+
+    try:
+        question = current_question(session)
+    except ContentVersionError:
+        await drop_outdated(message, user_id)
+        await state.clear()
+        return
+    if question is None:
+        await finish_quiz(message, user_id)
+        return
+
+    # Кнопка даёт точный текст варианта, набранный вручную ответ
+    # сопоставляется с вариантами без учёта регистра и опечаток
+    option = question.match(message.text or "")
+    if option is None:
+        await message.answer(
+            "❌ Пожалуйста, выберите один из предложенных вариантов ответа."
+        )
+        return
+
+    await answer_question(message, user_id, session, question, option)
+
+
+async def finish_quiz(message: types.Message, user_id: int):
+    """Завершает викторину и выводит результаты."""
+    session = quiz_sessions.get(user_id)
+    if session is None:
+        return
+    delayed_sends.cancel("question_deadline", user_id)
+    await close_question(message, session)
+
+    text = await QUIZ_MODES[session.mode].result_text(user_id, session,
+                                                      early=False)
+    await message.answer(
+        text, reply_markup=get_main_keyboard(), parse_mode="Markdown"
+    )
+
+    if user_id in quiz_sessions:
+        del quiz_sessions[user_id]
+
+
+async def cancel_quiz(message: types.Message, state: FSMContext,
+                      user_id: int = None):
+    """Завершает викторину досрочно."""
+    user_id = user_id or message.from_user.id
+    delayed_sends.cancel("quiz_question", user_id)
+    delayed_sends.cancel("question_deadline", user_id)
+
+    session = quiz_sessions.get(user_id)
+    if session is not None:
+        await close_question(message, session)
+        text = await QUIZ_MODES[session.mode].result_text(user_id, session,
+                                                          early=True)
+        await message.answer(
+            text, reply_markup=get_main_keyboard(), parse_mode="Markdown"
+        )
+
+        del quiz_sessions[user_id]
+
+    await state.clear()
@@ -1,4 +1,3 @@
-import asyncio
 import logging
 
 from aiogram import types
@@ -8,42 +7,37 @@ from configurations.keyboards import (
     get_cancel_keyboard,
     get_main_keyboard,
     get_quiz_mode_keyboard,
-    get_quiz_question_keyboard,
 )
-from configurations.quiz_manager import QuizManager, QuizStates
-from data.google_sheets import sheets_manager
-import storage as storage
+from configurations.quiz_manager import QuizStates
+from configurations.quiz_preferences import TRANSPORT_TITLES, quiz_preferences
+from configurations.quiz_session import (
+    MODE_COMPETITIVE,
+    MODE_PRACTICE,
+    QUESTION_TIME_LIMIT,
+    QuizSession,
+)
+from data.async_sheets import async_sheets
+from user_panel.quiz_engine import (
+    QUIZ_MODES,
+    cancel_quiz,
+    fill_questions,
+    quiz_sessions,
+    schedule_first_question,
+    start_quiz,
+)
 
 
 logger = logging.getLogger("bot_logger")
 
 
-quiz_manager = QuizManager(storage.quiz_questions)
-quiz_data = {}
-
-
-def calculate_grade(score, total_questions):
-    """Определяет оценку на основе процента правильных ответов."""
-    percentage = (score / total_questions) * 100
-
-    if percentage >= 90:
-        return "🎉 Отлично!", "🏆"
-    elif percentage >= 75:
-        return "👍 Очень хорошо!", "⭐"
-    elif percentage >= 60:
-        return "🙂 Хорошо!", "✅"
-    elif percentage >= 40:
-        return "😐 Удовлетворительно", "📘"
-    else:
-        return "💪 Попробуйте еще раз!", "📚"
-
-
 async def quiz_button(message: types.Message, state: FSMContext):
     """Обработчик кнопки викторины - показывает выбор режима."""
     await state.set_state(QuizStates.choosing_mode)
     user_id = message.from_user.id
 
-    can_play_competitive = not sheets_manager.is_competitive_completed(user_id)
+    can_play_competitive = not await async_sheets.is_competitive_completed(
+        user_id
+    )
 
     if not can_play_competitive:
         message_text = (
@@ -77,7 +71,24 @@ async def quiz_button(message: types.Message, state: FSMContext):
         )
 
     await message.answer(
-        message_text, reply_markup=get_quiz_mode_keyboard(can_play_competitive)
+        message_text,
+        reply_markup=get_quiz_mode_keyboard(
+            can_play_competitive, quiz_preferences.get_transport(user_id)
+        ),
+    )
+
+
+async def toggle_quiz_transport(message: types.Message, state: FSMContext):
+    """Переключает способ ответа: обычные кнопки или кнопки в сообщении."""
+    user_id = message.from_user.id
+    transport = quiz_preferences.toggle_transport(user_id)
+
+    can_play_competitive = not await async_sheets.is_competitive_completed(
+        user_id
+    )
+    await message.answer(
+        f"✅ Способ ответа: {TRANSPORT_TITLES[transport]}",
+        reply_markup=get_quiz_mode_keyboard(can_play_competitive, transport),
     )
 
 
@@ -86,34 +97,28 @@ async def start_practice_mode(message: types.Message, state: FSMContext):
     await state.set_state(QuizStates.in_practice_quiz)
     user_id = message.from_user.id
 
-    random_questions = quiz_manager.get_random_questions(5)
-
-    quiz_data[user_id] = {
-        "current_question": 0,
-        "score": 0,
-        "total_questions": 5,
-        "questions": random_questions,
-        "mode": "practice",
-    }
+    start_quiz(
+        user_id,
+        QuizSession(
+            MODE_PRACTICE, transport=quiz_preferences.get_transport(user_id)
+        ),
+    )
 
     await message.answer(
         "🎯 *Начался пробный режим!*\n"
-        "• 5 случайных вопросов\n"
+        f"• {QUIZ_MODES[MODE_PRACTICE].count} случайных вопросов\n"
         "• Можно проходить много раз\n"
         "• Удачи! 🍀",
         parse_mode="Markdown",
     )
 
-    await asyncio.sleep(1.5)
-    await send_question(message, user_id)
-
 
 async def start_competitive_mode(message: types.Message, state: FSMContext):
     """Запускает соревновательный режим викторины."""
     user_id = message.from_user.id
     logger.info(f"Пользователь {user_id} запустил соревновательный режим.")
 
-    if sheets_manager.is_competitive_completed(user_id):
+    if await async_sheets.is_competitive_completed(user_id):
         await message.answer(
             "❌ Вы уже прошли соревновательный режим!\n"
             "Этот режим можно пройти только один раз.",
@@ -122,13 +127,12 @@ async def start_competitive_mode(message: types.Message, state: FSMContext):
         await state.clear()
         return
 
-    quiz_data[user_id] = {
-        "current_question": 0,
-        "score": 0,
-        "total_questions": 10,
-        "questions": [],
-        "mode": "competitive",
-    }
+    session = QuizSession(
+        MODE_COMPETITIVE,
+        transport=quiz_preferences.get_transport(user_id, polls=False),
+    )
+    session.profile = ("", "", "")
+    quiz_sessions[user_id] = session
 
     await state.set_state(QuizStates.waiting_for_first_name)
 
@@ -145,7 +149,7 @@ async def process_first_name(message: types.Message, state: FSMContext):
     """Обрабатывает ввод имени пользователя."""
     user_id = message.from_user.id
 
-    if user_id not in quiz_data:
+    if user_id not in quiz_sessions:
         await message.answer(
             "❌ Произошла ошибка. Начните викторину заново.",
             reply_markup=get_main_keyboard(),
@@ -159,7 +163,9 @@ async def process_first_name(message: types.Message, state: FSMContext):
 
     first_name = message.text.strip()
 
-    quiz_data[user_id]["first_name"] = first_name
+    session = quiz_sessions[user_id]
+    session.profile = (first_name,) + session.profile[1:]
+    quiz_sessions.save(user_id)
 
     await state.set_state(QuizStates.waiting_for_last_name)
 
@@ -174,7 +180,7 @@ async def process_last_name(message: types.Message, state: FSMContext):
     """Обрабатывает ввод фамилии пользователя."""
     user_id = message.from_user.id
 
-    if user_id not in quiz_data:
+    if user_id not in quiz_sessions:
         await message.answer(
             "❌ Произошла ошибка. Начните викторину заново.",
             reply_markup=get_main_keyboard(),
@@ -188,7 +194,9 @@ async def process_last_name(message: types.Message, state: FSMContext):
 
     last_name = message.text.strip()
 
-    quiz_data[user_id]["last_name"] = last_name
+    session = quiz_sessions[user_id]
+    session.profile = (session.profile[0], last_name, session.profile[2])
+    quiz_sessions.save(user_id)
     await state.set_state(QuizStates.waiting_for_educational_info)
 
     await message.answer(
@@ -203,7 +211,7 @@ async def process_educational_info(message: types.Message, state: FSMContext):
     """Обрабатывает ввод информации об учебном заведении."""
     user_id = message.from_user.id
 
-    if user_id not in quiz_data:
+    if user_id not in quiz_sessions:
         await message.answer(
             "❌ Произошла ошибка. Начните викторину заново.",
             reply_markup=get_main_keyboard(),
@@ -217,222 +225,31 @@ async def process_educational_info(message: types.Message, state: FSMContext):
 
     educational_institution = message.text.strip()
 
-    quiz_data[user_id]["educational_institution"] = educational_institution
-    quiz_data[user_id]["questions"] = quiz_manager.get_random_questions(10)
+    session = quiz_sessions[user_id]
+    session.profile = session.profile[:2] + (educational_institution,)
+    fill_questions(user_id, session)
+    quiz_sessions.save(user_id)
 
     await state.set_state(QuizStates.in_competitive_quiz)
 
     await message.answer(
         "✅ *Вся информация сохранена!*\n\n"
         "🏆 *Начался соревновательный режим!*\n"
-        "• 10 вопросов\n"
+        f"• {session.total_questions} вопросов\n"
         "• Только одна попытка\n"
+        f"• {QUESTION_TIME_LIMIT} секунд на каждый вопрос\n"
         "• Результат будет сохранен.\n"
         "• Удачи! 🍀",
         parse_mode="Markdown",
     )
-    await asyncio.sleep(2)
-    await send_question(message, user_id)
-
-
-async def send_question(message: types.Message, user_id: int):
-    """Отправляет вопрос пользователю."""
-    current_question_idx = quiz_data[user_id]["current_question"]
-    questions_list = quiz_data[user_id]["questions"]
-    mode = quiz_data[user_id]["mode"]
-
-    if current_question_idx >= len(questions_list):
-        await finish_quiz(message, user_id)
-        return
-
-    question_data = quiz_manager.get_question(questions_list,
-                                              current_question_idx)
-
-    # Проверка на None
-    if question_data is None:
-        await message.answer(
-            "❌ Произошла ошибка при получении вопроса. Викторина завершена.",
-            reply_markup=get_main_keyboard(),
-        )
-        if user_id in quiz_data:
-            del quiz_data[user_id]
-        return
-
-    keyboard = get_quiz_question_keyboard(question_data["options"])
-
-    total_questions = 10 if mode == "competitive" else 5
-
-    await message.answer(
-        f"❓ *Вопрос {current_question_idx + 1}/{total_questions}*\n\n"
-        f"{question_data['question']}",
-        reply_markup=keyboard,
-        parse_mode="Markdown",
-    )
-
-
-async def handle_quiz_answer(message: types.Message, state: FSMContext):
-    """Обработчик ответов на вопросы викторины."""
-    user_id = message.from_user.id
-
-    if user_id not in quiz_data:
-        await message.answer(
-            "❌ Викторина не активна. Начните заново.",
-            reply_markup=get_main_keyboard()
-        )
-        await state.clear()
-        return
-
-    if message.text == "⏹️ Завершить викторину":
-        await cancel_quiz(message, state)
-        return
-
-    current_question_idx = quiz_data[user_id]["current_question"]
-    questions_list = quiz_data[user_id]["questions"]
-
-    question_data = quiz_manager.get_question(questions_list,
-                                              current_question_idx)
-
-    if message.text not in question_data["options"]:
-        await message.answer(
-            "❌ Пожалуйста, выберите один из предложенных вариантов ответа."
-        )
-        return
+    schedule_first_question(user_id, session)
 
-    is_correct = quiz_manager.check_answer(question_data, message.text)
-    if is_correct:
-        quiz_data[user_id]["score"] += 1
 
-    quiz_data[user_id]["current_question"] += 1
-    await send_question(message, user_id)
-
-
-async def cancel_quiz(message: types.Message, state: FSMContext):
-    """Завершает викторину досрочно."""
-    user_id = message.from_user.id
-
-    if user_id in quiz_data:
-        score = quiz_data[user_id]["score"]
-        current = quiz_data[user_id]["current_question"]
-        mode = quiz_data[user_id]["mode"]
-
-        if mode == "competitive":
-            user_data = quiz_data[user_id]
-            success = sheets_manager.save_competitive_result(
-                {
-                    "chat_id": user_id,
-                    "first_name": user_data.get("first_name", ""),
-                    "last_name": user_data.get("last_name", ""),
-                    "educational_institution": user_data.get(
-                        "educational_institution", "Не указано"
-                    ),
-                    "correct_answers": score,
-                    "total_questions": current,
-                }
-            )
-
-            if success:
-                await message.answer(
-                    f"🏆 *Соревновательный режим завершен досрочно!*\n\n"
-                    f"📊 *Ваш результат:*\n"
-                    f"• Правильных ответов: {score}/{current}\n\n"
-                    f"✅ *Результат сохранен в Google Таблицу!*\n"
-                    f"Больше нельзя пройти этот режим.",
-                    reply_markup=get_main_keyboard(),
-                    parse_mode="Markdown",
-                )
-            else:
-                await message.answer(
-                    f"🏆 *Соревновательный режим завершен досрочно!*\n\n"
-                    f"📊 *Ваш результат:*\n"
-                    f"• Правильных ответов: {score}/{current}\n\n"
-                    f"❌ *Ошибка сохранения результата*\n"
-                    f"Обратитесь к администратору.",
-                    reply_markup=get_main_keyboard(),
-                    parse_mode="Markdown",
-                )
-        else:
-            await message.answer(
-                f"🎯 *Пробный режим завершен досрочно!*\n\n"
-                f"📊 *Ваш результат:*\n"
-                f"• Правильных ответов: {score}/{current}",
-                reply_markup=get_main_keyboard(),
-                parse_mode="Markdown",
-            )
-
-        del quiz_data[user_id]
-
-    await state.clear()
-
-
-async def finish_quiz(message: types.Message, user_id: int):
-    """Завершает викторину и выводит результаты."""
-    score = quiz_data[user_id]["score"]
-    total = quiz_data[user_id]["total_questions"]
-    mode = quiz_data[user_id]["mode"]
-
-    percentage = (score / total) * 100
-    grade, emoji = calculate_grade(score, total)
-
-    if mode == "competitive":
-        user_data = quiz_data[user_id]
-        success = sheets_manager.save_competitive_result(
-            {
-                "chat_id": user_id,
-                "first_name": user_data.get("first_name", ""),
-                "last_name": user_data.get("last_name", ""),
-                "educational_institution": user_data.get(
-                    "educational_institution", "Не указано"
-                ),
-                "correct_answers": score,
-                "total_questions": total,
-            }
-        )
-
-        if success:
-            result_text = (
-                f"{emoji} *Соревновательный режим завершен!* {emoji}\n\n"
-                f"📊 *Ваш результат:*\n"
-                f"• Правильных ответов: {score}/{total}\n"
-                f"• Процент: {percentage:.1f}%\n"
-                f"• Оценка: {grade}\n"
-                "• Учебное заведение:"
-                f"{user_data.get('educational_institution', 'Не указано')}\n\n"
-                f"✅ *Результат сохранен!*\n"
-                f"Спасибо за участие! 🎯"
-            )
-        else:
-            result_text = (
-                f"{emoji} *Соревновательный режим завершен!* {emoji}\n\n"
-                f"📊 *Ваш результат:*\n"
-                f"• Правильных ответов: {score}/{total}\n"
-                f"• Процент: {percentage:.1f}%\n"
-                f"• Оценка: {grade}\n\n"
-                f"❌ *Ошибка сохранения результата*\n"
-                f"Обратитесь к администратору."
-            )
-    else:
-        result_text = (
-            f"{emoji} *Пробный режим завершен!* {emoji}\n\n"
-            f"📊 *Ваш результат:*\n"
-            f"• Правильных ответов: {score}/{total}\n"
-            f"• Процент: {percentage:.1f}%\n"
-            f"• Оценка: {grade}\n\n"
-            f"🔄 Можете попробовать еще раз!"
-        )
-
-    await message.answer(
-        result_text, reply_markup=get_main_keyboard(), parse_mode="Markdown"
-    )
-
-    if user_id in quiz_data:
-        del quiz_data[user_id]
-
-
-def get_competitive_stats():
+async def get_competitive_stats():
     """Возвращает статистику по соревновательному режиму."""
     try:
-        stats = sheets_manager.get_statistics()
-        results = sheets_manager.get_all_results()
+        stats = await async_sheets.get_statistics()
+        results = await async_sheets.get_all_results()
 
         return {
             "total_participants": stats["total_participants"],
@@ -452,14 +269,5 @@ def get_competitive_stats():
 
 
 def cleanup_quiz_data():
-    """Очищает данные викторины ."""
-    expired_users = []
-
-    for user_id, data in quiz_data.items():
-        # Логика очистки старых данных
-        pass
-
-    for user_id in expired_users:
-        del quiz_data[user_id]
-
-    return len(expired_users)
+    """Очищает данные неактивных викторин."""
+    return quiz_sessions.evict_expired()
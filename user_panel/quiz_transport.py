@@ -0,0 +1,128 @@
+import logging
+import time
+from datetime import datetime
+
+from aiogram import Bot, types
+from aiogram.exceptions import TelegramBadRequest
+
+from configurations.keyboards import (
+    get_inline_question_keyboard,
+    get_quiz_cancel_keyboard,
+    get_quiz_question_keyboard,
+)
+from configurations.quiz_session import (
+    TRANSPORT_INLINE,
+    TRANSPORT_POLL,
+    PollTicket,
+)
+from configurations.session_store import SessionStore
+from data.session_db import session_db
+
+
+logger = logging.getLogger("bot_logger")
+
+# Отправленные опросы-викторины: poll_id -> PollTicket.
+# Неотвеченные опросы удаляются по тому же TTL, что и сессии.
+poll_index = SessionStore(
+    "quiz_polls", database=session_db, serializer=PollTicket
+)
+
+
+def chat_message(bot: Bot, chat_id: int):
+    """
+    Сообщение-заглушка для ответа в личный чат.
+
+    Используется там, где обработчик получает не сообщение, а другое
+    обновление (poll_answer), чтобы переиспользовать функции викторины,
+    работающие через ``message.answer``.
+    """
+    return types.Message(
+        message_id=0,
+        date=datetime.now(),
+        chat=types.Chat(id=chat_id, type="private"),
+    ).as_(bot)
+
+
+async def send_quiz_poll(message: types.Message, session, question):
+    """Отправляет вопрос нативным опросом-викториной Telegram."""
+    poll = await message.bot.send_poll(
+        chat_id=message.chat.id,
+        question=(
+            f"{session.cursor + 1}/{session.total_questions}. "
+            f"{question.text}"
+        ),
+        options=list(question.display_options(session.current_shuffle)),
+        type="quiz",
+        correct_option_id=question.position_of(
+            session.current_shuffle, question.correct
+        ),
+        is_anonymous=False,
+        # Кнопка завершения нужна только один раз - клавиатура остаётся
+        reply_markup=get_quiz_cancel_keyboard() if session.cursor == 0
+        else None,
+    )
+    poll_index[poll.poll.id] = PollTicket(
+        message.chat.id, session.token, session.cursor
+    )
+    session.message_id = poll.message_id
+
+
+async def show_question(message: types.Message, session, text, question):
+    """
+    Показывает вопрос способом, выбранным в сессии.
+
+    В режиме TRANSPORT_INLINE первый вопрос отправляется новым сообщением,
+    а следующие редактируют его на месте. Номер сообщения с вопросом
+    запоминается в сессии, поэтому после вызова сессию нужно сохранить.
+    В режиме TRANSPORT_POLL текст ``text`` не используется - опрос
+    строится из самого вопроса.
+    """
+    session.asked_at = time.monotonic()
+    if session.transport == TRANSPORT_POLL:
+        await send_quiz_poll(message, session, question)
+        return
+
+    if session.transport != TRANSPORT_INLINE:
+        sent = await message.answer(
+            text,
+            reply_markup=get_quiz_question_keyboard(
+                question, session.current_shuffle
+            ),
+            parse_mode="Markdown",
+        )
+        session.message_id = sent.message_id
+        return
+
+    keyboard = get_inline_question_keyboard(question,
+                                            session.current_shuffle)
+    if session.message_id:
+        try:
+            await message.bot.edit_message_text(
+                text=text,
+                chat_id=message.chat.id,
+                message_id=session.message_id,
+                reply_markup=keyboard,
+                parse_mode="Markdown",
+            )
+            return
+        except TelegramBadRequest as e:
+            # Сообщение удалено или слишком старое - отправляем новое
+            logger.warning(f"⚠️ Не удалось изменить вопрос: {e}")
+
+    sent = await message.answer(text, reply_markup=keyboard,
+                                parse_mode="Markdown")
+    session.message_id = sent.message_id
+
+
+async def close_question(message: types.Message, session):
+    """Убирает кнопки ответа с сообщения вопроса (TRANSPORT_INLINE)."""
+    if session.transport != TRANSPORT_INLINE or not session.message_id:
+        return
+    try:
+        await message.bot.edit_message_reply_markup(
+            chat_id=message.chat.id,
+            message_id=session.message_id,
+            reply_markup=None,
+        )
+    except TelegramBadRequest as e:
+        logger.warning(f"⚠️ Не удалось убрать кнопки вопроса: {e}")